@@ -1,9 +1,79 @@
-from app_doctor.models import DoctorDateTimeModel
+from rest_framework import serializers
 
-from utils.serializers import CustomModelSerializer
+from django.conf import settings
+
+from app_doctor.models import DoctorModel, DoctorDateTimeModel
+from app_doctor.services import generate_slots, parse_jalali_date
+
+from utils.serializers import CustomModelSerializer, CustomSerializer
+from utils.base_errors import BaseErrors
 
 
 class AdminDoctorDateTimeModelSerializer(CustomModelSerializer):
     class Meta:
         model = DoctorDateTimeModel
         fields = ("id", "doctor", "date", "is_active", "time")
+        # slot uniqueness is enforced by the database constraint (409 on conflict)
+        validators = []
+
+
+class AdminDoctorDateTimeBulkUpdateSerializer(CustomSerializer):
+    is_active = serializers.BooleanField()
+
+
+class AdminSchedulePatternSerializer(CustomSerializer):
+    # Jalali week days: 0 is Saturday, 6 is Friday
+    weekdays = serializers.ListField(
+        child=serializers.IntegerField(min_value=0, max_value=6), min_length=1
+    )
+    start_time = serializers.TimeField()
+    end_time = serializers.TimeField()
+    slot_minutes = serializers.IntegerField(min_value=5, max_value=480)
+
+    def validate(self, attrs):
+        if attrs["end_time"] <= attrs["start_time"]:
+            raise serializers.ValidationError(
+                {"end_time": BaseErrors.end_time_before_start_time}
+            )
+        return attrs
+
+
+class AdminDoctorScheduleSerializer(CustomSerializer):
+    doctor = serializers.PrimaryKeyRelatedField(queryset=DoctorModel.objects.all())
+    date_from = serializers.DateField()
+    date_to = serializers.DateField()
+    patterns = AdminSchedulePatternSerializer(many=True, allow_empty=False)
+    # extra Jalali (YYYY/MM/DD) dates without slots, e.g. lunar calendar holidays
+    holidays = serializers.ListField(child=serializers.CharField(), required=False)
+    skip_official_holidays = serializers.BooleanField(default=True)
+    is_active = serializers.BooleanField(default=True)
+
+    def validate_holidays(self, value):
+        try:
+            return [parse_jalali_date(holiday) for holiday in value]
+        except ValueError:
+            raise serializers.ValidationError(BaseErrors.invalid_jalali_date)
+
+    def validate(self, attrs):
+        days = (attrs["date_to"] - attrs["date_from"]).days
+        if days < 0:
+            raise serializers.ValidationError(
+                {"date_to": BaseErrors.date_to_before_date_from}
+            )
+        if days >= settings.SCHEDULE_MAX_DAYS:
+            raise serializers.ValidationError(
+                {
+                    "date_to": BaseErrors.change_error_variable(
+                        "calendar_range_too_long", max_days=settings.SCHEDULE_MAX_DAYS
+                    )
+                }
+            )
+        return generate_slots(
+            attrs["doctor"].id,
+            attrs["date_from"],
+            attrs["date_to"],
+            attrs["patterns"],
+            holidays=attrs.get("holidays", ()),
+            skip_official_holidays=attrs["skip_official_holidays"],
+            is_active=attrs["is_active"],
+        )
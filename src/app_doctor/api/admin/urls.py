@@ -26,4 +26,14 @@ urlpatterns = [
         AdminDoctorDateTimesUpdateDeleteAPIView.as_view(),
         name="update_delete_doctor_datetime",
     ),
+    path(
+        "datetime/bulk-update-delete/",
+        AdminDoctorDateTimesBulkUpdateDeleteAPIView.as_view(),
+        name="bulk_update_delete_doctor_datetime",
+    ),
+    path(
+        "datetime/generate/",
+        AdminDoctorDateTimesGenerateAPIView.as_view(),
+        name="generate_doctor_datetime",
+    ),
 ]
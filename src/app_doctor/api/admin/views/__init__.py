@@ -2,4 +2,6 @@ from .doctor import AdminDoctorListCreateAPIView, AdminDoctorUpdateDeleteAPIView
 from .datetimes import (
     AdminDoctorDateTimesListCreateAPIView,
     AdminDoctorDateTimesUpdateDeleteAPIView,
+    AdminDoctorDateTimesBulkUpdateDeleteAPIView,
+    AdminDoctorDateTimesGenerateAPIView,
 )
@@ -1,8 +1,11 @@
 from app_doctor.api.admin.serializers.datetimes import (
     AdminDoctorDateTimeModelSerializer,
+    AdminDoctorDateTimeBulkUpdateSerializer,
+    AdminDoctorScheduleSerializer,
 )
 from app_doctor.models import DoctorDateTimeModel
 from app_doctor.filters.datetimes import DoctorsListFilter
+from app_doctor.services import set_slots_active
 
 from utils.views import generics
 from utils.views.versioning import BaseVersioning
@@ -15,6 +18,7 @@ class AdminDoctorDateTimesListCreateAPIView(generics.CustomListCreateAPIView):
     serializer_class = AdminDoctorDateTimeModelSerializer
     queryset = DoctorDateTimeModel.objects.all().order_by("date", "time")
     filterset_class = DoctorsListFilter
+    query_budget = 3
 
 
 class AdminDoctorDateTimesUpdateDeleteAPIView(generics.CustomUpdateDestroyAPIView):
@@ -23,3 +27,22 @@ class AdminDoctorDateTimesUpdateDeleteAPIView(generics.CustomUpdateDestroyAPIVie
     serializer_class = AdminDoctorDateTimeModelSerializer
     queryset = DoctorDateTimeModel.objects.all()
     object_name = "Doctor Datetime"
+
+
+class AdminDoctorDateTimesBulkUpdateDeleteAPIView(
+    generics.CustomBulkUpdateDestroyAPIView
+):
+    permission_classes = [IsAuthenticatedPermission, IsAdminUserPermission]
+    versioning = BaseVersioning
+    serializer_class = AdminDoctorDateTimeBulkUpdateSerializer
+    queryset = DoctorDateTimeModel.objects.all()
+    filterset_class = DoctorsListFilter
+
+    def perform_bulk_update(self, queryset, validated_data):
+        return set_slots_active(queryset, validated_data["is_active"])
+
+
+class AdminDoctorDateTimesGenerateAPIView(generics.CustomGenericPostAPIView):
+    permission_classes = [IsAuthenticatedPermission, IsAdminUserPermission]
+    versioning = BaseVersioning
+    serializer_class = AdminDoctorScheduleSerializer
@@ -14,6 +14,7 @@ class AdminDoctorListCreateAPIView(generics.CustomListCreateAPIView):
     serializer_class = AdminDoctorSerializer
     queryset = DoctorModel.objects.all()
     search_fields = ["name", "phone", "national_code", "field"]
+    query_budget = 4
 
 
 class AdminDoctorUpdateDeleteAPIView(generics.CustomUpdateDestroyAPIView):
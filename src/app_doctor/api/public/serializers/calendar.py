@@ -0,0 +1,28 @@
+from rest_framework import serializers
+
+from django.conf import settings
+
+from utils.serializers import CustomSerializer
+from utils.base_errors import BaseErrors
+
+
+class UsersDoctorCalendarQuerySerializer(CustomSerializer):
+    date_from = serializers.DateField()
+    date_to = serializers.DateField()
+    doctor = serializers.ListField(child=serializers.IntegerField(), required=False)
+
+    def validate(self, attrs):
+        days = (attrs["date_to"] - attrs["date_from"]).days
+        if days < 0:
+            raise serializers.ValidationError(
+                {"date_to": BaseErrors.date_to_before_date_from}
+            )
+        if days >= settings.CALENDAR_MAX_DAYS:
+            raise serializers.ValidationError(
+                {
+                    "date_to": BaseErrors.change_error_variable(
+                        "calendar_range_too_long", max_days=settings.CALENDAR_MAX_DAYS
+                    )
+                }
+            )
+        return attrs
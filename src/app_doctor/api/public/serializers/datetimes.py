@@ -3,9 +3,9 @@ from rest_framework import serializers
 from django.utils.timezone import make_aware
 
 from app_doctor.models import DoctorDateTimeModel
-from app_reservation.models import ReservationModel
+from app_doctor.services import is_slot_reserved
 
-from utils.serializers import CustomModelSerializer
+from utils.serializers import CustomModelSerializer, ValuesSerializer
 
 from datetime import datetime, timedelta
 import jdatetime
@@ -19,7 +19,18 @@ class UsersDoctorDateTimeModelSerializer(CustomModelSerializer):
         fields = ("id", "doctor", "date", "time", "is_active")
 
     def get_is_active(self, obj):
-        reservations_exist = ReservationModel.objects.filter(
-            doctor=obj.doctor, date=obj.date, time=obj.time
-        ).exists()
-        return not reservations_exist
+        return not is_slot_reserved(obj)
+
+
+class UsersDoctorDateTimeValuesSerializer(ValuesSerializer):
+    """
+    Needs a queryset annotated by `annotate_is_reserved`.
+    """
+
+    class Meta:
+        model = DoctorDateTimeModel
+        fields = ("id", "doctor", "date", "time", "is_active")
+        sources = {"is_active": "is_reserved"}
+
+    def get_is_active(self, row):
+        return not row["is_reserved"]
@@ -1,6 +1,6 @@
 from app_doctor.models import DoctorModel
 
-from utils.serializers import CustomModelSerializer
+from utils.serializers import CustomModelSerializer, ValuesSerializer
 
 
 class UsersDoctorSerializer(CustomModelSerializer):
@@ -11,3 +11,13 @@ class UsersDoctorSerializer(CustomModelSerializer):
             "name",
             "field",
         )
+
+
+class UsersDoctorValuesSerializer(ValuesSerializer):
+    class Meta:
+        model = DoctorModel
+        fields = (
+            "id",
+            "name",
+            "field",
+        )
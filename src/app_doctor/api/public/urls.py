@@ -16,4 +16,10 @@ urlpatterns = [
         UsersDoctorDateTimesListAPIView.as_view(),
         name="list_doctor_datetime",
     ),
+    # calendar
+    path(
+        "calendar/",
+        UsersDoctorCalendarAPIView.as_view(),
+        name="doctor_calendar",
+    ),
 ]
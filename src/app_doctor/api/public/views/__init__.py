@@ -1,2 +1,3 @@
 from .doctor import UsersDoctorListAPIView
 from .datetimes import UsersDoctorDateTimesListAPIView
+from .calendar import UsersDoctorCalendarAPIView
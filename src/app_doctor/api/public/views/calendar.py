@@ -0,0 +1,28 @@
+from rest_framework import response
+
+from app_doctor.api.public.serializers.calendar import (
+    UsersDoctorCalendarQuerySerializer,
+)
+from app_doctor.services import get_calendar
+
+from utils.views import generics
+from utils.views.versioning import BaseVersioning
+from utils.views.permissions import AllowAnyPermission
+
+
+class UsersDoctorCalendarAPIView(generics.CustomGenericAPIView):
+    permission_classes = [AllowAnyPermission]
+    versioning = BaseVersioning
+    serializer_class = UsersDoctorCalendarQuerySerializer
+    query_budget = 2
+
+    def get(self, request, *args, **kwargs):
+        ser = self.get_serializer(data=request.query_params)
+        ser.is_valid(raise_exception=True)
+        return response.Response(
+            get_calendar(
+                ser.validated_data["date_from"],
+                ser.validated_data["date_to"],
+                ser.validated_data.get("doctor"),
+            )
+        )
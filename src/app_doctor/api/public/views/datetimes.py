@@ -1,19 +1,54 @@
+from django.db.models import Exists, OuterRef
+
 from app_doctor.api.public.serializers.datetimes import (
     UsersDoctorDateTimeModelSerializer,
+    UsersDoctorDateTimeValuesSerializer,
 )
 from app_doctor.models import DoctorDateTimeModel
 from app_doctor.filters.datetimes import DoctorsListFilter
+from app_doctor.services import annotate_is_reserved, doctor_slots_namespaces
+from app_reservation.models import ReservationModel
 
 from utils.views import generics
 from utils.views.versioning import BaseVersioning
 from utils.views.permissions import AllowAnyPermission
 
 
-class UsersDoctorDateTimesListAPIView(generics.CustomListAPIView):
+class UsersDoctorDateTimesListAPIView(
+    generics.ResponseCacheMixin,
+    generics.ConditionalGetMixin,
+    generics.ValuesListMixin,
+    generics.CustomListAPIView,
+):
     permission_classes = [AllowAnyPermission]
     versioning = BaseVersioning
     serializer_class = UsersDoctorDateTimeModelSerializer
-    queryset = DoctorDateTimeModel.objects.filter(is_active=True).order_by(
-        "date", "time"
-    )
+    values_serializer_class = UsersDoctorDateTimeValuesSerializer
+    queryset = annotate_is_reserved(
+        DoctorDateTimeModel.objects.filter(is_active=True)
+    ).order_by("date", "time")
     filterset_class = DoctorsListFilter
+    query_budget = 4
+    # slots flip to taken as soon as they are booked, keep shared copies short lived
+    cache_control = {"public": True, "max_age": 15}
+    response_cache_ttl = 300
+
+    def get_response_cache_namespaces(self):
+        # listings of a single doctor survive bookings of other doctors
+        doctors = self.request.query_params.getlist("doctor")
+        if len(doctors) == 1 and doctors[0].isdigit():
+            return doctor_slots_namespaces(int(doctors[0]))[1:]
+        return doctor_slots_namespaces()
+
+    def get_conditional_querysets(self, queryset):
+        # `is_active` of a slot depends on its reservations
+        reservations = ReservationModel.objects.filter(
+            Exists(
+                queryset.filter(
+                    doctor=OuterRef("doctor"),
+                    date=OuterRef("date"),
+                    time=OuterRef("time"),
+                )
+            )
+        )
+        return [queryset, reservations]
@@ -1,14 +1,28 @@
-from app_doctor.api.public.serializers.doctor import UsersDoctorSerializer
+from app_doctor.api.public.serializers.doctor import (
+    UsersDoctorSerializer,
+    UsersDoctorValuesSerializer,
+)
 from app_doctor.models import DoctorModel
+from app_doctor.services import DOCTORS_NAMESPACE
 
 from utils.views import generics
 from utils.views.versioning import BaseVersioning
 from utils.views.permissions import AllowAnyPermission
 
 
-class UsersDoctorListAPIView(generics.CustomListAPIView):
+class UsersDoctorListAPIView(
+    generics.ResponseCacheMixin,
+    generics.ConditionalGetMixin,
+    generics.ValuesListMixin,
+    generics.CustomListAPIView,
+):
     permission_classes = [AllowAnyPermission]
     versioning = BaseVersioning
     serializer_class = UsersDoctorSerializer
+    values_serializer_class = UsersDoctorValuesSerializer
     queryset = DoctorModel.objects.all()
     search_fields = ["name", "field"]
+    query_budget = 3
+    cache_control = {"public": True, "max_age": 300}
+    response_cache_ttl = 3600
+    response_cache_namespaces = (DOCTORS_NAMESPACE,)
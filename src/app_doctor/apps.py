@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class AppDoctorConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "app_doctor"
+
+    def ready(self):
+        import app_doctor.signals.availability
+        import app_doctor.signals.cache
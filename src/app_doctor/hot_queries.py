@@ -0,0 +1,35 @@
+from app_doctor.api.admin.views import AdminDoctorDateTimesListCreateAPIView
+from app_doctor.api.public.views import (
+    UsersDoctorListAPIView,
+    UsersDoctorDateTimesListAPIView,
+)
+from app_doctor.services import calendar_rows
+
+from utils.db.hot_queries import register_hot_query
+
+from datetime import date, timedelta
+
+
+@register_hot_query("public doctor list")
+def public_doctor_list():
+    return UsersDoctorListAPIView.queryset.all()
+
+
+@register_hot_query("public slot list by doctor and date")
+def public_slot_list():
+    return UsersDoctorDateTimesListAPIView.queryset.filter(doctor=1, date=date.today())
+
+
+@register_hot_query("public slot list by date")
+def public_slot_list_by_date():
+    return UsersDoctorDateTimesListAPIView.queryset.filter(date=date.today())
+
+
+@register_hot_query("admin slot list")
+def admin_slot_list():
+    return AdminDoctorDateTimesListCreateAPIView.queryset.all()
+
+
+@register_hot_query("public calendar by date range")
+def public_calendar():
+    return calendar_rows(date.today(), date.today() + timedelta(days=30))
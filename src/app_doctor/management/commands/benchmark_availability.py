@@ -0,0 +1,104 @@
+from django.core.management.base import BaseCommand
+
+from app_doctor.api.public.serializers.datetimes import (
+    UsersDoctorDateTimeModelSerializer,
+)
+from app_doctor.models import DoctorModel, DoctorDateTimeModel
+from app_doctor.services import annotate_is_reserved, get_reserved_slot_keys
+from app_reservation.models import ReservationModel
+
+from utils.benchmark import isolated_database, measure
+
+from datetime import date, time, timedelta
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark slot availability resolution (per-row EXISTS vs annotated "
+        "subquery vs bulk lookup) on a throwaway database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            default="10,1000,50000",
+            help="Comma separated number of slots to benchmark.",
+        )
+        parser.add_argument("--doctors", type=int, default=10)
+        parser.add_argument(
+            "--legacy-limit",
+            type=int,
+            default=5000,
+            help="Skip the per-row (N+1) measurement above this many slots.",
+        )
+
+    def handle(self, *args, **options):
+        sizes = [int(size) for size in options["sizes"].split(",")]
+        for size in sizes:
+            with isolated_database():
+                self._seed(size, options["doctors"])
+                queryset = DoctorDateTimeModel.objects.order_by("date", "time")
+                if size <= options["legacy_limit"]:
+                    self._report(size, "per-row", measure(self._legacy, queryset.all()))
+                self._report(
+                    size,
+                    "annotated",
+                    measure(self._serialize, annotate_is_reserved(queryset.all())),
+                )
+                slots = list(queryset.all())
+                self._report(
+                    size, "bulk-lookup", measure(get_reserved_slot_keys, slots)
+                )
+
+    def _seed(self, size, doctors_count):
+        doctors = DoctorModel.objects.bulk_create(
+            DoctorModel(
+                name=f"Doctor {index}",
+                phone="09120000000",
+                national_code="0000000000",
+                address="-",
+                field="General",
+            )
+            for index in range(doctors_count)
+        )
+        slots = []
+        reservations = []
+        for index in range(size):
+            doctor = doctors[index % doctors_count]
+            slot_number = index // doctors_count
+            slot_date = date(2024, 1, 1) + timedelta(days=slot_number // 24)
+            slot_time = time(slot_number % 24)
+            slots.append(
+                DoctorDateTimeModel(doctor=doctor, date=slot_date, time=slot_time)
+            )
+            if index % 2:
+                reservations.append(
+                    ReservationModel(
+                        doctor=doctor,
+                        date=slot_date,
+                        time=slot_time,
+                        full_name="Benchmark",
+                        mobile_number="09120000000",
+                    )
+                )
+        DoctorDateTimeModel.objects.bulk_create(slots, batch_size=1000)
+        ReservationModel.objects.bulk_create(reservations, batch_size=1000)
+
+    @staticmethod
+    def _legacy(queryset):
+        return [
+            not ReservationModel.objects.filter(
+                doctor=slot.doctor, date=slot.date, time=slot.time
+            ).exists()
+            for slot in queryset
+        ]
+
+    @staticmethod
+    def _serialize(queryset):
+        return UsersDoctorDateTimeModelSerializer(queryset, many=True).data
+
+    def _report(self, size, mode, result):
+        self.stdout.write(
+            f"{size:>8} slots | {mode:<12} | {result['queries']:>7} queries | "
+            f"{result['seconds'] * 1000:>10.2f} ms"
+        )
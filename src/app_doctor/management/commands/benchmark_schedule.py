@@ -0,0 +1,108 @@
+from django.core.management.base import BaseCommand
+
+from app_doctor.models import DoctorModel, DoctorDateTimeModel
+from app_doctor.services import expand_schedule, generate_slots
+
+from utils.benchmark import isolated_database, measure
+
+from datetime import date, time, timedelta
+import math
+
+# 08:00 - 20:00 in 15 minute slots, every day of the week
+PATTERNS = [
+    {
+        "weekdays": list(range(7)),
+        "start_time": time(8),
+        "end_time": time(20),
+        "slot_minutes": 15,
+    }
+]
+SLOTS_PER_DAY = 48
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark generating doctor slots from a schedule template (one INSERT "
+        "per slot vs batched bulk inserts) on a throwaway database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--slots", type=int, default=100000)
+        parser.add_argument("--doctors", type=int, default=10)
+        parser.add_argument("--batch-size", type=int, default=2000)
+        parser.add_argument(
+            "--per-row-limit",
+            type=int,
+            default=2000,
+            help="Number of slots created one by one for the per-row baseline.",
+        )
+
+    def handle(self, *args, **options):
+        doctors_count = options["doctors"]
+        days = math.ceil(options["slots"] / doctors_count / SLOTS_PER_DAY)
+        date_from = date(2024, 3, 25)
+        date_to = date_from + timedelta(days=days - 1)
+
+        with isolated_database():
+            doctors = self._seed(doctors_count)
+            baseline = list(
+                expand_schedule(
+                    date_from, date_to, PATTERNS, skip_official_holidays=False
+                )
+            )[: options["per_row_limit"]]
+            result = measure(self._per_row, doctors[0].id, baseline)
+            self._report("per-row", len(baseline), result)
+            DoctorDateTimeModel.objects.all().delete()
+
+            for mode in ("bulk", "bulk-rerun"):
+                result = measure(
+                    self._bulk,
+                    doctors,
+                    date_from,
+                    date_to,
+                    options["batch_size"],
+                )
+                self._report(mode, result["result"]["requested"], result)
+                self.stdout.write(f"  created {result['result']['created']} slot(s)")
+
+    def _seed(self, doctors_count):
+        return DoctorModel.objects.bulk_create(
+            DoctorModel(
+                name=f"Doctor {index}",
+                phone="09120000000",
+                national_code="0000000000",
+                address="-",
+                field="General",
+            )
+            for index in range(doctors_count)
+        )
+
+    @staticmethod
+    def _per_row(doctor_id, slots):
+        for slot_date, slot_time in slots:
+            DoctorDateTimeModel.objects.create(
+                doctor_id=doctor_id, date=slot_date, time=slot_time
+            )
+
+    @staticmethod
+    def _bulk(doctors, date_from, date_to, batch_size):
+        totals = {"requested": 0, "created": 0}
+        for doctor in doctors:
+            result = generate_slots(
+                doctor.id,
+                date_from,
+                date_to,
+                PATTERNS,
+                skip_official_holidays=False,
+                batch_size=batch_size,
+            )
+            totals["requested"] += result["requested"]
+            totals["created"] += result["created"]
+        return totals
+
+    def _report(self, mode, slots, result):
+        seconds = result["seconds"]
+        self.stdout.write(
+            f"{mode:<10} | {slots:>8} slots | {result['queries']:>7} queries | "
+            f"{seconds * 1000:>10.2f} ms | {slots / seconds if seconds else 0:>10.0f} slots/s"
+        )
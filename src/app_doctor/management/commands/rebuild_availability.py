@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from app_doctor.services import rebuild_availability
+
+from datetime import date
+
+
+class Command(BaseCommand):
+    help = "Recompute the precomputed doctor calendar from slots and reservations."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--doctor", type=int, action="append", dest="doctors")
+        parser.add_argument("--date-from", type=date.fromisoformat, default=None)
+        parser.add_argument("--date-to", type=date.fromisoformat, default=None)
+        parser.add_argument("--batch-size", type=int, default=2000)
+
+    def handle(self, *args, **options):
+        written = rebuild_availability(
+            doctor_ids=options["doctors"],
+            date_from=options["date_from"],
+            date_to=options["date_to"],
+            batch_size=options["batch_size"],
+        )
+        self.stdout.write(f"Rebuilt {written} calendar slot(s).")
@@ -0,0 +1,37 @@
+# Generated by Django 5.1.2 on 2026-10-18 00:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app_doctor", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="doctor",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["-created_at"],
+                name="doctor_created_at_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="doctordatetime",
+            index=models.Index(
+                condition=models.Q(("is_active", True), ("is_deleted", False)),
+                fields=["date", "time"],
+                name="doctor_dt_active_date_time_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="doctordatetime",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["date", "time"],
+                name="doctor_dt_date_time_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.1.2 on 2026-10-18 00:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app_doctor", "0002_doctor_doctor_created_at_idx_and_more"),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name="doctordatetime",
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name="doctordatetime",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("is_deleted", False)),
+                fields=("doctor", "date", "time"),
+                name="unique_doctor_slot_if_not_delete",
+            ),
+        ),
+    ]
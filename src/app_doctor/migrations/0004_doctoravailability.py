@@ -0,0 +1,88 @@
+# Generated by Django 5.1.2 on 2026-10-18 00:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Exists, OuterRef
+
+
+def populate_availability(apps, schema_editor):
+    DoctorAvailability = apps.get_model("app_doctor", "DoctorAvailability")
+    DoctorDateTime = apps.get_model("app_doctor", "DoctorDateTime")
+    Reservation = apps.get_model("app_reservation", "Reservation")
+    reservations = Reservation.objects.filter(
+        is_deleted=False,
+        doctor=OuterRef("doctor"),
+        date=OuterRef("date"),
+        time=OuterRef("time"),
+    )
+    slots = (
+        DoctorDateTime.objects.filter(is_deleted=False, is_active=True)
+        .annotate(is_reserved=Exists(reservations))
+        .values_list("doctor_id", "date", "time", "is_reserved")
+    )
+    DoctorAvailability.objects.bulk_create(
+        (
+            DoctorAvailability(
+                doctor_id=doctor_id, date=date, time=time, is_reserved=is_reserved
+            )
+            for doctor_id, date, time, is_reserved in slots.iterator()
+        ),
+        batch_size=2000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app_doctor", "0003_alter_doctordatetime_unique_together_and_more"),
+        ("app_reservation", "0005_slothold"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DoctorAvailability",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField(verbose_name="Date")),
+                ("time", models.TimeField(verbose_name="Start time")),
+                (
+                    "is_reserved",
+                    models.BooleanField(default=False, verbose_name="Reserved"),
+                ),
+                (
+                    "doctor",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="doctor_availabilities",
+                        to="app_doctor.doctor",
+                        verbose_name="Doctor",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Doctor Availability",
+                "verbose_name_plural": "Doctor Availabilities",
+                "indexes": [
+                    models.Index(
+                        fields=["date", "doctor", "time"],
+                        name="doctor_availability_date_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("doctor", "date", "time"),
+                        name="unique_doctor_availability_slot",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(populate_availability, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.1.2 on 2026-10-18 00:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app_doctor", "0004_doctoravailability"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="doctor",
+            name="deleted_at",
+            field=models.DateTimeField(
+                blank=True, db_index=True, null=True, verbose_name="Deleted Time"
+            ),
+        ),
+        migrations.AlterField(
+            model_name="doctordatetime",
+            name="deleted_at",
+            field=models.DateTimeField(
+                blank=True, db_index=True, null=True, verbose_name="Deleted Time"
+            ),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.2 on 2026-10-18 01:03
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app_doctor", "0005_deleted_at_index"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="doctordatetime",
+            name="doctor_dt_active_date_time_idx",
+        ),
+    ]
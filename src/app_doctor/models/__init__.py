@@ -1,2 +1,3 @@
 from .doctors import Doctor as DoctorModel
 from .datetimes import DoctorDateTime as DoctorDateTimeModel
+from .availability import DoctorAvailability as DoctorAvailabilityModel
@@ -0,0 +1,41 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from app_doctor.models.doctors import Doctor
+
+
+class DoctorAvailability(models.Model):
+    """
+    Precomputed calendar: one row per active, non-deleted doctor slot with its
+    reservation state, kept current by the DoctorDateTime and Reservation signals.
+    """
+
+    class Meta:
+        verbose_name = _("Doctor Availability")
+        verbose_name_plural = _("Doctor Availabilities")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["doctor", "date", "time"],
+                name="unique_doctor_availability_slot",
+            ),
+        ]
+        indexes = [
+            # calendar: every doctor's slots in a date range
+            models.Index(
+                fields=["date", "doctor", "time"],
+                name="doctor_availability_date_idx",
+            ),
+        ]
+
+    doctor = models.ForeignKey(
+        Doctor,
+        on_delete=models.CASCADE,
+        related_name="doctor_availabilities",
+        verbose_name=_("Doctor"),
+    )
+    date = models.DateField(verbose_name=_("Date"))
+    time = models.TimeField(verbose_name=_("Start time"))
+    is_reserved = models.BooleanField(default=False, verbose_name=_("Reserved"))
+
+    def __str__(self):
+        return f"{self.doctor_id} {self.date} {self.time} {self.is_reserved}"
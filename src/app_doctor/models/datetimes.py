@@ -12,7 +12,22 @@ class DoctorDateTime(AbstractDateModel, AbstractSoftDeleteModel):
     class Meta(AbstractDateModel.Meta, AbstractSoftDeleteModel.Meta):
         verbose_name = _("Doctor DateTime")
         verbose_name_plural = _("Doctor DateTimes")
-        unique_together = (("doctor", "date", "time"),)
+        constraints = [
+            models.UniqueConstraint(
+                fields=["doctor", "date", "time"],
+                condition=models.Q(is_deleted=False),
+                name="unique_doctor_slot_if_not_delete",
+            ),
+        ]
+        indexes = [
+            # public and admin slot lists: non-deleted slots ordered by date, time;
+            # the public list filters is_active on the rows this index returns
+            models.Index(
+                fields=["date", "time"],
+                condition=models.Q(is_deleted=False),
+                name="doctor_dt_date_time_idx",
+            ),
+        ]
 
     doctor = models.ForeignKey(
         Doctor,
@@ -9,6 +9,14 @@ class Doctor(AbstractDateModel, AbstractSoftDeleteModel):
     class Meta(AbstractDateModel.Meta, AbstractSoftDeleteModel.Meta):
         verbose_name = _("Doctor")
         verbose_name_plural = _("Doctors")
+        indexes = [
+            # doctor lists: non-deleted doctors in the default -created_at order
+            models.Index(
+                fields=["-created_at"],
+                condition=models.Q(is_deleted=False),
+                name="doctor_created_at_idx",
+            ),
+        ]
 
     name = models.CharField(max_length=100, verbose_name=_("Name"))
     phone = fields.PhoneField(verbose_name=_("Phone"))
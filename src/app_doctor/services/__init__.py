@@ -0,0 +1,20 @@
+from .availability import (
+    annotate_is_reserved,
+    get_reserved_slot_keys,
+    is_slot_reserved,
+)
+from .calendar import (
+    calendar_rows,
+    get_calendar,
+    rebuild_availability,
+    rebuild_slots_availability,
+    refresh_slot_availability,
+)
+from .cache import DOCTORS_NAMESPACE, DOCTOR_SLOTS_NAMESPACE, doctor_slots_namespaces
+from .schedule import (
+    OFFICIAL_JALALI_HOLIDAYS,
+    expand_schedule,
+    generate_slots,
+    parse_jalali_date,
+)
+from .slots import set_slots_active
@@ -0,0 +1,93 @@
+from django.db.models import Exists, OuterRef, QuerySet
+
+from app_reservation.models import ReservationModel
+
+
+def slot_reservations(doctor, date, time) -> QuerySet:
+    """
+    Returns the (non-deleted) reservations occupying a doctor slot.
+
+    Parameters:
+    ----------
+    doctor : Doctor, int or OuterRef
+        The doctor (or its id) of the slot.
+    date : date or OuterRef
+        The date of the slot.
+    time : time or OuterRef
+        The start time of the slot.
+
+    Returns:
+    -------
+    QuerySet
+        A queryset of reservations for the given slot.
+    """
+    return ReservationModel.objects.filter(doctor=doctor, date=date, time=time)
+
+
+def annotate_is_reserved(queryset: QuerySet) -> QuerySet:
+    """
+    Annotates a DoctorDateTime queryset with an `is_reserved` boolean computed by a
+    correlated EXISTS subquery, so availability of a whole page is resolved in the
+    same query that fetches the slots.
+
+    Parameters:
+    ----------
+    queryset : QuerySet
+        A queryset of DoctorDateTime objects.
+
+    Returns:
+    -------
+    QuerySet
+        The queryset annotated with `is_reserved`.
+    """
+    return queryset.annotate(
+        is_reserved=Exists(
+            slot_reservations(OuterRef("doctor"), OuterRef("date"), OuterRef("time"))
+        )
+    )
+
+
+def get_reserved_slot_keys(slots) -> set:
+    """
+    Resolves which of the given slots are reserved with a single bulk lookup.
+
+    Parameters:
+    ----------
+    slots : iterable
+        DoctorDateTime objects (or any objects with doctor_id, date and time).
+
+    Returns:
+    -------
+    set
+        A set of (doctor_id, date, time) tuples that have a reservation.
+    """
+    keys = {(slot.doctor_id, slot.date, slot.time) for slot in slots}
+    if not keys:
+        return set()
+    dates = [date for _, date, _ in keys]
+    reserved = ReservationModel.objects.filter(
+        doctor_id__in={doctor_id for doctor_id, _, _ in keys},
+        date__range=(min(dates), max(dates)),
+    ).values_list("doctor_id", "date", "time")
+    return keys.intersection(reserved.iterator())
+
+
+def is_slot_reserved(slot) -> bool:
+    """
+    Returns whether a single slot is reserved, preferring the `is_reserved`
+    annotation and falling back to one EXISTS query.
+
+    Parameters:
+    ----------
+    slot : DoctorDateTime
+        The slot to check.
+
+    Returns:
+    -------
+    bool
+        True if the slot has a reservation.
+    """
+    is_reserved = getattr(slot, "is_reserved", None)
+    if is_reserved is None:
+        is_reserved = slot_reservations(slot.doctor_id, slot.date, slot.time).exists()
+    return is_reserved
@@ -0,0 +1,12 @@
+DOCTORS_NAMESPACE = "doctors"
+DOCTOR_SLOTS_NAMESPACE = "doctor_slots"
+
+
+def doctor_slots_namespaces(*doctor_ids) -> list:
+    """
+    Returns the cache namespaces of slot listings touched by changes to the given
+    doctors' slots: each doctor's own listings plus the listings of all doctors.
+    """
+    return [DOCTOR_SLOTS_NAMESPACE] + [
+        f"{DOCTOR_SLOTS_NAMESPACE}:{doctor_id}" for doctor_id in doctor_ids
+    ]
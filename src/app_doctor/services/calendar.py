@@ -0,0 +1,182 @@
+from django.db import connections, transaction
+from django.db.models import Max, Min
+
+from app_doctor.models import DoctorAvailabilityModel, DoctorDateTimeModel
+from app_doctor.services.availability import annotate_is_reserved
+
+from itertools import groupby, islice
+
+
+def refresh_slot_availability(doctor_id, date, time):
+    """
+    Brings the calendar row of a single slot in line with its DoctorDateTime and
+    reservations: removed when the slot is gone or inactive, upserted otherwise.
+    The upsert falls back to `update_or_create` on databases that cannot target
+    the conflict of a bulk insert.
+
+    Parameters:
+    ----------
+    doctor_id : int
+        The doctor of the slot.
+    date : date
+        The date of the slot.
+    time : time
+        The start time of the slot.
+    """
+    is_reserved = (
+        annotate_is_reserved(
+            DoctorDateTimeModel.objects.filter(
+                doctor_id=doctor_id, date=date, time=time, is_active=True
+            )
+        )
+        .values_list("is_reserved", flat=True)
+        .first()
+    )
+    if is_reserved is None:
+        DoctorAvailabilityModel.objects.filter(
+            doctor_id=doctor_id, date=date, time=time
+        ).delete()
+        return
+    manager = DoctorAvailabilityModel.objects
+    if not connections[manager.db].features.supports_update_conflicts_with_target:
+        # MySQL and MariaDB cannot target the conflicting unique fields
+        manager.update_or_create(
+            doctor_id=doctor_id,
+            date=date,
+            time=time,
+            defaults={"is_reserved": is_reserved},
+        )
+        return
+    manager.bulk_create(
+        [
+            DoctorAvailabilityModel(
+                doctor_id=doctor_id, date=date, time=time, is_reserved=is_reserved
+            )
+        ],
+        update_conflicts=True,
+        unique_fields=["doctor", "date", "time"],
+        update_fields=["is_reserved"],
+    )
+
+
+def rebuild_availability(
+    doctor_ids=None, date_from=None, date_to=None, batch_size=2000
+) -> int:
+    """
+    Recomputes the calendar rows of a scope from scratch in one transaction.
+
+    Parameters:
+    ----------
+    doctor_ids : iterable, optional
+        Limit the rebuild to these doctors.
+    date_from : date, optional
+        The first date to rebuild.
+    date_to : date, optional
+        The last date to rebuild.
+    batch_size : int, optional
+        The number of rows inserted per query.
+
+    Returns:
+    -------
+    int
+        The number of calendar rows written.
+    """
+    scope = {}
+    if doctor_ids is not None:
+        scope["doctor_id__in"] = list(doctor_ids)
+    if date_from is not None:
+        scope["date__gte"] = date_from
+    if date_to is not None:
+        scope["date__lte"] = date_to
+
+    slots = (
+        annotate_is_reserved(
+            DoctorDateTimeModel.objects.filter(is_active=True, **scope)
+        )
+        .values_list("doctor_id", "date", "time", "is_reserved")
+        .iterator(chunk_size=batch_size)
+    )
+    rows = (
+        DoctorAvailabilityModel(
+            doctor_id=doctor_id, date=date, time=time, is_reserved=is_reserved
+        )
+        for doctor_id, date, time, is_reserved in slots
+    )
+    written = 0
+    with transaction.atomic():
+        DoctorAvailabilityModel.objects.filter(**scope).delete()
+        while batch := list(islice(rows, batch_size)):
+            DoctorAvailabilityModel.objects.bulk_create(batch)
+            written += len(batch)
+    return written
+
+
+def rebuild_slots_availability(slots) -> int:
+    """
+    Recomputes the calendar rows around a set of slots with one scoped rebuild
+    (their doctors over their date span) instead of one refresh per slot. The
+    scope is aggregated by the database, the slots are never loaded.
+
+    Parameters:
+    ----------
+    slots : QuerySet
+        The changed DoctorDateTime or Reservation rows.
+
+    Returns:
+    -------
+    int
+        The number of calendar rows written.
+    """
+    slots = slots.order_by()
+    span = slots.aggregate(date_from=Min("date"), date_to=Max("date"))
+    if span["date_from"] is None:
+        return 0
+    return rebuild_availability(
+        doctor_ids=set(slots.values_list("doctor_id", flat=True).distinct()),
+        **span,
+    )
+
+
+def calendar_rows(date_from, date_to, doctor_ids=None):
+    """
+    Returns the calendar rows of a date range, ordered to match
+    `doctor_availability_date_idx`.
+    """
+    rows = DoctorAvailabilityModel.objects.filter(date__range=(date_from, date_to))
+    if doctor_ids:
+        rows = rows.filter(doctor_id__in=doctor_ids)
+    return rows.order_by("date", "doctor_id", "time").values_list(
+        "doctor_id", "date", "time", "is_reserved"
+    )
+
+
+def get_calendar(date_from, date_to, doctor_ids=None) -> list:
+    """
+    Builds the per-doctor, per-day free/taken slot times of a date range with a
+    single indexed range query on the calendar table.
+
+    Parameters:
+    ----------
+    date_from : date
+        The first date of the range.
+    date_to : date
+        The last date of the range.
+    doctor_ids : iterable, optional
+        Limit the calendar to these doctors.
+
+    Returns:
+    -------
+    list
+        `[{"doctor": id, "days": [{"date", "free": [...], "taken": [...]}]}]`
+    """
+    doctors = {}
+    rows = calendar_rows(date_from, date_to, doctor_ids)
+    for (doctor_id, date), slots in groupby(rows, key=lambda row: row[:2]):
+        day = {"date": date, "free": [], "taken": []}
+        for _, _, time, is_reserved in slots:
+            day["taken" if is_reserved else "free"].append(time)
+        doctors.setdefault(doctor_id, []).append(day)
+    return [
+        {"doctor": doctor_id, "days": days}
+        for doctor_id, days in sorted(doctors.items())
+    ]
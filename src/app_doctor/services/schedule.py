@@ -0,0 +1,178 @@
+from django.db import transaction
+
+from app_doctor.models import DoctorDateTimeModel
+from app_doctor.services.cache import doctor_slots_namespaces
+from app_doctor.services.calendar import rebuild_availability
+
+from utils.cache import bump_namespaces_on_commit
+
+from datetime import datetime, timedelta
+from itertools import islice
+import jdatetime
+
+# (month, day) of the official holidays fixed in the Jalali calendar; holidays of
+# the lunar calendar move every year and are passed explicitly
+OFFICIAL_JALALI_HOLIDAYS = frozenset(
+    {
+        (1, 1),
+        (1, 2),
+        (1, 3),
+        (1, 4),
+        (1, 12),
+        (1, 13),
+        (3, 14),
+        (3, 15),
+        (11, 22),
+        (12, 29),
+    }
+)
+
+
+def parse_jalali_date(jalali_date_str: str):
+    """
+    Converts a `YYYY/MM/DD` Jalali date to a Gregorian date.
+
+    Raises:
+    ------
+    ValueError
+        If the string is not a valid Jalali date.
+    """
+    year, month, day = map(int, jalali_date_str.split("/"))
+    return jdatetime.date(year, month, day).togregorian()
+
+
+def is_official_holiday(day) -> bool:
+    jalali_date = jdatetime.date.fromgregorian(date=day)
+    return (jalali_date.month, jalali_date.day) in OFFICIAL_JALALI_HOLIDAYS
+
+
+def pattern_times(start_time, end_time, slot_minutes) -> list:
+    """
+    Returns the start times of the slots of `slot_minutes` that fit entirely
+    between `start_time` and `end_time`.
+    """
+    day = datetime.min
+    current = datetime.combine(day, start_time)
+    end = datetime.combine(day, end_time)
+    length = timedelta(minutes=slot_minutes)
+    times = []
+    while current + length <= end:
+        times.append(current.time())
+        current += length
+    return times
+
+
+def expand_schedule(
+    date_from, date_to, patterns, holidays=(), skip_official_holidays=True
+):
+    """
+    Expands a weekly schedule template into the `(date, time)` of every slot.
+
+    Parameters:
+    ----------
+    date_from : date
+        The first date of the schedule.
+    date_to : date
+        The last date of the schedule.
+    patterns : iterable
+        Dictionaries with `weekdays` (Jalali week days, 0 is Saturday and 6 is
+        Friday), `start_time`, `end_time` and `slot_minutes`.
+    holidays : iterable, optional
+        Extra (Gregorian) dates without slots, e.g. lunar calendar holidays.
+    skip_official_holidays : bool, optional
+        Skip the official holidays fixed in the Jalali calendar.
+
+    Yields:
+    ------
+    tuple
+        `(date, time)` of each slot, ordered by date; times of overlapping
+        patterns are yielded once.
+    """
+    holidays = set(holidays)
+    times_by_weekday = {}
+    for pattern in patterns:
+        times = pattern_times(
+            pattern["start_time"], pattern["end_time"], pattern["slot_minutes"]
+        )
+        for weekday in pattern["weekdays"]:
+            times_by_weekday.setdefault(weekday, set()).update(times)
+
+    day = date_from
+    while day <= date_to:
+        # date.weekday() is 0 on Monday, the Jalali week starts on Saturday
+        times = times_by_weekday.get((day.weekday() + 2) % 7)
+        if (
+            times
+            and day not in holidays
+            and not (skip_official_holidays and is_official_holiday(day))
+        ):
+            for time in sorted(times):
+                yield day, time
+        day += timedelta(days=1)
+
+
+def generate_slots(
+    doctor_id,
+    date_from,
+    date_to,
+    patterns,
+    holidays=(),
+    skip_official_holidays=True,
+    is_active=True,
+    batch_size=2000,
+) -> dict:
+    """
+    Creates the slots of a weekly schedule template for a doctor in batched
+    inserts. Slots that already exist are skipped by the database
+    (`ignore_conflicts`), so a schedule can be regenerated safely. The calendar
+    of the range is rebuilt and the slot caches are invalidated once, since
+    bulk inserts do not send the per slot signals.
+
+    Parameters:
+    ----------
+    doctor_id : int
+        The doctor the slots belong to.
+    date_from : date
+        The first date of the schedule.
+    date_to : date
+        The last date of the schedule.
+    patterns : iterable
+        The weekly patterns, see `expand_schedule`.
+    holidays : iterable, optional
+        Extra (Gregorian) dates without slots.
+    skip_official_holidays : bool, optional
+        Skip the official holidays fixed in the Jalali calendar.
+    is_active : bool, optional
+        Whether the created slots are bookable.
+    batch_size : int, optional
+        The number of slots inserted per query.
+
+    Returns:
+    -------
+    dict
+        `{"requested", "created", "skipped"}` slot counts.
+    """
+    slots = (
+        DoctorDateTimeModel(
+            doctor_id=doctor_id, date=date, time=time, is_active=is_active
+        )
+        for date, time in expand_schedule(
+            date_from, date_to, patterns, holidays, skip_official_holidays
+        )
+    )
+    existing = DoctorDateTimeModel.objects.filter(
+        doctor_id=doctor_id, date__range=(date_from, date_to)
+    )
+    requested = 0
+    with transaction.atomic():
+        before = existing.count()
+        while batch := list(islice(slots, batch_size)):
+            DoctorDateTimeModel.objects.bulk_create(batch, ignore_conflicts=True)
+            requested += len(batch)
+        created = existing.count() - before
+        if created:
+            rebuild_availability(
+                doctor_ids=[doctor_id], date_from=date_from, date_to=date_to
+            )
+            bump_namespaces_on_commit(*doctor_slots_namespaces(doctor_id))
+    return {"requested": requested, "created": created, "skipped": requested - created}
@@ -0,0 +1,37 @@
+from django.db import transaction
+from django.db.models import Max, Min, QuerySet
+from django.utils import timezone
+
+from app_doctor.services.cache import doctor_slots_namespaces
+from app_doctor.services.calendar import rebuild_availability
+
+from utils.cache import bump_namespaces_on_commit
+
+
+def set_slots_active(slots: QuerySet, is_active: bool) -> int:
+    """
+    Activates or deactivates a set of slots with a single UPDATE. Queryset
+    updates send no signals, so the calendar of the affected doctors and dates is
+    rebuilt once and their slot caches are invalidated after commit.
+
+    Parameters:
+    ----------
+    slots : QuerySet
+        The DoctorDateTime objects to change.
+    is_active : bool
+        The new active state.
+
+    Returns:
+    -------
+    int
+        The number of slots whose state changed.
+    """
+    slots = slots.exclude(is_active=is_active).order_by()
+    with transaction.atomic():
+        scope = slots.aggregate(date_from=Min("date"), date_to=Max("date"))
+        doctor_ids = list(slots.values_list("doctor_id", flat=True).distinct())
+        updated = slots.update(is_active=is_active, updated_at=timezone.now())
+        if updated:
+            rebuild_availability(doctor_ids=doctor_ids, **scope)
+            bump_namespaces_on_commit(*doctor_slots_namespaces(*doctor_ids))
+    return updated
@@ -0,0 +1,52 @@
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+from app_doctor.models import DoctorDateTimeModel
+from app_doctor.services import rebuild_slots_availability, refresh_slot_availability
+from app_reservation.models import ReservationModel
+
+from utils.db.models.soft_delete import soft_deleted
+
+SLOT_FIELDS = ("doctor_id", "date", "time")
+
+
+def _slot_key(instance):
+    return tuple(getattr(instance, field) for field in SLOT_FIELDS)
+
+
+@receiver(pre_save, sender=DoctorDateTimeModel)
+@receiver(pre_save, sender=ReservationModel)
+def remember_previous_slot_handler(sender, instance, **kwargs):
+    # a slot moved to another doctor, date or time frees its previous calendar row
+    instance._previous_slot_key = None
+    if instance.pk is not None and not kwargs.get("raw"):
+        instance._previous_slot_key = (
+            sender.objects.all_objects()
+            .filter(pk=instance.pk)
+            .values_list(*SLOT_FIELDS)
+            .first()
+        )
+
+
+@receiver(post_save, sender=DoctorDateTimeModel)
+@receiver(post_save, sender=ReservationModel)
+def refresh_slot_availability_handler(sender, instance, **kwargs):
+    if kwargs.get("raw"):
+        return
+    slot_key = _slot_key(instance)
+    refresh_slot_availability(*slot_key)
+    previous_slot_key = getattr(instance, "_previous_slot_key", None)
+    if previous_slot_key and previous_slot_key != slot_key:
+        refresh_slot_availability(*previous_slot_key)
+
+
+@receiver(post_delete, sender=DoctorDateTimeModel)
+@receiver(post_delete, sender=ReservationModel)
+def delete_slot_availability_handler(sender, instance, **kwargs):
+    refresh_slot_availability(*_slot_key(instance))
+
+
+@receiver(soft_deleted, sender=DoctorDateTimeModel)
+@receiver(soft_deleted, sender=ReservationModel)
+def soft_deleted_slot_availability_handler(sender, rows, **kwargs):
+    rebuild_slots_availability(rows)
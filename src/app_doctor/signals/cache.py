@@ -0,0 +1,43 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from app_doctor.models import DoctorModel, DoctorDateTimeModel
+from app_doctor.services import DOCTORS_NAMESPACE, doctor_slots_namespaces
+from app_reservation.models import ReservationModel
+
+from utils.cache import bump_namespaces_on_commit
+from utils.db.models.soft_delete import soft_deleted
+
+
+@receiver(post_save, sender=DoctorModel)
+@receiver(post_delete, sender=DoctorModel)
+def invalidate_doctor_cache_handler(sender, instance, **kwargs):
+    # deleting a doctor cascades to its slots without per slot signals
+    bump_namespaces_on_commit(DOCTORS_NAMESPACE, *doctor_slots_namespaces(instance.pk))
+
+
+@receiver(soft_deleted, sender=DoctorModel)
+def invalidate_soft_deleted_doctors_cache_handler(sender, rows, **kwargs):
+    bump_namespaces_on_commit(
+        DOCTORS_NAMESPACE,
+        *doctor_slots_namespaces(*rows.values_list("pk", flat=True)),
+    )
+
+
+@receiver(post_save, sender=DoctorDateTimeModel)
+@receiver(post_delete, sender=DoctorDateTimeModel)
+@receiver(post_save, sender=ReservationModel)
+@receiver(post_delete, sender=ReservationModel)
+def invalidate_slot_cache_handler(sender, instance, **kwargs):
+    doctor_ids = {instance.doctor_id}
+    previous_slot_key = getattr(instance, "_previous_slot_key", None)
+    if previous_slot_key:
+        doctor_ids.add(previous_slot_key[0])
+    bump_namespaces_on_commit(*doctor_slots_namespaces(*doctor_ids))
+
+
+@receiver(soft_deleted, sender=DoctorDateTimeModel)
+@receiver(soft_deleted, sender=ReservationModel)
+def invalidate_soft_deleted_slots_cache_handler(sender, rows, **kwargs):
+    doctor_ids = rows.values_list("doctor_id", flat=True).order_by().distinct()
+    bump_namespaces_on_commit(*doctor_slots_namespaces(*doctor_ids))
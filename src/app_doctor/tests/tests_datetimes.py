@@ -0,0 +1,110 @@
+from django.core.cache import caches
+from django.db import connection
+from django.test import TestCase
+
+from rest_framework.test import APIClient
+
+from app_doctor.api.public.views import UsersDoctorDateTimesListAPIView
+from app_doctor.models import (
+    DoctorModel,
+    DoctorDateTimeModel,
+    DoctorAvailabilityModel,
+)
+from app_doctor.services import refresh_slot_availability
+from app_reservation.models import ReservationModel
+
+from utils.db.instrumentation import assert_max_queries
+
+from datetime import date, time
+from unittest import mock
+
+LIST_URL = "/api/v1/public/doctor/datetime/list/"
+
+
+class UsersDoctorDateTimesListTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.doctors = [
+            DoctorModel.objects.create(
+                name=f"Doctor {index}",
+                phone="09120000000",
+                national_code=str(index),
+                address="-",
+            )
+            for index in range(2)
+        ]
+        DoctorDateTimeModel.objects.bulk_create(
+            DoctorDateTimeModel(doctor=doctor, date=date(2025, 4, 5), time=time(hour))
+            for doctor in cls.doctors
+            for hour in (8, 9)
+        )
+
+    def setUp(self):
+        for cache in caches.all():
+            cache.clear()
+        self.client = APIClient()
+
+    def test_filtered_list_stays_within_its_query_budget(self):
+        with assert_max_queries(UsersDoctorDateTimesListAPIView.query_budget):
+            response = self.client.get(LIST_URL, {"doctor": self.doctors[0].id})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual({row["doctor"] for row in response.data}, {self.doctors[0].id})
+
+    def test_fresh_client_copy_is_answered_with_304(self):
+        response = self.client.get(LIST_URL, {"doctor": self.doctors[0].id})
+        etag = response["ETag"]
+
+        response = self.client.get(
+            LIST_URL, {"doctor": self.doctors[0].id}, HTTP_IF_NONE_MATCH=etag
+        )
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response.content, b"")
+
+    def test_booking_invalidates_the_etag(self):
+        params = {"doctor": self.doctors[0].id}
+        etag = self.client.get(LIST_URL, params)["ETag"]
+
+        # the cached response is invalidated once the booking commits
+        with self.captureOnCommitCallbacks(execute=True):
+            ReservationModel.objects.create(
+                doctor=self.doctors[0],
+                date=date(2025, 4, 5),
+                time=time(8),
+                full_name="Patient",
+                mobile_number="09121111111",
+            )
+        response = self.client.get(LIST_URL, params, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual([row["is_active"] for row in response.data], [False, True])
+
+
+class SlotAvailabilityUpsertTests(TestCase):
+    def test_refresh_updates_the_row_without_conflict_targets(self):
+        doctor = DoctorModel.objects.create(
+            name="Doctor", phone="09120000000", national_code="1", address="-"
+        )
+        DoctorDateTimeModel.objects.create(
+            doctor=doctor, date=date(2025, 4, 5), time=time(8)
+        )
+        # MySQL and MariaDB cannot name the conflicting unique fields of an upsert
+        with mock.patch.object(
+            connection.features, "supports_update_conflicts_with_target", False
+        ):
+            refresh_slot_availability(doctor.pk, date(2025, 4, 5), time(8))
+            ReservationModel.objects.create(
+                doctor=doctor,
+                date=date(2025, 4, 5),
+                time=time(8),
+                full_name="Patient",
+                mobile_number="09121111111",
+            )
+            refresh_slot_availability(doctor.pk, date(2025, 4, 5), time(8))
+
+        self.assertEqual(
+            list(DoctorAvailabilityModel.objects.values_list("is_reserved", flat=True)),
+            [True],
+        )
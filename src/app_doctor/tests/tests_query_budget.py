@@ -0,0 +1,52 @@
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+
+from rest_framework.test import APIClient
+
+from app_doctor.api.public.views import UsersDoctorDateTimesListAPIView
+from app_doctor.models import DoctorModel
+
+from utils.db.instrumentation import QueryBudgetExceeded
+
+from unittest import mock
+
+LIST_URL = "/api/v1/public/doctor/datetime/list/"
+
+
+class QueryBudgetMiddlewareTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.doctor = DoctorModel.objects.create(
+            name="Doctor", phone="09120000000", national_code="1", address="-"
+        )
+
+    def setUp(self):
+        for cache in caches.all():
+            cache.clear()
+        self.client = APIClient()
+        # the filtered list runs more than one query
+        patcher = mock.patch.object(UsersDoctorDateTimesListAPIView, "query_budget", 1)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def get(self):
+        return self.client.get(LIST_URL, {"doctor": self.doctor.id})
+
+    def test_instrumentation_is_off_by_default(self):
+        with self.assertNoLogs("utils.middleware"):
+            response = self.get()
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("Server-Timing", response)
+
+    @override_settings(QUERY_INSTRUMENTATION=True, QUERY_BUDGET_STRICT=False)
+    def test_view_over_budget_logs_a_warning_in_lax_mode(self):
+        with self.assertLogs("utils.middleware", "WARNING") as logs:
+            response = self.get()
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("Server-Timing", response)
+        self.assertIn("budget is 1", logs.output[-1])
+
+    @override_settings(QUERY_INSTRUMENTATION=True, QUERY_BUDGET_STRICT=True)
+    def test_view_over_budget_fails_in_strict_mode(self):
+        with self.assertRaisesMessage(QueryBudgetExceeded, "budget is 1"):
+            self.get()
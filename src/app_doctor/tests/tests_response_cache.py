@@ -0,0 +1,75 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+
+from rest_framework.test import APIClient
+
+from app_doctor.models import DoctorModel
+from app_doctor.services import DOCTORS_NAMESPACE
+
+from utils.cache import bump_namespaces, get_response_cache, response_cache_enabled
+
+import tempfile
+import threading
+
+LIST_URL = "/api/v1/public/doctor/list/"
+
+
+class ResponseCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.doctor = DoctorModel.objects.create(
+            name="Doctor", phone="09120000000", national_code="1", address="-"
+        )
+
+    def setUp(self):
+        for cache in caches.all():
+            cache.clear()
+        self.client = APIClient()
+
+    def shared_cache(self):
+        # a file based cache is shared by every process on the host, like redis
+        location = self.enterContext(tempfile.TemporaryDirectory())
+        return override_settings(
+            CACHES={
+                **settings.CACHES,
+                "shared": {
+                    "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                    "LOCATION": location,
+                },
+            },
+            RESPONSE_CACHE_ALIAS="shared",
+        )
+
+    def rename(self, name):
+        # a queryset update sends no signals, so only the cache decides what is served
+        DoctorModel.objects.filter(pk=self.doctor.pk).update(name=name)
+
+    def test_local_memory_cache_is_not_used_for_responses(self):
+        self.assertFalse(response_cache_enabled())
+        self.client.get(LIST_URL)
+        self.rename("Renamed")
+
+        self.assertContains(self.client.get(LIST_URL), "Renamed")
+
+    def test_bump_from_a_second_cache_instance_invalidates_the_response(self):
+        with self.shared_cache():
+            self.assertTrue(response_cache_enabled())
+            self.client.get(LIST_URL)
+            self.rename("Renamed")
+            self.assertNotContains(self.client.get(LIST_URL), "Renamed")
+
+            # cache connections are per thread: another thread bumps through its
+            # own backend instance, as another worker would
+            instances = []
+
+            def bump():
+                instances.append(get_response_cache())
+                bump_namespaces(DOCTORS_NAMESPACE)
+
+            thread = threading.Thread(target=bump)
+            thread.start()
+            thread.join()
+
+            self.assertIsNot(instances[0], get_response_cache())
+            self.assertContains(self.client.get(LIST_URL), "Renamed")
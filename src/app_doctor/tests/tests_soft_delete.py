@@ -0,0 +1,91 @@
+from django.test import TestCase
+from django.utils import timezone
+
+from app_doctor.models import DoctorModel, DoctorDateTimeModel, DoctorAvailabilityModel
+from app_doctor.services import rebuild_availability
+from app_reservation.models import ReservationModel, SlotHoldModel
+
+from datetime import date, time, timedelta
+
+# per dependent table: the UPDATE or DELETE, the listeners' aggregate queries
+# and the calendar rebuild; independent of the number of rows
+DOCTOR_DELETE_QUERIES = 22
+
+
+class SoftDeleteCascadeTests(TestCase):
+    def create_doctor_graph(self, slots):
+        doctor = DoctorModel.objects.create(
+            name="Doctor",
+            phone="09120000000",
+            national_code=str(slots),
+            address="-",
+        )
+        dates = [date(2025, 4, 1) + timedelta(days=index) for index in range(slots)]
+        DoctorDateTimeModel.objects.bulk_create(
+            DoctorDateTimeModel(doctor=doctor, date=slot_date, time=time(8))
+            for slot_date in dates
+        )
+        ReservationModel.objects.bulk_create(
+            ReservationModel(
+                doctor=doctor,
+                date=slot_date,
+                time=time(8),
+                full_name="Patient",
+                mobile_number="09121111111",
+            )
+            for slot_date in dates[::2]
+        )
+        SlotHoldModel.objects.bulk_create(
+            SlotHoldModel(
+                doctor=doctor,
+                date=slot_date,
+                time=time(8),
+                token="token",
+                mobile_number="09122222222",
+                expires_at=timezone.now() + timedelta(minutes=5),
+            )
+            for slot_date in dates[1::2]
+        )
+        rebuild_availability(doctor_ids=[doctor.pk])
+        return doctor
+
+    def test_doctor_delete_runs_a_constant_number_of_queries(self):
+        for slots in (2, 50):
+            with self.subTest(slots=slots):
+                doctor = self.create_doctor_graph(slots)
+
+                with self.assertNumQueries(DOCTOR_DELETE_QUERIES):
+                    deleted = DoctorModel.objects.filter(pk=doctor.pk).delete()
+
+                self.assertEqual(deleted, 1)
+                self.assertFalse(DoctorDateTimeModel.objects.filter(doctor=doctor))
+                self.assertEqual(
+                    DoctorDateTimeModel.objects.all_objects()
+                    .filter(doctor=doctor, is_deleted=True)
+                    .count(),
+                    slots,
+                )
+                self.assertFalse(ReservationModel.objects.filter(doctor=doctor))
+                self.assertFalse(SlotHoldModel.objects.filter(doctor=doctor))
+                self.assertFalse(DoctorAvailabilityModel.objects.filter(doctor=doctor))
+
+    def test_listeners_only_see_the_rows_of_this_delete(self):
+        doctor = self.create_doctor_graph(4)
+        other = self.create_doctor_graph(6)
+
+        DoctorDateTimeModel.objects.filter(
+            doctor=doctor, date__lte=date(2025, 4, 2)
+        ).delete()
+
+        self.assertEqual(DoctorDateTimeModel.objects.filter(doctor=doctor).count(), 2)
+        self.assertEqual(
+            set(
+                DoctorAvailabilityModel.objects.filter(doctor=doctor).values_list(
+                    "date", flat=True
+                )
+            ),
+            {date(2025, 4, 3), date(2025, 4, 4)},
+        )
+        self.assertEqual(
+            DoctorAvailabilityModel.objects.filter(doctor=other).count(), 6
+        )
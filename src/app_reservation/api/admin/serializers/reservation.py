@@ -1,12 +1,13 @@
+from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 
 from rest_framework import serializers
 
 from import_export import resources, fields
 
-from app_reservation.models import ReservationModel
+from app_reservation.models import ReservationModel, ExportJobModel
 
-from utils.serializers import CustomModelSerializer
+from utils.serializers import CustomModelSerializer, ValuesSerializer
 
 import jdatetime
 
@@ -32,6 +33,20 @@ class AdminReservationSerializer(CustomModelSerializer):
         }
 
 
+class AdminReservationValuesSerializer(ValuesSerializer):
+    class Meta:
+        model = ReservationModel
+        fields = (
+            "id",
+            "doctor",
+            "date",
+            "time",
+            "full_name",
+            "mobile_number",
+        )
+        sources = {"doctor": {"name": "doctor__name", "field": "doctor__field"}}
+
+
 class AdminCreateReservationSerializer(CustomModelSerializer):
     class Meta:
         model = ReservationModel
@@ -43,6 +58,8 @@ class AdminCreateReservationSerializer(CustomModelSerializer):
             "full_name",
             "mobile_number",
         )
+        # slot uniqueness is enforced by the database constraint (409 on conflict)
+        validators = []
 
 
 class AdminReservationExportResource(resources.ModelResource):
@@ -61,6 +78,7 @@ class AdminReservationExportResource(resources.ModelResource):
             "full_name",
             "mobile_number",
         )
+        chunk_size = 2000
 
     def dehydrate_doctor(self, obj):
         return f"{obj.doctor.name}({obj.doctor.field})"
@@ -78,3 +96,28 @@ class AdminReservationExportResource(resources.ModelResource):
 
     def dehydrate_mobile_number(self, obj):
         return obj.mobile_number
+
+
+class AdminExportJobSerializer(CustomModelSerializer):
+    download_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ExportJobModel
+        fields = (
+            "id",
+            "status",
+            "file_format",
+            "error",
+            "download_url",
+            "formatted_created_at",
+        )
+        read_only_fields = ("status", "error")
+
+    def get_download_url(self, obj):
+        if obj.status != ExportJobModel.StatusOptions.DONE or not self.request:
+            return None
+        url = reverse(
+            "app_reservation_admin:download_export_job",
+            kwargs={"version": self.request.resolver_match.kwargs["version"]},
+        )
+        return self.request.build_absolute_uri(f"{url}?pk={obj.pk}")
@@ -10,6 +10,11 @@ urlpatterns = [
         AdminReservationListAPIView.as_view(),
         name="list_reservations",
     ),
+    path(
+        "bulk-delete/",
+        AdminReservationBulkDeleteAPIView.as_view(),
+        name="bulk_delete_reservations",
+    ),
     path(
         "create/",
         AdminCreateReservationAPIView.as_view(),
@@ -20,4 +25,20 @@ urlpatterns = [
         AdminReservationExportListAPIView.as_view(),
         name="list_export_reservations",
     ),
+    # export jobs
+    path(
+        "list/export/jobs/create/",
+        AdminReservationExportJobCreateAPIView.as_view(),
+        name="create_export_job",
+    ),
+    path(
+        "list/export/jobs/status/",
+        AdminReservationExportJobStatusAPIView.as_view(),
+        name="status_export_job",
+    ),
+    path(
+        "list/export/jobs/download/",
+        AdminReservationExportJobDownloadAPIView.as_view(),
+        name="download_export_job",
+    ),
 ]
@@ -2,4 +2,8 @@ from .reservation import (
     AdminReservationListAPIView,
     AdminReservationExportListAPIView,
     AdminCreateReservationAPIView,
+    AdminReservationBulkDeleteAPIView,
+    AdminReservationExportJobCreateAPIView,
+    AdminReservationExportJobStatusAPIView,
+    AdminReservationExportJobDownloadAPIView,
 )
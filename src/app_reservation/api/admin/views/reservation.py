@@ -1,25 +1,39 @@
-from django.http import HttpResponse
+from django.http import FileResponse
+
+from rest_framework import exceptions, response, status
 
 from app_reservation.api.admin.serializers.reservation import (
     AdminReservationSerializer,
-    AdminReservationExportResource,
+    AdminReservationValuesSerializer,
     AdminCreateReservationSerializer,
+    AdminExportJobSerializer,
 )
-from app_reservation.models import ReservationModel
+from app_reservation.models import ReservationModel, ExportJobModel
 from app_reservation.filters.reservation import ReservationListFilter
+from app_reservation.services import (
+    EXPORT_FILE_FORMATS,
+    export_response,
+    enqueue_export_job,
+)
 
+from utils.base_errors import BaseErrors
 from utils.views import generics
 from utils.views.versioning import BaseVersioning
-from utils.views.paginations import BasePagination
+from utils.views.paginations import KeysetPagination
 from utils.views.permissions import IsAuthenticatedPermission, IsAdminUserPermission
 
 
-class AdminReservationListAPIView(generics.CustomListCreateAPIView):
+class AdminReservationListAPIView(
+    generics.ValuesListMixin, generics.CustomListCreateAPIView
+):
     permission_classes = [IsAuthenticatedPermission, IsAdminUserPermission]
     versioning = BaseVersioning
     serializer_class = AdminReservationSerializer
-    pagination_class = BasePagination
-    queryset = ReservationModel.objects.all().order_by("date", "time")
+    values_serializer_class = AdminReservationValuesSerializer
+    pagination_class = KeysetPagination
+    queryset = (
+        ReservationModel.objects.select_related("doctor").all().order_by("date", "time")
+    )
     search_fields = (
         "full_name",
         "doctor__name",
@@ -28,12 +42,22 @@ class AdminReservationListAPIView(generics.CustomListCreateAPIView):
         "date",
     )
     filterset_class = ReservationListFilter
+    query_budget = 4
+
+
+class AdminReservationBulkDeleteAPIView(generics.CustomBulkUpdateDestroyAPIView):
+    permission_classes = [IsAuthenticatedPermission, IsAdminUserPermission]
+    versioning = BaseVersioning
+    http_method_names = ["delete", "head", "options"]
+    queryset = ReservationModel.objects.all()
+    filterset_class = ReservationListFilter
 
 
 class AdminCreateReservationAPIView(generics.CustomCreateAPIView):
     permission_classes = [IsAuthenticatedPermission, IsAdminUserPermission]
     versioning = BaseVersioning
     serializer_class = AdminCreateReservationSerializer
+    conflict_detail = BaseErrors.slot_already_reserved
 
 
 class AdminReservationExportListAPIView(generics.CustomListAPIView):
@@ -51,9 +75,52 @@ class AdminReservationExportListAPIView(generics.CustomListAPIView):
     filterset_class = ReservationListFilter
 
     def get(self, *args, **kwargs):
-        resource_class = AdminReservationExportResource()
-        dataset = resource_class.export(self.filter_queryset(self.get_queryset()))
+        file_format = self.request.query_params.get("file_format", "xlsx")
+        if file_format not in EXPORT_FILE_FORMATS:
+            raise exceptions.ParseError({"file_format": BaseErrors.invalid_file_format})
+        return export_response(
+            self.filter_queryset(self.get_queryset()), file_format=file_format
+        )
+
+
+class AdminReservationExportJobCreateAPIView(AdminReservationExportListAPIView):
+    serializer_class = AdminExportJobSerializer
+    http_method_names = ["post", "options"]
 
-        result = HttpResponse(dataset.xlsx, content_type="text/xlsx")
-        result["Content-Disposition"] = 'attachment; filename="export_factors.xlsx"'
-        return result
+    def post(self, *args, **kwargs):
+        file_format = self.request.data.get("file_format", "xlsx")
+        if file_format not in EXPORT_FILE_FORMATS:
+            raise exceptions.ParseError({"file_format": BaseErrors.invalid_file_format})
+        job, created = enqueue_export_job(
+            self.filter_queryset(self.get_queryset()),
+            self.request.query_params,
+            file_format,
+            user=self.request.user,
+        )
+        return response.Response(
+            self.get_serializer(job).data,
+            status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
+        )
+
+
+class AdminReservationExportJobStatusAPIView(generics.CustomRetrieveAPIView):
+    permission_classes = [IsAuthenticatedPermission, IsAdminUserPermission]
+    versioning_class = BaseVersioning
+    serializer_class = AdminExportJobSerializer
+    queryset = ExportJobModel.objects.all()
+    object_name = "Export Job"
+
+
+class AdminReservationExportJobDownloadAPIView(generics.CustomRetrieveAPIView):
+    permission_classes = [IsAuthenticatedPermission, IsAdminUserPermission]
+    versioning_class = BaseVersioning
+    queryset = ExportJobModel.objects.filter(status=ExportJobModel.StatusOptions.DONE)
+    object_name = "Export Job"
+
+    def get(self, *args, **kwargs):
+        job = self.get_object()
+        return FileResponse(
+            job.file.open("rb"),
+            as_attachment=True,
+            filename=f"export_factors.{job.file_format}",
+        )
@@ -1,16 +1,28 @@
-from django.conf import settings
-
 from rest_framework import serializers, exceptions
 
+from django.conf import settings
+
+from app_doctor.models import DoctorDateTimeModel
+from app_doctor.services import annotate_is_reserved
 from app_reservation.models import ReservationModel
-from app_settings.models import SettingsModel, OTPManagerModel
+from app_reservation.services import (
+    acquire_slot_hold,
+    check_slot_hold,
+    consume_slot_hold,
+    get_otp_store,
+)
+from app_settings.models import OTPManagerModel
 
 from utils.serializers import CustomModelSerializer
 from utils.base_errors import BaseErrors
 from utils.functions import create_otp_code
-
-from redis_management.redis_manager import RedisManager
-import requests
+from utils.exceptions.core import SMSGatewayError
+from utils.exceptions.rest import (
+    ConflictException,
+    NotFoundObjectException,
+    SMSServiceUnavailableException,
+)
+from utils.sms import get_sms_client
 
 
 class UsersReservSendOTPSerializer(CustomModelSerializer):
@@ -20,59 +32,56 @@ class UsersReservSendOTPSerializer(CustomModelSerializer):
 
     def validate(self, attrs):
         otp_code = create_otp_code(5)
-        try:
-            settings_for_use_redis = SettingsModel.objects.get(
-                type=SettingsModel.TypeOptions.USE_REDIS_CACHE
-            )
-            if bool(int(settings_for_use_redis.value)):
-                self._send_otp_code_with_redis(otp_code, attrs["mobile_number"])
-            else:
-                self._send_otp_code_with_db(otp_code, attrs["mobile_number"])
-        except SettingsModel.DoesNotExist:
-            self._send_otp_code_with_db(otp_code, attrs["mobile_number"])
+        get_otp_store().issue(attrs["mobile_number"], otp_code)
+        self._send_sms(otp_code, attrs["mobile_number"])
         return attrs
 
-    def _send_otp_code_with_redis(self, otp_code, mobile_number):
-        redis_manager = RedisManager(mobile_number, "verify_otp_code")
-        if not redis_manager.exists():
-            redis_manager.create_and_set_otp_key(otp_code=otp_code)
-            requests.post(
-                "https://api2.ippanel.com/api/v1/sms/pattern/normal/send",
-                headers={
-                    "Content-Type": "application/json",
-                    "apikey": settings.MEDIANA_API_KEY,
-                },
-                json={
-                    "code": settings.SMS_SEND_CODE,
-                    "sender": "+983000505",
-                    "recipient": mobile_number,
-                    "variable": {"OTP": otp_code},
-                },
-            )
+    def _send_sms(self, otp_code, mobile_number):
+        try:
+            get_sms_client().send_otp(mobile_number, otp_code)
+        except SMSGatewayError:
+            raise SMSServiceUnavailableException()
 
-    def _send_otp_code_with_db(self, otp_code, mobile_number):
-        otp_object, created = OTPManagerModel.objects.get_or_create(
-            mobile_number=mobile_number
+
+class UsersSlotHoldSerializer(CustomModelSerializer):
+    class Meta:
+        model = ReservationModel
+        fields = (
+            "doctor",
+            "date",
+            "time",
+            "mobile_number",
         )
-        otp_object.otp_code = otp_code
-        otp_object.save()
-        requests.post(
-            "https://api2.ippanel.com/api/v1/sms/pattern/normal/send",
-            headers={
-                "Content-Type": "application/json",
-                "apikey": settings.MEDIANA_API_KEY,
-            },
-            json={
-                "code": settings.SMS_SEND_CODE,
-                "sender": "+983000505",
-                "recipient": mobile_number,
-                "variable": {"OTP": otp_code},
-            },
+        validators = []
+
+    def validate(self, attrs):
+        doctor, date, time = attrs["doctor"], attrs["date"], attrs["time"]
+        # the slot must be open for booking; its reservation is read in the same query
+        is_reserved = (
+            annotate_is_reserved(
+                DoctorDateTimeModel.objects.filter(
+                    doctor=doctor, date=date, time=time, is_active=True
+                )
+            )
+            .values_list("is_reserved", flat=True)
+            .first()
         )
+        if is_reserved is None:
+            raise NotFoundObjectException(object_name="Doctor DateTime")
+        if is_reserved:
+            raise ConflictException(BaseErrors.slot_already_reserved)
+        hold_token = acquire_slot_hold(doctor.id, date, time, attrs["mobile_number"])
+        if hold_token is None:
+            raise ConflictException(BaseErrors.slot_is_held)
+        return {
+            "hold_token": hold_token,
+            "expires_in": settings.SLOT_HOLD_TTL_SECONDS,
+        }
 
 
 class UsersReservationSerializer(CustomModelSerializer):
     otp = serializers.CharField(max_length=5, write_only=True, required=True)
+    hold_token = serializers.CharField(max_length=32, write_only=True, required=False)
 
     class Meta:
         model = ReservationModel
@@ -84,42 +93,24 @@ class UsersReservationSerializer(CustomModelSerializer):
             "full_name",
             "mobile_number",
             "otp",
+            "hold_token",
         )
+        # slot uniqueness is enforced by the database constraint (409 on conflict)
+        validators = []
 
     def validate(self, attrs):
-        is_valid = False
-        try:
-            settings_for_use_redis = SettingsModel.objects.get(
-                type=SettingsModel.TypeOptions.USE_REDIS_CACHE
-            )
-            if bool(int(settings_for_use_redis.value)):
-                is_valid = self._validate_with_redis(
-                    attrs["otp"], attrs["mobile_number"]
-                )
-            else:
-                is_valid = self._validate_with_db(attrs["otp"], attrs["mobile_number"])
-        except SettingsModel.DoesNotExist:
-            is_valid = self._validate_with_db(attrs["otp"], attrs["mobile_number"])
-
-        if is_valid:
-            attrs.pop("otp")
-            return attrs
-        else:
+        slot = (attrs["doctor"].id, attrs["date"], attrs["time"])
+        hold_token = attrs.pop("hold_token", None)
+        # a slot held by someone else must not cost the booker their OTP code
+        if not check_slot_hold(*slot, hold_token):
+            raise ConflictException(BaseErrors.slot_is_held)
+
+        status = get_otp_store().verify(attrs["mobile_number"], attrs.pop("otp"))
+        if status == OTPManagerModel.VerifyStatusOptions.LOCKED:
+            raise exceptions.ParseError({"otp": BaseErrors.too_many_wrong_otp_attempts})
+        if status != OTPManagerModel.VerifyStatusOptions.VALID:
             raise exceptions.ParseError({"otp": BaseErrors.invalid_otp_code})
 
-    def _validate_with_redis(self, otp_code, mobile_number):
-        redis_manager = RedisManager("mobile_number", "verify_otp_code")
-        is_valid = redis_manager.validate("otp")
-        if is_valid:
-            redis_manager.delete()
-        return is_valid
-
-    def _validate_with_db(self, otp_code, mobile_number):
-        try:
-            otp_object = OTPManagerModel.objects.get(mobile_number=mobile_number)
-            if otp_object.otp_code == otp_code:
-                otp_object.delete()
-                return True
-            return False
-        except OTPManagerModel.DoesNotExist:
-            return False
+        if not consume_slot_hold(*slot, hold_token):
+            raise ConflictException(BaseErrors.slot_is_held)
+        return attrs
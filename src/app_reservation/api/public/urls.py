@@ -10,6 +10,11 @@ urlpatterns = [
         UsersReservationSendOTPAPIView.as_view(),
         name="send_otp",
     ),
+    path(
+        "hold/",
+        UsersSlotHoldAPIView.as_view(),
+        name="hold_slot",
+    ),
     path(
         "create/",
         UsersReservationCreateAPIView.as_view(),
@@ -1 +1,5 @@
-from .reservation import UsersReservationCreateAPIView, UsersReservationSendOTPAPIView
+from .reservation import (
+    UsersReservationCreateAPIView,
+    UsersReservationSendOTPAPIView,
+    UsersSlotHoldAPIView,
+)
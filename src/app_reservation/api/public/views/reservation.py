@@ -1,20 +1,34 @@
 from app_reservation.api.public.serializers.reservation import (
     UsersReservSendOTPSerializer,
     UsersReservationSerializer,
+    UsersSlotHoldSerializer,
 )
 
+from utils.base_errors import BaseErrors
 from utils.views import generics
 from utils.views.versioning import BaseVersioning
 from utils.views.permissions import AllowAnyPermission
+from utils.views.throttles import ClientIPRateThrottle, MobileNumberRateThrottle
 
 
 class UsersReservationSendOTPAPIView(generics.CustomGenericPostAPIView):
     permission_classes = [AllowAnyPermission]
     versioning = BaseVersioning
     serializer_class = UsersReservSendOTPSerializer
+    throttle_classes = [ClientIPRateThrottle, MobileNumberRateThrottle]
+    throttle_scope = "send_otp"
+
+
+class UsersSlotHoldAPIView(generics.CustomGenericPostAPIView):
+    permission_classes = [AllowAnyPermission]
+    versioning = BaseVersioning
+    serializer_class = UsersSlotHoldSerializer
+    throttle_classes = [ClientIPRateThrottle, MobileNumberRateThrottle]
+    throttle_scope = "slot_hold"
 
 
 class UsersReservationCreateAPIView(generics.CustomCreateAPIView):
     permission_classes = [AllowAnyPermission]
     versioning = BaseVersioning
     serializer_class = UsersReservationSerializer
+    conflict_detail = BaseErrors.slot_already_reserved
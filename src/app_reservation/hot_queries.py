@@ -0,0 +1,23 @@
+from app_reservation.api.admin.views import AdminReservationListAPIView
+
+from utils.db.hot_queries import register_hot_query
+
+from datetime import date, timedelta
+
+
+@register_hot_query("admin reservation list")
+def admin_reservation_list():
+    return AdminReservationListAPIView.queryset.all()
+
+
+@register_hot_query("admin reservation list by date range")
+def admin_reservation_list_by_date_range():
+    today = date.today()
+    return AdminReservationListAPIView.queryset.filter(
+        date__gte=today, date__lte=today + timedelta(days=7)
+    )
+
+
+@register_hot_query("admin reservation list by doctor")
+def admin_reservation_list_by_doctor():
+    return AdminReservationListAPIView.queryset.filter(doctor=1)
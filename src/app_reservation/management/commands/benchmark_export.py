@@ -0,0 +1,105 @@
+from django.core.management.base import BaseCommand
+
+from app_doctor.models import DoctorModel
+from app_reservation.api.admin.serializers.reservation import (
+    AdminReservationExportResource,
+)
+from app_reservation.models import ReservationModel
+from app_reservation.services import export_response
+
+from utils.benchmark import isolated_database
+
+from datetime import date, time as dt_time, timedelta
+import resource
+import time
+import tracemalloc
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark reservation exports (legacy tablib vs streaming xlsx/csv) for "
+        "time to first byte, total time and peak memory on a throwaway database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=100000)
+        parser.add_argument("--doctors", type=int, default=20)
+        parser.add_argument(
+            "--modes",
+            default="csv,xlsx,legacy",
+            help="Comma separated modes, ordered from the lightest to the heaviest.",
+        )
+
+    def handle(self, *args, **options):
+        with isolated_database():
+            self._seed(options["rows"], options["doctors"])
+            queryset = ReservationModel.objects.order_by("date", "time")
+            for mode in options["modes"].split(","):
+                self._report(options["rows"], mode, self._run(mode, queryset.all()))
+
+    def _run(self, mode, queryset):
+        # time and memory are measured in separate passes, tracing skews timings
+        result = self._consume(mode, queryset.all())
+        tracemalloc.start()
+        self._consume(mode, queryset.all())
+        result["peak_traced_mb"] = tracemalloc.get_traced_memory()[1] / 2**20
+        tracemalloc.stop()
+        result["max_rss_mb"] = (
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2**10
+        )
+        return result
+
+    @staticmethod
+    def _consume(mode, queryset):
+        started = time.perf_counter()
+        first_byte = None
+        size = 0
+        if mode == "legacy":
+            content = AdminReservationExportResource().export(queryset).xlsx
+            first_byte = time.perf_counter()
+            size = len(content)
+        else:
+            response = export_response(queryset, file_format=mode)
+            for chunk in response.streaming_content:
+                if first_byte is None:
+                    first_byte = time.perf_counter()
+                size += len(chunk)
+            response.close()
+        return {
+            "ttfb": first_byte - started,
+            "total": time.perf_counter() - started,
+            "bytes": size,
+        }
+
+    def _seed(self, rows, doctors_count):
+        doctors = DoctorModel.objects.bulk_create(
+            DoctorModel(
+                name=f"Doctor {index}",
+                phone="09120000000",
+                national_code="0000000000",
+                address="-",
+                field="General",
+            )
+            for index in range(doctors_count)
+        )
+        ReservationModel.objects.bulk_create(
+            (
+                ReservationModel(
+                    doctor=doctors[index % doctors_count],
+                    date=date(2024, 1, 1) + timedelta(days=index // 24),
+                    time=dt_time(index % 24),
+                    full_name=f"Patient {index}",
+                    mobile_number="09120000000",
+                )
+                for index in range(rows)
+            ),
+            batch_size=2000,
+        )
+
+    def _report(self, rows, mode, result):
+        self.stdout.write(
+            f"{rows:>9} rows | {mode:<6} | ttfb {result['ttfb'] * 1000:>9.1f} ms | "
+            f"total {result['total'] * 1000:>9.1f} ms | "
+            f"peak {result['peak_traced_mb']:>7.1f} MB traced, "
+            f"{result['max_rss_mb']:>7.1f} MB max rss | {result['bytes']} bytes"
+        )
@@ -0,0 +1,65 @@
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+
+from app_reservation.api.public.views import UsersReservationSendOTPAPIView
+
+from utils.rate_limit import get_rate_limiter
+
+from rest_framework.test import APIRequestFactory
+import time
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the per request overhead of the send-otp rate limiter for the "
+        "in-memory and Redis token buckets, against a run without throttles."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=20000)
+        parser.add_argument("--numbers", type=int, default=1000)
+        parser.add_argument("--backends", default="none,memory,redis")
+
+    def handle(self, *args, **options):
+        for name in options["backends"].split(","):
+            requests = self._build_requests(options["requests"], options["numbers"])
+            with override_settings(RATE_LIMIT_USE_REDIS=name == "redis"):
+                seconds = self._run(requests, throttled=name != "none")
+                metrics = get_rate_limiter().metrics.snapshot()
+            self._report(name, seconds, len(requests), metrics)
+
+    @staticmethod
+    def _build_requests(count, numbers):
+        factory = APIRequestFactory()
+        return [
+            factory.post(
+                "/send-otp/",
+                {"mobile_number": f"0912{index % numbers:07d}"},
+                format="json",
+                REMOTE_ADDR=f"10.0.{index % 250}.{index % 200}",
+            )
+            for index in range(count)
+        ]
+
+    @staticmethod
+    def _run(requests, throttled):
+        view = UsersReservationSendOTPAPIView()
+        view.format_kwarg = None
+        started = time.perf_counter()
+        for request in requests:
+            request = view.initialize_request(request)
+            if not throttled:
+                request.data
+                continue
+            for throttle in view.get_throttles():
+                if not throttle.allow_request(request, view):
+                    break
+        return time.perf_counter() - started
+
+    def _report(self, name, seconds, count, metrics):
+        self.stdout.write(
+            f"{name:<6} | {count} requests | {seconds / count * 1e6:>8.1f} us/request | "
+            f"allowed {sum(metrics['allowed'].values()):>6} | "
+            f"rejected {sum(metrics['rejected'].values()):>6} | "
+            f"redis fallbacks {metrics['fallbacks']}"
+        )
@@ -0,0 +1,270 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, transaction
+
+from app_doctor.models import DoctorModel, DoctorDateTimeModel
+from app_doctor.services import (
+    DOCTORS_NAMESPACE,
+    doctor_slots_namespaces,
+    expand_schedule,
+    rebuild_availability,
+)
+from app_reservation.models import ReservationModel
+
+from utils.cache import bump_namespaces
+from utils.db.validators import PhoneNumberRegexValidator
+
+from datetime import date, datetime, time, timedelta, timezone
+from itertools import islice
+import multiprocessing
+import random
+import time as timer
+
+FIELDS = ("General", "Eye", "Heart", "Skin", "Dental", "Child", "Bone", "Nerve")
+MOBILE_PREFIXES = ("0912", "0919", "0935", "0936", "0901", "0990")
+SHIFTS = ((time(8), time(13)), (time(9), time(14)), (time(16), time(21)))
+SLOT_MINUTES = (15, 20, 30)
+
+
+def doctor_profile(seed, doctor_index) -> dict:
+    """
+    Returns the weekly schedule of a synthetic doctor: three to six Jalali working
+    days (Friday off), a morning or an evening shift and a slot length. Derived
+    from the seed and the doctor index only, so the data does not depend on how
+    the doctors are split between workers.
+    """
+    rng = random.Random(f"{seed}:profile:{doctor_index}")
+    start_time, end_time = rng.choice(SHIFTS)
+    return {
+        "weekdays": sorted(rng.sample(range(6), rng.randint(3, 6))),
+        "start_time": start_time,
+        "end_time": end_time,
+        "slot_minutes": rng.choice(SLOT_MINUTES),
+    }
+
+
+def fill_ratios(slot_counts, target, skew) -> list:
+    """
+    Returns the share of reserved slots of each doctor: proportional to a Zipf
+    like popularity (1 / rank ** skew), capped at 1 and scaled so the expected
+    total is `target` reservations.
+    """
+    weights = [1 / (rank + 1) ** skew for rank in range(len(slot_counts))]
+
+    def expected(scale):
+        return sum(
+            min(1.0, scale * weight) * count
+            for weight, count in zip(weights, slot_counts)
+        )
+
+    low, high = 0.0, 1.0
+    while expected(high) < target and high < 1e12:
+        high *= 2
+    for _ in range(60):
+        middle = (low + high) / 2
+        low, high = (middle, high) if expected(middle) < target else (low, middle)
+    return [min(1.0, high * weight) for weight in weights]
+
+
+def generate_doctor_rows(task) -> tuple:
+    """
+    Inserts the slots and reservations of one doctor in batches, in a single
+    transaction. Runs in the worker processes.
+
+    Returns:
+    -------
+    tuple
+        The number of `(slots, reservations)` inserted.
+    """
+    doctor_id, doctor_index, fill, options = task
+    rng = random.Random(f"{options['seed']}:rows:{doctor_index}")
+    deleted_ratio = options["deleted_ratio"]
+    patients = options["patients"]
+    slots_count = reservations_count = 0
+
+    def rows():
+        for slot_date, slot_time in expand_schedule(
+            options["date_from"],
+            options["date_to"],
+            [doctor_profile(options["seed"], doctor_index)],
+        ):
+            # soft deleted rows are stamped the day before their slot
+            deleted_at = datetime.combine(
+                slot_date - timedelta(days=1), slot_time, tzinfo=timezone.utc
+            )
+            slot_deleted = rng.random() < deleted_ratio
+            slot = DoctorDateTimeModel(
+                doctor_id=doctor_id,
+                date=slot_date,
+                time=slot_time,
+                is_deleted=slot_deleted,
+                deleted_at=deleted_at if slot_deleted else None,
+            )
+            reservation = None
+            if not slot_deleted and rng.random() < fill:
+                # cancelled reservations keep their row, soft deleted
+                reservation_deleted = rng.random() < deleted_ratio
+                patient = int(patients * rng.random() ** 2)
+                reservation = ReservationModel(
+                    doctor_id=doctor_id,
+                    date=slot_date,
+                    time=slot_time,
+                    full_name=f"Patient {patient}",
+                    mobile_number=(
+                        f"{MOBILE_PREFIXES[patient % len(MOBILE_PREFIXES)]}"
+                        f"{patient % 10_000_000:07d}"
+                    ),
+                    is_deleted=reservation_deleted,
+                    deleted_at=deleted_at if reservation_deleted else None,
+                )
+            yield slot, reservation
+
+    generated = rows()
+    with transaction.atomic():
+        while batch := list(islice(generated, options["batch_size"])):
+            DoctorDateTimeModel.objects.bulk_create([slot for slot, _ in batch])
+            reservations = [reservation for _, reservation in batch if reservation]
+            ReservationModel.objects.bulk_create(reservations)
+            slots_count += len(batch)
+            reservations_count += len(reservations)
+    return slots_count, reservations_count
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate deterministic synthetic doctors, slots and reservations for load "
+        "testing: Jalali weekly schedules, popularity skewed reservations and a "
+        "soft deleted fraction, inserted in batches by parallel workers."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--doctors", type=int, default=500)
+        parser.add_argument(
+            "--date-from", type=date.fromisoformat, default=date(2024, 3, 20)
+        )
+        parser.add_argument("--days", type=int, default=365)
+        parser.add_argument(
+            "--reservations",
+            type=int,
+            default=1_000_000,
+            help="Target number of reservations, capped by the generated slots.",
+        )
+        parser.add_argument(
+            "--skew",
+            type=float,
+            default=1.1,
+            help="Zipf exponent of the doctor popularity, 0 for uniform.",
+        )
+        parser.add_argument(
+            "--patients",
+            type=int,
+            default=200_000,
+            help="Number of distinct patients (mobile numbers).",
+        )
+        parser.add_argument("--deleted-ratio", type=float, default=0.05)
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Worker processes; useful on PostgreSQL/MySQL, SQLite serializes writes.",
+        )
+        parser.add_argument(
+            "--skip-availability",
+            action="store_true",
+            help="Do not rebuild the doctor calendar afterwards.",
+        )
+        parser.add_argument(
+            "--append",
+            action="store_true",
+            help="Allow running on a database that already has doctors.",
+        )
+
+    def handle(self, *args, **options):
+        if not options["append"] and DoctorModel.objects.all_objects().exists():
+            raise CommandError(
+                "The database already has doctors, use --append to add to them."
+            )
+        self._check_validators()
+        started = timer.perf_counter()
+        options["date_to"] = options["date_from"] + timedelta(days=options["days"] - 1)
+
+        doctors = DoctorModel.objects.bulk_create(
+            DoctorModel(
+                name=f"Synthetic Doctor {index}",
+                phone=f"0912{index % 10_000_000:07d}",
+                national_code=f"{index:010d}",
+                address=f"Clinic {index % 50}",
+                field=FIELDS[index % len(FIELDS)],
+            )
+            for index in range(options["doctors"])
+        )
+        slot_counts = [
+            sum(
+                1
+                for _ in expand_schedule(
+                    options["date_from"],
+                    options["date_to"],
+                    [doctor_profile(options["seed"], index)],
+                )
+            )
+            for index in range(len(doctors))
+        ]
+        fills = fill_ratios(
+            slot_counts,
+            options["reservations"] / (1 - options["deleted_ratio"]),
+            options["skew"],
+        )
+        worker_options = {
+            key: options[key]
+            for key in (
+                "seed",
+                "date_from",
+                "date_to",
+                "patients",
+                "deleted_ratio",
+                "batch_size",
+            )
+        }
+        tasks = [
+            (doctor.id, index, fills[index], worker_options)
+            for index, doctor in enumerate(doctors)
+        ]
+
+        totals = [0, 0]
+        for slots_count, reservations_count in self._run(tasks, options["workers"]):
+            totals[0] += slots_count
+            totals[1] += reservations_count
+        self.stdout.write(
+            f"Inserted {len(doctors)} doctors, {totals[0]} slots and {totals[1]} "
+            f"reservations in {timer.perf_counter() - started:.1f} s."
+        )
+
+        if not options["skip_availability"]:
+            written = rebuild_availability()
+            self.stdout.write(f"Rebuilt {written} calendar slot(s).")
+        bump_namespaces(
+            DOCTORS_NAMESPACE, *doctor_slots_namespaces(*(d.id for d in doctors))
+        )
+        self.stdout.write(f"Done in {timer.perf_counter() - started:.1f} s.")
+
+    @staticmethod
+    def _check_validators():
+        # every generated number is a prefix plus 7 digits: checking the bounds of
+        # each prefix once covers all of them without a per row validator call
+        phone_field = DoctorModel._meta.get_field("phone")
+        for prefix in MOBILE_PREFIXES:
+            for number in (f"{prefix}0000000", f"{prefix}9999999"):
+                PhoneNumberRegexValidator(number)
+                phone_field.run_validators(number)
+
+    def _run(self, tasks, workers):
+        if workers <= 1:
+            for task in tasks:
+                yield generate_doctor_rows(task)
+            return
+        # forked workers must open their own database connections
+        connections.close_all()
+        context = multiprocessing.get_context("fork")
+        with context.Pool(workers) as pool:
+            yield from pool.imap_unordered(generate_doctor_rows, tasks)
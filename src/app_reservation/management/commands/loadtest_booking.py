@@ -0,0 +1,272 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from utils.loadtest import AsyncHTTPClient, SMSStubServer, StepStats
+
+import asyncio
+import json
+import os
+import random
+import shlex
+import subprocess
+import time
+
+STEPS = ("doctor_list", "slot_list", "hold", "send_otp", "otp_delivery", "create")
+
+
+class Command(BaseCommand):
+    help = (
+        "Replay the booking funnel (list doctors, list slots, send-otp, create "
+        "reservation) from concurrent asyncio virtual users against a running "
+        "server, with a local ippanel stub capturing the OTP codes. Reports "
+        "throughput, error rates (409 conflicts on hot slots) and latency "
+        "histograms per step."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+        parser.add_argument("--api-prefix", default="/api/v1/public")
+        parser.add_argument("--users", type=int, default=20)
+        parser.add_argument("--duration", type=float, default=60, help="Seconds.")
+        parser.add_argument(
+            "--ramp-up", type=float, default=5, help="Seconds to start all users."
+        )
+        parser.add_argument(
+            "--hot-ratio",
+            type=float,
+            default=0.5,
+            help="Share of the bookings aimed at the first doctor and its first free slots.",
+        )
+        parser.add_argument("--hot-slots", type=int, default=3)
+        parser.add_argument(
+            "--hold", action="store_true", help="Hold the slot before send-otp."
+        )
+        parser.add_argument("--stub-host", default="127.0.0.1")
+        parser.add_argument("--stub-port", type=int, default=8025)
+        parser.add_argument(
+            "--stub-delay-ms",
+            type=float,
+            default=0,
+            help="Latency added by the SMS stub, to emulate the real gateway.",
+        )
+        parser.add_argument(
+            "--server-command",
+            default=None,
+            help=(
+                "Start the server under test with this command (e.g. "
+                '"gunicorn config.wsgi:application -w 4 -b 127.0.0.1:8000"), '
+                "configured to send SMS to the stub and with the per ip rate "
+                "limits raised. Otherwise it must already run with "
+                "SMS_BACKEND=utils.sms.backends.IPPanelBackend, SMS_GATEWAY_URL "
+                "pointing at the stub and OTP_SEND_RATE_PER_IP and "
+                "SLOT_HOLD_RATE_PER_IP above the booking rate of the test."
+            ),
+        )
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--output", default=None, help="Write the JSON report to this file."
+        )
+
+    def handle(self, *args, **options):
+        report = asyncio.run(self._main(options))
+        for step, summary in report["steps"].items():
+            self._report(step, summary)
+        funnel = report["funnel"]
+        self.stdout.write(
+            f"bookings {funnel['booked']} | conflicts {funnel['conflicts']} | "
+            f"failed {funnel['failed']} | {funnel['bookings_per_second']} bookings/s"
+        )
+        if options["output"]:
+            with open(options["output"], "w") as file:
+                json.dump(report, file, indent=2)
+
+    async def _main(self, options):
+        self.options = options
+        self.stub = SMSStubServer(
+            options["stub_host"],
+            options["stub_port"],
+            delay=options["stub_delay_ms"] / 1000,
+        )
+        await self.stub.start()
+        self.stdout.write(f"SMS stub listening on {self.stub.url}")
+        server = self._start_server(options["server_command"])
+        try:
+            if server is not None:
+                await self._wait_for_server()
+            self.stats = {step: StepStats() for step in STEPS}
+            self.funnel = {"booked": 0, "conflicts": 0, "failed": 0, "no_free_slot": 0}
+            started = time.perf_counter()
+            deadline = time.monotonic() + options["ramp_up"] + options["duration"]
+            await asyncio.gather(
+                *(self._user(index, deadline) for index in range(options["users"]))
+            )
+            seconds = time.perf_counter() - started
+        finally:
+            if server is not None:
+                server.terminate()
+                server.wait()
+            await self.stub.stop()
+
+        return {
+            "meta": {
+                "base_url": options["base_url"],
+                "users": options["users"],
+                "duration_s": round(seconds, 2),
+                "hot_ratio": options["hot_ratio"],
+                "hold": options["hold"],
+                "sms_messages": self.stub.messages,
+            },
+            "funnel": {
+                **self.funnel,
+                "bookings_per_second": round(self.funnel["booked"] / seconds, 2),
+            },
+            "steps": {
+                step: stats.summary(seconds)
+                for step, stats in self.stats.items()
+                if stats.latencies_ms
+            },
+        }
+
+    def _start_server(self, command):
+        if not command:
+            return None
+        env = {
+            **os.environ,
+            "SMS_BACKEND": "utils.sms.backends.IPPanelBackend",
+            "SMS_GATEWAY_URL": self.stub.url,
+            # every simulated user shares the load tester's ip
+            "OTP_SEND_RATE_PER_IP": "1000000/hour",
+            "SLOT_HOLD_RATE_PER_IP": "1000000/hour",
+        }
+        return subprocess.Popen(shlex.split(command), env=env)
+
+    async def _wait_for_server(self, timeout=30):
+        client = AsyncHTTPClient(self.options["base_url"], timeout=2)
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                await client.request(
+                    "GET", f"{self.options['api_prefix']}/doctor/list/"
+                )
+                await client.close()
+                return
+            except (OSError, asyncio.TimeoutError):
+                await asyncio.sleep(0.5)
+        raise CommandError(f"The server did not answer within {timeout} seconds.")
+
+    async def _user(self, index, deadline):
+        options = self.options
+        await asyncio.sleep(options["ramp_up"] * index / max(options["users"], 1))
+        client = AsyncHTTPClient(options["base_url"])
+        rng = random.Random(f"{options['seed']}:{index}")
+        iteration = 0
+        try:
+            while time.monotonic() < deadline:
+                await self._funnel(client, rng, index, iteration)
+                iteration += 1
+        finally:
+            await client.close()
+
+    async def _step(self, step, client, method, path, data=None):
+        started = time.perf_counter()
+        try:
+            status, body = await client.request(
+                method, f"{self.options['api_prefix']}{path}", data
+            )
+        except (OSError, asyncio.TimeoutError, ValueError) as error:
+            await client.close()
+            self.stats[step].record(started, error=type(error).__name__)
+            return None, None
+        self.stats[step].record(started, status=status)
+        return status, body
+
+    async def _funnel(self, client, rng, index, iteration):
+        options = self.options
+        hot = rng.random() < options["hot_ratio"]
+        # a fresh number per booking keeps the captured codes of concurrent
+        # bookings apart and the per mobile rate limits out of the way
+        mobile_number = f"09{(index * 1_000_000 + iteration) % 10**9:09d}"
+
+        status, body = await self._step("doctor_list", client, "GET", "/doctor/list/")
+        doctors = self._results(body) if status == 200 else []
+        if not doctors:
+            self.funnel["failed"] += 1
+            return
+        doctor = doctors[0] if hot else rng.choice(doctors)
+
+        status, body = await self._step(
+            "slot_list", client, "GET", f"/doctor/datetime/list/?doctor={doctor['id']}"
+        )
+        free = [
+            slot
+            for slot in (self._results(body) if status == 200 else [])
+            if slot.get("is_active")
+        ]
+        if not free:
+            self.funnel["no_free_slot"] += 1
+            return
+        slot = rng.choice(free[: options["hot_slots"]] if hot else free)
+        booking = {
+            "doctor": doctor["id"],
+            "date": slot["date"],
+            "time": slot["time"],
+            "mobile_number": mobile_number,
+        }
+
+        if options["hold"]:
+            status, body = await self._step(
+                "hold", client, "POST", "/reservations/hold/", booking
+            )
+            if status != 200:
+                self.funnel["conflicts" if status == 409 else "failed"] += 1
+                return
+            booking["hold_token"] = body["hold_token"]
+
+        status, _ = await self._step(
+            "send_otp",
+            client,
+            "POST",
+            "/reservations/send-otp/",
+            {"mobile_number": mobile_number},
+        )
+        if status != 200:
+            self.funnel["failed"] += 1
+            return
+        started = time.perf_counter()
+        try:
+            otp = await self.stub.wait_for_code(mobile_number)
+        except asyncio.TimeoutError:
+            self.stats["otp_delivery"].record(started, error="TimeoutError")
+            self.funnel["failed"] += 1
+            return
+        self.stats["otp_delivery"].record(started)
+
+        status, _ = await self._step(
+            "create",
+            client,
+            "POST",
+            "/reservations/create/",
+            {**booking, "full_name": f"Load Test {index}", "otp": otp},
+        )
+        if status == 201:
+            self.funnel["booked"] += 1
+        elif status == 409:
+            # the slot was booked first by another user (IntegrityError on the
+            # unique slot constraint, or an active hold)
+            self.funnel["conflicts"] += 1
+        else:
+            self.funnel["failed"] += 1
+
+    @staticmethod
+    def _results(body):
+        if isinstance(body, dict):
+            return body.get("results", [])
+        return body or []
+
+    def _report(self, step, summary):
+        self.stdout.write(
+            f"{step:<13} | {summary['requests']:>7} req | "
+            f"{summary['throughput_rps']:>8.1f} req/s | "
+            f"errors {summary['error_rate'] * 100:>6.2f}% | "
+            f"p50 {summary['p50_ms']:>8.1f} ms | p95 {summary['p95_ms']:>8.1f} ms | "
+            f"p99 {summary['p99_ms']:>8.1f} ms | {summary['statuses']}"
+        )
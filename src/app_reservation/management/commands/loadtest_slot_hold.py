@@ -0,0 +1,121 @@
+from django.core.management.base import BaseCommand
+from django.db import IntegrityError, OperationalError, connection, transaction
+
+from app_doctor.models import DoctorModel
+from app_reservation.models import ReservationModel
+from app_reservation.services.slot_hold import (
+    DatabaseSlotHoldBackend,
+    RedisSlotHoldBackend,
+    acquire_slot_hold,
+    consume_slot_hold,
+)
+
+from utils.benchmark import isolated_database
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, time as dt_time
+from statistics import median, quantiles
+import threading
+import time
+
+HOLD_BACKENDS = {
+    "db": DatabaseSlotHoldBackend,
+    "redis": RedisSlotHoldBackend,
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Load test concurrent bookers racing for the same doctor slots, with and "
+        "without slot holds, on a throwaway database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--bookers", type=int, default=50)
+        parser.add_argument("--slots", type=int, default=5)
+        parser.add_argument("--backend", choices=HOLD_BACKENDS, default="db")
+        parser.add_argument("--modes", default="direct,hold")
+
+    def handle(self, *args, **options):
+        with isolated_database():
+            doctor = DoctorModel.objects.create(
+                name="Doctor",
+                phone="09120000000",
+                national_code="0000000000",
+                address="-",
+                field="General",
+            )
+            backend = HOLD_BACKENDS[options["backend"]]()
+            for day, mode in enumerate(options["modes"].split(","), start=1):
+                slots = [
+                    (doctor.id, date(2024, 1, day), dt_time(hour))
+                    for hour in range(options["slots"])
+                ]
+                self._report(mode, self._run(mode, slots, options["bookers"], backend))
+
+    def _run(self, mode, slots, bookers, backend):
+        barrier = threading.Barrier(bookers)
+        self._inserts = 0
+        self._lock = threading.Lock()
+        book = self._book_with_hold if mode == "hold" else self._book_directly
+
+        def booker(index):
+            doctor_id, slot_date, slot_time = slots[index % len(slots)]
+            barrier.wait()
+            started = time.perf_counter()
+            try:
+                outcome = book(doctor_id, slot_date, slot_time, index, backend)
+            except OperationalError:
+                outcome = "error"
+            finally:
+                connection.close()
+            return outcome, time.perf_counter() - started
+
+        with ThreadPoolExecutor(max_workers=bookers) as executor:
+            results = list(executor.map(booker, range(bookers)))
+        latencies = [latency for _, latency in results]
+        outcomes = [outcome for outcome, _ in results]
+        return {
+            "booked": outcomes.count("booked"),
+            "conflict": outcomes.count("conflict"),
+            "error": outcomes.count("error"),
+            "inserts": self._inserts,
+            "p50": median(latencies),
+            "p95": quantiles(latencies, n=20)[-1] if len(latencies) > 1 else 0,
+        }
+
+    def _insert(self, doctor_id, slot_date, slot_time, index):
+        with self._lock:
+            self._inserts += 1
+        try:
+            with transaction.atomic():
+                ReservationModel.objects.create(
+                    doctor_id=doctor_id,
+                    date=slot_date,
+                    time=slot_time,
+                    full_name=f"Patient {index}",
+                    mobile_number="09120000000",
+                )
+        except IntegrityError:
+            return "conflict"
+        return "booked"
+
+    def _book_directly(self, doctor_id, slot_date, slot_time, index, backend):
+        return self._insert(doctor_id, slot_date, slot_time, index)
+
+    def _book_with_hold(self, doctor_id, slot_date, slot_time, index, backend):
+        token = acquire_slot_hold(
+            doctor_id, slot_date, slot_time, "09120000000", backend=backend
+        )
+        if token is None or not consume_slot_hold(
+            doctor_id, slot_date, slot_time, token, backend=backend
+        ):
+            return "conflict"
+        return self._insert(doctor_id, slot_date, slot_time, index)
+
+    def _report(self, mode, result):
+        self.stdout.write(
+            f"{mode:<6} | booked {result['booked']:>4} | conflict {result['conflict']:>4} | "
+            f"error {result['error']:>4} | reservation inserts {result['inserts']:>4} | "
+            f"p50 {result['p50'] * 1000:>8.1f} ms | p95 {result['p95'] * 1000:>8.1f} ms"
+        )
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from app_reservation.models import ExportJobModel
+
+
+class Command(BaseCommand):
+    help = "Delete finished export jobs older than EXPORT_FILE_TTL_SECONDS and their files."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=100)
+
+    def handle(self, *args, **options):
+        total = 0
+        while deleted := ExportJobModel.objects.purge_expired(options["batch_size"]):
+            total += deleted
+        self.stdout.write(f"Purged {total} expired export job(s).")
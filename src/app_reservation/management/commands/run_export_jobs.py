@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+
+from app_reservation.models import ExportJobModel
+from app_reservation.services import render_export_job
+
+import time
+
+
+class Command(BaseCommand):
+    help = "Run the background worker that renders queued reservation exports."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=2.0,
+            help="Seconds to sleep when no export job is pending.",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Render the currently pending jobs and exit.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            while True:
+                job = ExportJobModel.objects.claim_next()
+                if job is not None:
+                    render_export_job(job)
+                    self.stdout.write(f"Export job {job.pk}: {job.status}")
+                    continue
+                if options["once"]:
+                    break
+                time.sleep(options["interval"])
+        except KeyboardInterrupt:
+            pass
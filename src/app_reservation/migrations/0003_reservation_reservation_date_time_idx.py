@@ -0,0 +1,22 @@
+# Generated by Django 5.1.2 on 2026-10-18 00:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app_doctor", "0002_doctor_doctor_created_at_idx_and_more"),
+        ("app_reservation", "0002_exportjob"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="reservation",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["date", "time", "id"],
+                name="reservation_date_time_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.1.2 on 2026-10-18 00:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app_doctor", "0003_alter_doctordatetime_unique_together_and_more"),
+        ("app_reservation", "0003_reservation_reservation_date_time_idx"),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name="reservation",
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name="reservation",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("is_deleted", False)),
+                fields=("doctor", "date", "time"),
+                name="unique_reservation_slot_if_not_delete",
+            ),
+        ),
+    ]
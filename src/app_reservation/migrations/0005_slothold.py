@@ -0,0 +1,55 @@
+# Generated by Django 5.1.2 on 2026-10-18 00:07
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app_doctor", "0003_alter_doctordatetime_unique_together_and_more"),
+        ("app_reservation", "0004_alter_reservation_unique_together_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SlotHold",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField(verbose_name="Date")),
+                ("time", models.TimeField(verbose_name="Start time")),
+                ("token", models.CharField(max_length=32, verbose_name="Token")),
+                (
+                    "mobile_number",
+                    models.CharField(max_length=64, verbose_name="Mobile number"),
+                ),
+                ("expires_at", models.DateTimeField(verbose_name="Expire Time")),
+                (
+                    "doctor",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="doctor_slot_holds",
+                        to="app_doctor.doctor",
+                        verbose_name="Doctor",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Slot Hold",
+                "verbose_name_plural": "Slot Holds",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("doctor", "date", "time"), name="unique_slot_hold"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.1.2 on 2026-10-18 00:45
+
+import app_reservation.models.export_job
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app_reservation", "0005_slothold"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="exportjob",
+            name="file",
+            field=models.FileField(
+                blank=True,
+                storage=app_reservation.models.export_job.export_storage,
+                upload_to=app_reservation.models.export_job.export_upload_to,
+                verbose_name="File",
+            ),
+        ),
+    ]
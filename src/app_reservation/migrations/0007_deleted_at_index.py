@@ -0,0 +1,20 @@
+# Generated by Django 5.1.2 on 2026-10-18 00:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app_reservation", "0006_export_job_private_storage"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="reservation",
+            name="deleted_at",
+            field=models.DateTimeField(
+                blank=True, db_index=True, null=True, verbose_name="Deleted Time"
+            ),
+        ),
+    ]
@@ -1 +1,3 @@
 from .reservation import Reservation as ReservationModel
+from .export_job import ExportJob as ExportJobModel
+from .slot_hold import SlotHold as SlotHoldModel
@@ -0,0 +1,195 @@
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage
+from django.db import models, transaction
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from utils.db.models import AbstractDateModel
+
+from datetime import timedelta
+import os
+import secrets
+
+
+class ExportFileStorage(FileSystemStorage):
+    """
+    Storage of the rendered exports: the private EXPORT_ROOT directory, without
+    a public URL.
+    """
+
+    @property
+    def base_location(self):
+        return settings.EXPORT_ROOT
+
+    @property
+    def location(self):
+        return os.path.abspath(self.base_location)
+
+    @property
+    def base_url(self):
+        return None
+
+
+def export_storage():
+    return ExportFileStorage()
+
+
+def export_upload_to(instance, filename):
+    # unguessable names, artifacts are only reachable through the download view
+    return f"reservations/{secrets.token_urlsafe(24)}{os.path.splitext(filename)[1]}"
+
+
+class ExportJobManager(models.Manager):
+    """
+    Manager for queueing export jobs and claiming them for rendering.
+
+    A running job is leased for EXPORT_JOB_LEASE_SECONDS from its `started_at`:
+    past the lease its worker is presumed dead, the job can be claimed again and
+    is no longer reused for new requests.
+    """
+
+    def stale_running_filter(self) -> Q:
+        lease = timedelta(seconds=settings.EXPORT_JOB_LEASE_SECONDS)
+        return Q(
+            status=ExportJob.StatusOptions.RUNNING,
+            started_at__lt=timezone.now() - lease,
+        )
+
+    def expired_filter(self) -> Q:
+        ttl = timedelta(seconds=settings.EXPORT_FILE_TTL_SECONDS)
+        return Q(
+            status=ExportJob.StatusOptions.DONE,
+            finished_at__lt=timezone.now() - ttl,
+        )
+
+    def find_reusable(self, fingerprint: str) -> "ExportJob":
+        """
+        Returns a queued, running (within its lease) or finished (not expired)
+        job for the same export, if any.
+
+        Parameters:
+        ----------
+        fingerprint : str
+            The hash of the export filters, format and data watermark.
+
+        Returns:
+        -------
+        ExportJob or None
+            The job that already covers this export.
+        """
+        return (
+            self.filter(fingerprint=fingerprint)
+            .exclude(status=ExportJob.StatusOptions.FAILED)
+            .exclude(self.stale_running_filter())
+            .exclude(self.expired_filter())
+            .order_by("-created_at")
+            .first()
+        )
+
+    def claim_next(self) -> "ExportJob":
+        """
+        Marks the oldest pending job, or running job whose lease expired, as
+        running and returns it, skipping jobs locked by other workers.
+
+        Returns:
+        -------
+        ExportJob or None
+            The claimed job, or None if nothing is pending.
+        """
+        with transaction.atomic():
+            job = (
+                self.select_for_update(skip_locked=True)
+                .filter(
+                    Q(status=ExportJob.StatusOptions.PENDING)
+                    | self.stale_running_filter()
+                )
+                .order_by("created_at")
+                .first()
+            )
+            if job is not None:
+                job.status = ExportJob.StatusOptions.RUNNING
+                job.started_at = timezone.now()
+                job.save(update_fields=["status", "started_at", "updated_at"])
+        return job
+
+    def purge_expired(self, batch_size: int = 100) -> int:
+        """
+        Deletes a batch of finished jobs older than EXPORT_FILE_TTL_SECONDS along
+        with their files.
+
+        Parameters:
+        ----------
+        batch_size : int, optional
+            The maximum number of jobs to delete.
+
+        Returns:
+        -------
+        int
+            The number of deleted jobs.
+        """
+        jobs = list(self.filter(self.expired_filter()).order_by("pk")[:batch_size])
+        for job in jobs:
+            if job.file:
+                job.file.delete(save=False)
+        self.filter(pk__in=[job.pk for job in jobs]).delete()
+        return len(jobs)
+
+
+class ExportJob(AbstractDateModel):
+    class Meta(AbstractDateModel.Meta):
+        verbose_name = _("Export Job")
+        verbose_name_plural = _("Export Jobs")
+
+    class StatusOptions(models.TextChoices):
+        PENDING = "pending", _("Pending")
+        RUNNING = "running", _("Running")
+        DONE = "done", _("Done")
+        FAILED = "failed", _("Failed")
+
+    class FileFormatOptions(models.TextChoices):
+        XLSX = "xlsx", _("XLSX")
+        CSV = "csv", _("CSV")
+
+    params = models.JSONField(default=dict, verbose_name=_("Filter Parameters"))
+    file_format = models.CharField(
+        max_length=8,
+        choices=FileFormatOptions.choices,
+        default=FileFormatOptions.XLSX,
+        verbose_name=_("File Format"),
+    )
+    fingerprint = models.CharField(
+        max_length=64, db_index=True, verbose_name=_("Fingerprint")
+    )
+    status = models.CharField(
+        max_length=16,
+        choices=StatusOptions.choices,
+        default=StatusOptions.PENDING,
+        verbose_name=_("Status"),
+    )
+    file = models.FileField(
+        upload_to=export_upload_to,
+        storage=export_storage,
+        blank=True,
+        verbose_name=_("File"),
+    )
+    error = models.TextField(blank=True, default="", verbose_name=_("Error"))
+    requested_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="export_jobs",
+        verbose_name=_("Requested By"),
+    )
+    started_at = models.DateTimeField(
+        null=True, blank=True, verbose_name=_("Started Time")
+    )
+    finished_at = models.DateTimeField(
+        null=True, blank=True, verbose_name=_("Finished Time")
+    )
+
+    objects = ExportJobManager()
+
+    def __str__(self):
+        return f"{self.pk} | {self.file_format} | {self.status}"
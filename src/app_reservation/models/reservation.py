@@ -10,7 +10,21 @@ class Reservation(AbstractDateModel, AbstractSoftDeleteModel):
     class Meta(AbstractDateModel.Meta, AbstractSoftDeleteModel.Meta):
         verbose_name = _("Reservation")
         verbose_name_plural = _("Reservations")
-        unique_together = (("doctor", "date", "time"),)
+        constraints = [
+            models.UniqueConstraint(
+                fields=["doctor", "date", "time"],
+                condition=models.Q(is_deleted=False),
+                name="unique_reservation_slot_if_not_delete",
+            ),
+        ]
+        indexes = [
+            # admin list, date range filters and keyset pages ordered by date, time
+            models.Index(
+                fields=["date", "time", "id"],
+                condition=models.Q(is_deleted=False),
+                name="reservation_date_time_idx",
+            ),
+        ]
 
     doctor = models.ForeignKey(
         Doctor,
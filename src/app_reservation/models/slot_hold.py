@@ -0,0 +1,62 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from app_doctor.models.doctors import Doctor
+
+from utils.db.purge import delete_expired_batch
+
+
+class SlotHoldManager(models.Manager):
+    """
+    Manager for purging the expired slot holds.
+    """
+
+    def purge_expired_batch(self, batch_size: int) -> int:
+        """
+        Delete up to `batch_size` expired holds. Acquiring a slot only clears the
+        expired hold of that slot, so holds of slots nobody retries are removed
+        here, in short statements.
+
+        Parameters:
+        ----------
+        batch_size : int
+            The maximum number of rows to delete.
+
+        Returns:
+        -------
+        int
+            The number of deleted rows.
+        """
+        return delete_expired_batch(self.get_queryset(), batch_size)
+
+
+class SlotHold(models.Model):
+    """
+    Short lived lease on a doctor slot, used when Redis is not enabled.
+    """
+
+    class Meta:
+        verbose_name = _("Slot Hold")
+        verbose_name_plural = _("Slot Holds")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["doctor", "date", "time"], name="unique_slot_hold"
+            ),
+        ]
+
+    doctor = models.ForeignKey(
+        Doctor,
+        on_delete=models.CASCADE,
+        related_name="doctor_slot_holds",
+        verbose_name=_("Doctor"),
+    )
+    date = models.DateField(verbose_name=_("Date"))
+    time = models.TimeField(verbose_name=_("Start time"))
+    token = models.CharField(max_length=32, verbose_name=_("Token"))
+    mobile_number = models.CharField(max_length=64, verbose_name=_("Mobile number"))
+    expires_at = models.DateTimeField(verbose_name=_("Expire Time"))
+
+    objects = SlotHoldManager()
+
+    def __str__(self):
+        return f"{self.doctor_id} | {self.date} | {self.time} | {self.expires_at}"
@@ -0,0 +1,8 @@
+from .export import (
+    EXPORT_FILE_FORMATS,
+    export_response,
+    iter_export_rows,
+)
+from .export_jobs import enqueue_export_job, render_export_job
+from .slot_hold import acquire_slot_hold, check_slot_hold, consume_slot_hold
+from .otp_store import get_otp_store
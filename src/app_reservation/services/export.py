@@ -0,0 +1,119 @@
+from django.http import FileResponse, StreamingHttpResponse
+
+from app_reservation.api.admin.serializers.reservation import (
+    AdminReservationExportResource,
+)
+
+from openpyxl import Workbook
+import csv
+import tempfile
+
+EXPORT_FILE_FORMATS = ("xlsx", "csv")
+
+
+class Echo:
+    """
+    A file-like object that returns what is written, so `csv.writer` rows can be
+    yielded straight into a streaming response.
+    """
+
+    def write(self, value):
+        return value
+
+
+def get_export_queryset(queryset):
+    """
+    Narrows a reservation queryset to the columns the export needs, joining the
+    doctor in the same query instead of fetching it per row.
+    """
+    return queryset.select_related("doctor").only(
+        "date", "time", "full_name", "mobile_number", "doctor__name", "doctor__field"
+    )
+
+
+def iter_export_rows(queryset, resource=None):
+    """
+    Yields the header row followed by one row per reservation, iterating the
+    queryset in chunks so memory stays flat regardless of its size.
+
+    Parameters:
+    ----------
+    queryset : QuerySet
+        The (filtered) reservation queryset.
+    resource : AdminReservationExportResource, optional
+        The resource defining the columns.
+
+    Yields:
+    ------
+    list
+        The export rows.
+    """
+    resource = resource or AdminReservationExportResource()
+    yield resource.get_export_headers()
+    for reservation in resource.iter_queryset(get_export_queryset(queryset)):
+        yield resource.export_resource(reservation)
+
+
+def iter_csv(rows):
+    writer = csv.writer(Echo())
+    # BOM so spreadsheet applications detect the UTF-8 (Persian) content
+    yield "\ufeff"
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def write_csv(rows, file):
+    """
+    Writes rows as UTF-8 CSV (with BOM) to the binary `file`.
+    """
+    for chunk in iter_csv(rows):
+        file.write(chunk.encode("utf-8"))
+    file.seek(0)
+    return file
+
+
+def write_xlsx(rows, file):
+    """
+    Writes rows to `file` with openpyxl's write-only mode, which flushes rows to
+    disk instead of keeping the workbook in memory.
+    """
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet()
+    for row in rows:
+        worksheet.append(row)
+    workbook.save(file)
+    file.seek(0)
+    return file
+
+
+def export_response(queryset, file_format="xlsx", filename="export_factors"):
+    """
+    Builds a streaming response exporting the reservations of `queryset`.
+
+    Parameters:
+    ----------
+    queryset : QuerySet
+        The (filtered) reservation queryset.
+    file_format : str, optional
+        `xlsx` (rendered to a temporary file, then streamed) or `csv`
+        (streamed row by row).
+    filename : str, optional
+        The attachment file name without extension.
+
+    Returns:
+    -------
+    StreamingHttpResponse
+        The export response.
+    """
+    rows = iter_export_rows(queryset)
+    if file_format == "csv":
+        response = StreamingHttpResponse(
+            iter_csv(rows), content_type="text/csv; charset=utf-8"
+        )
+    else:
+        file_format = "xlsx"
+        response = FileResponse(
+            write_xlsx(rows, tempfile.TemporaryFile()), content_type="text/xlsx"
+        )
+    response["Content-Disposition"] = f'attachment; filename="{filename}.{file_format}"'
+    return response
@@ -0,0 +1,153 @@
+from django.core.files import File
+from django.db.models import Count, Max
+from django.test import RequestFactory
+from django.utils import timezone
+
+from rest_framework.request import Request
+
+from app_reservation.models import ExportJobModel
+from app_reservation.services.export import iter_export_rows, write_csv, write_xlsx
+
+import hashlib
+import json
+import logging
+import tempfile
+
+logger = logging.getLogger(__name__)
+
+# query parameters that do not change which rows are exported
+IGNORED_EXPORT_PARAMS = ("page", "page_size", "cursor", "count", "file_format")
+
+
+def get_export_params(query_params) -> dict:
+    """
+    Serializes the filter, search and ordering parameters of an export request.
+
+    Parameters:
+    ----------
+    query_params : QueryDict
+        The request query parameters.
+
+    Returns:
+    -------
+    dict
+        A JSON serializable mapping of parameter name to its list of values.
+    """
+    return {
+        key: query_params.getlist(key)
+        for key in sorted(query_params)
+        if key not in IGNORED_EXPORT_PARAMS
+    }
+
+
+def filter_export_queryset(params: dict):
+    """
+    Rebuilds the filtered export queryset from serialized parameters by running
+    them through the export view's own filter backends.
+
+    Parameters:
+    ----------
+    params : dict
+        Parameters produced by `get_export_params`.
+
+    Returns:
+    -------
+    QuerySet
+        The filtered reservation queryset.
+    """
+    from app_reservation.api.admin.views.reservation import (
+        AdminReservationExportListAPIView,
+    )
+
+    view = AdminReservationExportListAPIView()
+    view.request = Request(RequestFactory().get("/", params))
+    view.format_kwarg = None
+    view.kwargs = {}
+    return view.filter_queryset(view.get_queryset())
+
+
+def get_export_watermark(queryset) -> dict:
+    """
+    Returns the latest modification time and row count of the filtered data,
+    so edits, inserts and soft deletes all change the watermark. The doctors'
+    modification time is included as their name and field are exported too.
+    """
+    watermark = queryset.order_by().aggregate(
+        updated_at=Max("updated_at"),
+        doctor_updated_at=Max("doctor__updated_at"),
+        count=Count("pk"),
+    )
+    for key in ("updated_at", "doctor_updated_at"):
+        if watermark[key] is not None:
+            watermark[key] = watermark[key].isoformat()
+    return watermark
+
+
+def get_export_fingerprint(params: dict, file_format: str, watermark: dict) -> str:
+    payload = json.dumps(
+        {"params": params, "file_format": file_format, "watermark": watermark},
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def enqueue_export_job(queryset, query_params, file_format, user=None):
+    """
+    Queues an export of `queryset`, reusing an existing job when the same export
+    over unchanged data was already requested.
+
+    Parameters:
+    ----------
+    queryset : QuerySet
+        The filtered reservation queryset of the request.
+    query_params : QueryDict
+        The request query parameters.
+    file_format : str
+        One of `ExportJobModel.FileFormatOptions`.
+    user : User, optional
+        The admin requesting the export.
+
+    Returns:
+    -------
+    tuple
+        The job and whether it was newly created.
+    """
+    params = get_export_params(query_params)
+    fingerprint = get_export_fingerprint(
+        params, file_format, get_export_watermark(queryset)
+    )
+    job = ExportJobModel.objects.find_reusable(fingerprint)
+    if job is not None:
+        return job, False
+    job = ExportJobModel.objects.create(
+        params=params,
+        file_format=file_format,
+        fingerprint=fingerprint,
+        requested_by=user if user and user.is_authenticated else None,
+    )
+    return job, True
+
+
+def render_export_job(job):
+    """
+    Renders the artifact of a claimed job into the private export storage.
+
+    Parameters:
+    ----------
+    job : ExportJob
+        The running job.
+    """
+    try:
+        rows = iter_export_rows(filter_export_queryset(job.params))
+        writer = write_csv if job.file_format == "csv" else write_xlsx
+        with tempfile.TemporaryFile() as file:
+            writer(rows, file)
+            job.file.save(f"export.{job.file_format}", File(file), save=False)
+        job.status = ExportJobModel.StatusOptions.DONE
+    except Exception as e:
+        logger.exception("Export job %s failed", job.pk)
+        job.status = ExportJobModel.StatusOptions.FAILED
+        job.error = str(e)
+    job.finished_at = timezone.now()
+    job.save()
+    return job
@@ -0,0 +1,115 @@
+from django.conf import settings
+from django.utils.crypto import salted_hmac
+
+from app_settings.models import OTPManagerModel
+
+from utils.redis_client import get_redis_client
+
+VerifyStatus = OTPManagerModel.VerifyStatusOptions
+
+# replaces any pending code (its SMS may never have been delivered) and clears the
+# previous wrong attempts, like the database store
+ISSUE_OTP_SCRIPT = """
+redis.call("SET", KEYS[1], ARGV[1], "EX", ARGV[2])
+redis.call("DEL", KEYS[2])
+return 1
+"""
+
+# 1: valid and consumed, 0: wrong or missing code, -1: too many wrong attempts
+VERIFY_OTP_SCRIPT = """
+local stored = redis.call("GET", KEYS[1])
+if not stored then
+    return 0
+end
+if tonumber(redis.call("GET", KEYS[2]) or "0") >= tonumber(ARGV[2]) then
+    return -1
+end
+if stored == ARGV[1] then
+    redis.call("DEL", KEYS[1], KEYS[2])
+    return 1
+end
+if redis.call("INCR", KEYS[2]) == 1 then
+    redis.call("EXPIRE", KEYS[2], ARGV[3])
+end
+return 0
+"""
+
+
+class RedisOTPStore:
+    """
+    OTP codes kept in Redis as keyed digests. Issuing and verifying are each a
+    single script call, so a code can never be consumed twice or guessed more
+    than `MAXIMUM_COUNT_TRY_WRONG_OTP_CODE` times.
+    """
+
+    VERIFY_RESULTS = {
+        1: VerifyStatus.VALID,
+        0: VerifyStatus.INVALID,
+        -1: VerifyStatus.LOCKED,
+    }
+
+    def __init__(self, client=None):
+        self.client = client or get_redis_client("otp")
+        self._issue = self.client.register_script(ISSUE_OTP_SCRIPT)
+        self._verify = self.client.register_script(VERIFY_OTP_SCRIPT)
+
+    @staticmethod
+    def _keys(mobile_number):
+        return [
+            f"{mobile_number}:verify_otp_code",
+            f"{mobile_number}:verify_otp_attempts",
+        ]
+
+    @staticmethod
+    def _digest(mobile_number, otp_code):
+        return salted_hmac("otp_store", f"{mobile_number}:{otp_code}").hexdigest()
+
+    def issue(self, mobile_number: str, otp_code: str) -> None:
+        self._issue(
+            keys=self._keys(mobile_number),
+            args=[
+                self._digest(mobile_number, otp_code),
+                settings.OTP_CODE_TTL_SECONDS,
+            ],
+        )
+
+    def verify(self, mobile_number: str, otp_code: str) -> str:
+        result = self._verify(
+            keys=self._keys(mobile_number),
+            args=[
+                self._digest(mobile_number, otp_code),
+                settings.MAXIMUM_COUNT_TRY_WRONG_OTP_CODE,
+                settings.OTP_CODE_TTL_SECONDS,
+            ],
+        )
+        return self.VERIFY_RESULTS[int(result)]
+
+
+class DatabaseOTPStore:
+    """
+    OTP codes kept in `OTPManager` rows, verified with conditional DELETE/UPDATE.
+    """
+
+    def issue(self, mobile_number: str, otp_code: str) -> None:
+        OTPManagerModel.objects.issue(
+            mobile_number, otp_code, settings.OTP_CODE_TTL_SECONDS
+        )
+
+    def verify(self, mobile_number: str, otp_code: str) -> str:
+        return OTPManagerModel.objects.consume(
+            mobile_number, otp_code, settings.MAXIMUM_COUNT_TRY_WRONG_OTP_CODE
+        )
+
+
+def get_otp_store():
+    """
+    Returns the OTP store selected by the USE_REDIS_CACHE setting.
+
+    Returns:
+    -------
+    RedisOTPStore or DatabaseOTPStore
+        The store used to issue and verify reservation OTP codes.
+    """
+    if settings.USE_REDIS_CACHE:
+        return RedisOTPStore()
+    return DatabaseOTPStore()
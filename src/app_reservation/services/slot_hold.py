@@ -0,0 +1,186 @@
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from app_reservation.models import SlotHoldModel
+
+from utils.redis_client import get_redis_client
+
+from datetime import timedelta
+import secrets
+
+# deletes the hold only if it still belongs to the given token
+CONSUME_HOLD_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
+
+class RedisSlotHoldBackend:
+    """
+    Slot holds stored as Redis keys created with `SET NX PX`.
+    """
+
+    def __init__(self, client=None):
+        self.client = client or get_redis_client()
+        self._consume = self.client.register_script(CONSUME_HOLD_SCRIPT)
+
+    @staticmethod
+    def _key(doctor_id, date, time):
+        return f"slot:{doctor_id}:{date}:{time}:hold"
+
+    def acquire(self, doctor_id, date, time, token, mobile_number, ttl) -> bool:
+        key = self._key(doctor_id, date, time)
+        return bool(self.client.set(key, token, nx=True, px=int(ttl * 1000)))
+
+    def consume(self, doctor_id, date, time, token) -> bool:
+        key = self._key(doctor_id, date, time)
+        return bool(self._consume(keys=[key], args=[token]))
+
+    def holder(self, doctor_id, date, time):
+        token = self.client.get(self._key(doctor_id, date, time))
+        return token.decode() if token is not None else None
+
+
+class DatabaseSlotHoldBackend:
+    """
+    Slot holds stored as `SlotHold` rows guarded by a unique constraint.
+    """
+
+    def acquire(self, doctor_id, date, time, token, mobile_number, ttl) -> bool:
+        now = timezone.now()
+        SlotHoldModel.objects.filter(
+            doctor_id=doctor_id, date=date, time=time, expires_at__lte=now
+        ).delete()
+        try:
+            with transaction.atomic():
+                SlotHoldModel.objects.create(
+                    doctor_id=doctor_id,
+                    date=date,
+                    time=time,
+                    token=token,
+                    mobile_number=mobile_number,
+                    expires_at=now + timedelta(seconds=ttl),
+                )
+        except IntegrityError:
+            return False
+        return True
+
+    def consume(self, doctor_id, date, time, token) -> bool:
+        deleted, _ = SlotHoldModel.objects.filter(
+            doctor_id=doctor_id,
+            date=date,
+            time=time,
+            token=token,
+            expires_at__gt=timezone.now(),
+        ).delete()
+        return deleted > 0
+
+    def holder(self, doctor_id, date, time):
+        return (
+            SlotHoldModel.objects.filter(
+                doctor_id=doctor_id,
+                date=date,
+                time=time,
+                expires_at__gt=timezone.now(),
+            )
+            .values_list("token", flat=True)
+            .first()
+        )
+
+
+def get_slot_hold_backend():
+    if settings.USE_REDIS_CACHE:
+        return RedisSlotHoldBackend()
+    return DatabaseSlotHoldBackend()
+
+
+def acquire_slot_hold(doctor_id, date, time, mobile_number, backend=None):
+    """
+    Tries to hold a slot for `SLOT_HOLD_TTL_SECONDS` while its booker verifies
+    the OTP code.
+
+    Parameters:
+    ----------
+    doctor_id : int
+        The doctor of the slot.
+    date : date
+        The date of the slot.
+    time : time
+        The start time of the slot.
+    mobile_number : str
+        The mobile number of the booker.
+    backend : optional
+        The hold backend, chosen from the USE_REDIS_CACHE setting by default.
+
+    Returns:
+    -------
+    str or None
+        The hold token, or None if the slot is already held.
+    """
+    backend = backend or get_slot_hold_backend()
+    token = secrets.token_hex(16)
+    if backend.acquire(
+        doctor_id, date, time, token, mobile_number, settings.SLOT_HOLD_TTL_SECONDS
+    ):
+        return token
+    return None
+
+
+def check_slot_hold(doctor_id, date, time, token=None, backend=None) -> bool:
+    """
+    Tells, without releasing anything, whether a booker may reserve a slot: the
+    slot is either not held or held with `token`. Checked before the OTP code is
+    consumed, so a held slot does not cost the booker their code.
+
+    Parameters:
+    ----------
+    doctor_id : int
+        The doctor of the slot.
+    date : date
+        The date of the slot.
+    time : time
+        The start time of the slot.
+    token : str, optional
+        The hold token of the booker, if any.
+    backend : optional
+        The hold backend, chosen from the USE_REDIS_CACHE setting by default.
+
+    Returns:
+    -------
+    bool
+        False if somebody else holds the slot, True otherwise.
+    """
+    backend = backend or get_slot_hold_backend()
+    return backend.holder(doctor_id, date, time) in (None, token)
+
+
+def consume_slot_hold(doctor_id, date, time, token=None, backend=None) -> bool:
+    """
+    Atomically releases the hold of `token` on a slot before the reservation is
+    inserted.
+
+    Parameters:
+    ----------
+    doctor_id : int
+        The doctor of the slot.
+    date : date
+        The date of the slot.
+    time : time
+        The start time of the slot.
+    token : str, optional
+        The hold token of the booker, if any.
+    backend : optional
+        The hold backend, chosen from the USE_REDIS_CACHE setting by default.
+
+    Returns:
+    -------
+    bool
+        False if somebody else holds the slot, True otherwise.
+    """
+    backend = backend or get_slot_hold_backend()
+    if token and backend.consume(doctor_id, date, time, token):
+        return True
+    return backend.holder(doctor_id, date, time) is None
@@ -0,0 +1,103 @@
+from django.conf import settings
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from rest_framework.test import APIClient
+
+from app_doctor.models import DoctorModel
+from app_reservation.models import ExportJobModel, ReservationModel
+from app_reservation.services import render_export_job
+from app_user.models import UserModel
+
+from datetime import date, time, timedelta
+import os
+import tempfile
+
+CREATE_URL = "/api/v1/admin/reservations/list/export/jobs/create/"
+DOWNLOAD_URL = "/api/v1/admin/reservations/list/export/jobs/download/"
+
+
+class ExportJobTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = UserModel.objects.create_user(
+            "admin@example.com", "password", is_staff=True, is_superuser=True
+        )
+        cls.doctor = DoctorModel.objects.create(
+            name="Doctor", phone="09120000000", national_code="1", address="-"
+        )
+        ReservationModel.objects.create(
+            doctor=cls.doctor,
+            date=date(2025, 4, 5),
+            time=time(8),
+            full_name="Patient",
+            mobile_number="09121234567",
+        )
+
+    def setUp(self):
+        self.export_root = tempfile.TemporaryDirectory()
+        self.addCleanup(self.export_root.cleanup)
+        overrides = override_settings(EXPORT_ROOT=self.export_root.name)
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def create_job(self, query=""):
+        return self.client.post(
+            f"{CREATE_URL}{query}", {"file_format": "csv"}, format="json"
+        )
+
+    def test_identical_requests_reuse_the_job(self):
+        first = self.create_job("?search=Patient")
+        second = self.create_job("?search=Patient")
+        self.assertEqual(first.status_code, 201)
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(first.data["id"], second.data["id"])
+        self.assertEqual(self.create_job("?search=Other").status_code, 201)
+
+    def test_editing_a_doctor_invalidates_the_job(self):
+        first = self.create_job()
+        self.doctor.name = "Renamed"
+        self.doctor.save()
+        second = self.create_job()
+        self.assertEqual(second.status_code, 201)
+        self.assertNotEqual(first.data["id"], second.data["id"])
+
+    def test_stale_running_job_is_reclaimed_and_not_reused(self):
+        job = ExportJobModel.objects.get(pk=self.create_job().data["id"])
+        self.assertEqual(ExportJobModel.objects.claim_next(), job)
+        self.assertIsNone(ExportJobModel.objects.claim_next())
+        self.assertEqual(self.create_job().data["id"], job.pk)
+
+        lease = timedelta(seconds=settings.EXPORT_JOB_LEASE_SECONDS + 1)
+        ExportJobModel.objects.filter(pk=job.pk).update(
+            started_at=timezone.now() - lease
+        )
+        self.assertNotEqual(self.create_job().data["id"], job.pk)
+        self.assertEqual(ExportJobModel.objects.claim_next(), job)
+
+    def test_artifact_is_private_and_expires(self):
+        job = ExportJobModel.objects.get(pk=self.create_job().data["id"])
+        render_export_job(ExportJobModel.objects.claim_next())
+        job.refresh_from_db()
+        self.assertEqual(job.status, ExportJobModel.StatusOptions.DONE)
+        path = job.file.path
+        self.assertTrue(path.startswith(self.export_root.name))
+        # an unguessable random name, not one derived from the job id
+        self.assertGreaterEqual(len(os.path.splitext(os.path.basename(path))[0]), 32)
+        self.assertIsNone(job.file.storage.base_url)
+
+        response = self.client.get(DOWNLOAD_URL, {"pk": job.pk})
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b"Patient", b"".join(response.streaming_content))
+        response.close()
+        self.assertEqual(APIClient().get(DOWNLOAD_URL, {"pk": job.pk}).status_code, 401)
+
+        ttl = timedelta(seconds=settings.EXPORT_FILE_TTL_SECONDS + 1)
+        ExportJobModel.objects.filter(pk=job.pk).update(
+            finished_at=timezone.now() - ttl
+        )
+        self.assertEqual(ExportJobModel.objects.purge_expired(), 1)
+        self.assertFalse(os.path.exists(path))
+        self.assertFalse(ExportJobModel.objects.filter(pk=job.pk).exists())
@@ -0,0 +1,133 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection
+from django.test import TestCase, override_settings
+
+from rest_framework.test import APIClient
+
+from app_doctor.models import DoctorModel, DoctorDateTimeModel
+from app_reservation.models import ReservationModel
+from app_settings.models import OTPManagerModel
+from app_reservation.services.otp_store import (
+    DatabaseOTPStore,
+    RedisOTPStore,
+    get_otp_store,
+)
+from app_reservation.services.slot_hold import (
+    DatabaseSlotHoldBackend,
+    RedisSlotHoldBackend,
+    get_slot_hold_backend,
+)
+
+from utils.base_errors import BaseErrors
+from utils.sms.backends import FakeBackend
+
+from datetime import date, time
+from unittest import mock
+import itertools
+
+SEND_OTP_URL = "/api/v1/public/reservations/send-otp/"
+CREATE_URL = "/api/v1/public/reservations/create/"
+
+_client_ips = itertools.count(1)
+
+
+@override_settings(SMS_BACKEND="utils.sms.backends.FakeBackend")
+class ReservationOTPTests(TestCase):
+    mobile_number = "09121111111"
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.doctor = DoctorModel.objects.create(
+            name="Doctor", phone="09120000000", national_code="1", address="-"
+        )
+        DoctorDateTimeModel.objects.create(
+            doctor=cls.doctor, date=date(2025, 4, 5), time=time(8)
+        )
+
+    def setUp(self):
+        for cache in caches.all():
+            cache.clear()
+        FakeBackend.outbox.clear()
+        # a client ip per test keeps the process wide rate limit buckets apart
+        self.client = APIClient(REMOTE_ADDR=f"10.1.{next(_client_ips)}.1")
+
+    def send_otp(self):
+        response = self.client.post(SEND_OTP_URL, {"mobile_number": self.mobile_number})
+        self.assertEqual(response.status_code, 200)
+        return FakeBackend.outbox[-1]["variables"]["OTP"]
+
+    def book(self, otp):
+        return self.client.post(
+            CREATE_URL,
+            {
+                "doctor": self.doctor.id,
+                "date": date(2025, 4, 5),
+                "time": time(8),
+                "full_name": "Patient",
+                "mobile_number": self.mobile_number,
+                "otp": otp,
+            },
+        )
+
+    @staticmethod
+    def wrong(otp):
+        return f"{(int(otp) + 1) % 100000:05d}"
+
+    def test_new_code_replaces_the_pending_one(self):
+        first = self.send_otp()
+        second = self.send_otp()
+        self.assertEqual(len(FakeBackend.outbox), 2)
+        if first != second:
+            self.assertEqual(self.book(first).status_code, 400)
+        self.assertEqual(self.book(second).status_code, 201)
+
+    def test_code_is_locked_after_too_many_wrong_attempts(self):
+        otp = self.send_otp()
+        for _ in range(settings.MAXIMUM_COUNT_TRY_WRONG_OTP_CODE):
+            response = self.book(self.wrong(otp))
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(response.data["otp"], BaseErrors.invalid_otp_code)
+
+        response = self.book(otp)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data["otp"], BaseErrors.too_many_wrong_otp_attempts)
+        self.assertFalse(ReservationModel.objects.exists())
+
+        # a new code clears the wrong attempts
+        self.assertEqual(self.book(self.send_otp()).status_code, 201)
+
+    def test_code_is_consumed_by_a_booking(self):
+        otp = self.send_otp()
+        self.assertEqual(self.book(otp).status_code, 201)
+        response = self.book(otp)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data["otp"], BaseErrors.invalid_otp_code)
+
+
+class OTPIssueTests(TestCase):
+    def test_issue_replaces_the_code_without_conflict_targets(self):
+        # MySQL and MariaDB cannot name the conflicting unique field of an upsert
+        with mock.patch.object(
+            connection.features, "supports_update_conflicts_with_target", False
+        ):
+            OTPManagerModel.objects.issue("09121111111", "11111", 60)
+            OTPManagerModel.objects.filter(mobile_number="09121111111").update(
+                attempts=2
+            )
+            OTPManagerModel.objects.issue("09121111111", "22222", 60)
+
+        otp_object = OTPManagerModel.objects.get()
+        self.assertEqual(otp_object.otp_code, "22222")
+        self.assertEqual(otp_object.attempts, 0)
+
+
+class RedisSwitchTests(TestCase):
+    def test_stores_follow_the_use_redis_cache_setting(self):
+        with self.settings(USE_REDIS_CACHE=False):
+            self.assertIsInstance(get_otp_store(), DatabaseOTPStore)
+            self.assertIsInstance(get_slot_hold_backend(), DatabaseSlotHoldBackend)
+        with self.settings(USE_REDIS_CACHE=True):
+            self.assertIsInstance(get_otp_store(), RedisOTPStore)
+            self.assertIsInstance(get_slot_hold_backend(), RedisSlotHoldBackend)
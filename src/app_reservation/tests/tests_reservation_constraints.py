@@ -0,0 +1,102 @@
+from django.core.cache import caches
+from django.db import IntegrityError, transaction
+from django.test import TestCase
+
+from rest_framework.test import APIClient
+
+from app_doctor.models import DoctorModel, DoctorDateTimeModel
+from app_reservation.models import ReservationModel
+from app_reservation.services import get_otp_store
+from app_user.models import UserModel
+
+from utils.base_errors import BaseErrors
+
+from datetime import date, time
+
+ADMIN_CREATE_URL = "/api/v1/admin/reservations/create/"
+CREATE_URL = "/api/v1/public/reservations/create/"
+DATETIME_LIST_URL = "/api/v1/public/doctor/datetime/list/"
+
+
+class ReservationSlotUniquenessTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = UserModel.objects.create_user(
+            "admin@example.com", "password", is_staff=True, is_superuser=True
+        )
+        cls.doctor = DoctorModel.objects.create(
+            name="Doctor", phone="09120000000", national_code="1", address="-"
+        )
+        cls.slot = {"doctor": cls.doctor, "date": date(2025, 4, 5), "time": time(8)}
+        DoctorDateTimeModel.objects.create(**cls.slot)
+
+    def setUp(self):
+        for cache in caches.all():
+            cache.clear()
+        self.client = APIClient()
+
+    def booking(self, **data):
+        return {
+            "doctor": self.doctor.id,
+            "date": self.slot["date"],
+            "time": self.slot["time"],
+            "full_name": "Patient",
+            "mobile_number": "09121111111",
+            **data,
+        }
+
+    def reserve(self):
+        return ReservationModel.objects.create(
+            **self.slot, full_name="Patient", mobile_number="09122222222"
+        )
+
+    def test_admin_duplicate_booking_conflicts(self):
+        self.reserve()
+        self.client.force_authenticate(self.admin)
+
+        response = self.client.post(ADMIN_CREATE_URL, self.booking())
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.data["detail"], BaseErrors.slot_already_reserved)
+        self.assertEqual(ReservationModel.objects.count(), 1)
+
+    def test_public_duplicate_booking_conflicts(self):
+        self.reserve()
+        get_otp_store().issue("09121111111", "12345")
+
+        response = self.client.post(CREATE_URL, self.booking(otp="12345"))
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.data["detail"], BaseErrors.slot_already_reserved)
+
+    def test_slot_can_be_booked_again_after_a_soft_delete(self):
+        reservation = self.reserve()
+        reservation.delete()
+        get_otp_store().issue("09121111111", "12345")
+
+        response = self.client.post(CREATE_URL, self.booking(otp="12345"))
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(
+            ReservationModel.objects.all_objects().filter(**self.slot).count(), 2
+        )
+
+    def test_soft_deleted_booking_frees_the_slot_in_the_public_list(self):
+        reservation = self.reserve()
+        with self.captureOnCommitCallbacks(execute=True):
+            ReservationModel.objects.filter(pk=reservation.pk).delete()
+
+        response = self.client.get(DATETIME_LIST_URL, {"doctor": self.doctor.id})
+
+        self.assertEqual([row["is_active"] for row in response.data], [True])
+
+    def test_doctor_slot_is_unique_among_non_deleted_rows(self):
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            DoctorDateTimeModel.objects.create(**self.slot)
+
+        DoctorDateTimeModel.objects.filter(**self.slot).delete()
+        DoctorDateTimeModel.objects.create(**self.slot)
+
+        self.assertEqual(
+            DoctorDateTimeModel.objects.all_objects().filter(**self.slot).count(), 2
+        )
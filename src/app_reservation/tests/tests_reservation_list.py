@@ -0,0 +1,117 @@
+from django.core.cache import caches
+from django.test import TestCase
+
+from rest_framework.test import APIClient
+
+from app_doctor.models import DoctorModel
+from app_reservation.models import ReservationModel
+from app_user.models import UserModel
+
+from datetime import date, time
+import base64
+import json
+
+LIST_URL = "/api/v1/admin/reservations/list/"
+BULK_DELETE_URL = "/api/v1/admin/reservations/bulk-delete/"
+
+
+def encode_cursor(values):
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+
+class AdminReservationKeysetListTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = UserModel.objects.create_user(
+            "admin@example.com", "password", is_staff=True, is_superuser=True
+        )
+        doctor = DoctorModel.objects.create(
+            name="Doctor", phone="09120000000", national_code="1", address="-"
+        )
+        ReservationModel.objects.bulk_create(
+            ReservationModel(
+                doctor=doctor,
+                date=date(2025, 4, 5 + index // 4),
+                time=time(8 + index % 4),
+                full_name=f"Patient {index}",
+                mobile_number="09121234567",
+            )
+            for index in range(10)
+        )
+
+    def setUp(self):
+        for cache in caches.all():
+            cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def test_cursor_round_trip_lists_every_row_once_in_order(self):
+        ids = []
+        response = self.client.get(LIST_URL, {"cursor": "", "page_size": 3})
+        while True:
+            self.assertEqual(response.status_code, 200)
+            ids += [row["id"] for row in response.data["results"]]
+            if response.data["next"] is None:
+                break
+            response = self.client.get(response.data["next"])
+        expected = list(
+            ReservationModel.objects.order_by("date", "time", "pk").values_list(
+                "pk", flat=True
+            )
+        )
+        self.assertEqual(ids, expected)
+
+    def test_cursor_with_wrong_typed_values_is_not_found(self):
+        for values in (["notadate", "x", 1], ["2025-04-05", "08:00:00", "abc"]):
+            response = self.client.get(LIST_URL, {"cursor": encode_cursor(values)})
+            self.assertEqual(response.status_code, 404, values)
+
+    def test_undecodable_or_short_cursor_is_not_found(self):
+        for cursor in ("%%%", encode_cursor({"a": 1}), encode_cursor(["2025-04-05"])):
+            response = self.client.get(LIST_URL, {"cursor": cursor})
+            self.assertEqual(response.status_code, 404, cursor)
+
+
+class AdminReservationBulkDeleteTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = UserModel.objects.create_user(
+            "admin@example.com", "password", is_staff=True, is_superuser=True
+        )
+        doctor = DoctorModel.objects.create(
+            name="Doctor", phone="09120000000", national_code="1", address="-"
+        )
+        ReservationModel.objects.bulk_create(
+            ReservationModel(
+                doctor=doctor,
+                date=date(2025, 4, 5 + index),
+                time=time(8),
+                full_name=f"Patient {index}",
+                mobile_number="09121234567",
+            )
+            for index in range(3)
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def test_request_without_a_selection_names_the_real_parameters(self):
+        response = self.client.delete(BULK_DELETE_URL)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.data["detail"],
+            "parameter ids or doctor or date_after or date_before or time is required.",
+        )
+        self.assertEqual(ReservationModel.objects.count(), 3)
+
+    def test_date_range_deletes_the_selected_reservations(self):
+        response = self.client.delete(
+            f"{BULK_DELETE_URL}?date_after=2025-04-06&date_before=2025-04-07"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["deleted"], 2)
+        self.assertEqual(
+            list(ReservationModel.objects.values_list("date", flat=True)),
+            [date(2025, 4, 5)],
+        )
@@ -0,0 +1,44 @@
+from django.test import SimpleTestCase, TestCase
+
+from app_doctor.models import DoctorModel
+from app_reservation.models import ReservationModel
+from app_settings.models import SMSOutboxModel
+
+from utils.functions import get_jalali_day_of_week
+
+from datetime import date, time
+
+
+class JalaliDayOfWeekTests(SimpleTestCase):
+    def test_day_names_follow_the_jalali_week(self):
+        # 2025-04-05 is a Saturday, the first day of the Jalali week
+        self.assertEqual(get_jalali_day_of_week("1404/01/16"), "شنبه")
+        self.assertEqual(get_jalali_day_of_week("1404/01/17"), "یکشنبه")
+        self.assertEqual(get_jalali_day_of_week("1404/01/22"), "جمعه")
+
+
+class ReservationSMSTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.doctor = DoctorModel.objects.create(
+            name="Doctor",
+            phone="09120000000",
+            national_code="1",
+            address="-",
+            field="General",
+        )
+
+    def test_reservation_message_has_the_jalali_date_and_weekday(self):
+        # the 31st of a Gregorian month has no Jalali counterpart with the same
+        # numbers, it used to fail when read as a Jalali date
+        with self.captureOnCommitCallbacks(execute=True):
+            ReservationModel.objects.create(
+                doctor=self.doctor,
+                date=date(2025, 7, 31),
+                time=time(8),
+                full_name="Patient",
+                mobile_number="09121111111",
+            )
+
+        message = SMSOutboxModel.objects.get(recipient="09121111111")
+        self.assertEqual(message.variables["date"], "پنج‌شنبه 1404/5/9")
@@ -0,0 +1,176 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.test import RequestFactory, TestCase
+from django.utils import timezone
+
+from rest_framework.test import APIClient
+
+from app_doctor.models import DoctorModel, DoctorDateTimeModel
+from app_reservation.models import ReservationModel, SlotHoldModel
+from app_reservation.services import get_otp_store
+from app_settings.models import OTPManagerModel
+
+from utils.base_errors import BaseErrors
+from utils.functions import get_client_ip
+
+from datetime import date, time, timedelta
+import itertools
+
+HOLD_URL = "/api/v1/public/reservations/hold/"
+CREATE_URL = "/api/v1/public/reservations/create/"
+
+_client_ips = itertools.count(1)
+
+
+class SlotHoldTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.doctor = DoctorModel.objects.create(
+            name="Doctor", phone="09120000000", national_code="1", address="-"
+        )
+        cls.slot_date = date(2025, 4, 5)
+        DoctorDateTimeModel.objects.bulk_create(
+            [
+                DoctorDateTimeModel(
+                    doctor=cls.doctor, date=cls.slot_date, time=time(8)
+                ),
+                DoctorDateTimeModel(
+                    doctor=cls.doctor, date=cls.slot_date, time=time(9)
+                ),
+                DoctorDateTimeModel(
+                    doctor=cls.doctor,
+                    date=cls.slot_date,
+                    time=time(10),
+                    is_active=False,
+                ),
+            ]
+        )
+
+    def setUp(self):
+        for cache in caches.all():
+            cache.clear()
+        # a client ip per test keeps the process wide rate limit buckets apart
+        self.client = APIClient(REMOTE_ADDR=f"10.0.{next(_client_ips)}.1")
+
+    def hold(self, slot_time, mobile_number="09121111111"):
+        return self.client.post(
+            HOLD_URL,
+            {
+                "doctor": self.doctor.id,
+                "date": self.slot_date,
+                "time": slot_time,
+                "mobile_number": mobile_number,
+            },
+        )
+
+    def book(self, slot_time, mobile_number, otp, hold_token=None):
+        data = {
+            "doctor": self.doctor.id,
+            "date": self.slot_date,
+            "time": slot_time,
+            "full_name": "Patient",
+            "mobile_number": mobile_number,
+            "otp": otp,
+        }
+        if hold_token:
+            data["hold_token"] = hold_token
+        return self.client.post(CREATE_URL, data)
+
+    def test_hold_rejects_missing_and_inactive_slots(self):
+        self.assertEqual(self.hold(time(11)).status_code, 404)
+        self.assertEqual(self.hold(time(10)).status_code, 404)
+        self.assertFalse(SlotHoldModel.objects.exists())
+
+    def test_hold_rejects_a_reserved_slot(self):
+        ReservationModel.objects.create(
+            doctor=self.doctor,
+            date=self.slot_date,
+            time=time(8),
+            full_name="Patient",
+            mobile_number="09122222222",
+        )
+        response = self.hold(time(8))
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.data["detail"], BaseErrors.slot_already_reserved)
+
+    def test_second_hold_on_a_held_slot_conflicts(self):
+        self.assertEqual(self.hold(time(8)).status_code, 200)
+        response = self.hold(time(8), mobile_number="09122222222")
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.data["detail"], BaseErrors.slot_is_held)
+
+    def test_held_slot_conflicts_without_consuming_the_otp_code(self):
+        self.assertEqual(self.hold(time(8)).status_code, 200)
+        get_otp_store().issue("09122222222", "12345")
+
+        response = self.book(time(8), "09122222222", "12345")
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.data["detail"], BaseErrors.slot_is_held)
+        self.assertEqual(
+            get_otp_store().verify("09122222222", "12345"),
+            OTPManagerModel.VerifyStatusOptions.VALID,
+        )
+
+    def test_holder_books_with_its_token(self):
+        hold_token = self.hold(time(8)).data["hold_token"]
+        get_otp_store().issue("09121111111", "12345")
+
+        response = self.book(time(8), "09121111111", "12345", hold_token)
+
+        self.assertEqual(response.status_code, 201)
+        self.assertFalse(SlotHoldModel.objects.exists())
+
+    def test_hold_is_rate_limited_per_mobile_number(self):
+        statuses = [self.hold(time(9), "09123333333").status_code for _ in range(11)]
+        self.assertEqual(statuses[0], 200)
+        self.assertEqual(statuses[-1], 429)
+
+    def test_spoofed_forwarded_for_does_not_reset_the_ip_bucket(self):
+        rate = settings.REST_FRAMEWORK["DEFAULT_THROTTLE_RATES"]["slot_hold_ip"]
+        limit = int(rate.split("/")[0])
+        statuses = [
+            self.client.post(
+                HOLD_URL,
+                {
+                    "doctor": self.doctor.id,
+                    "date": self.slot_date,
+                    "time": time(11),
+                    "mobile_number": f"0912{index:07d}",
+                },
+                HTTP_X_FORWARDED_FOR=f"203.0.113.{index}",
+            ).status_code
+            for index in range(limit + 1)
+        ]
+        self.assertNotIn(429, statuses[:-1])
+        self.assertEqual(statuses[-1], 429)
+
+    def test_forwarded_for_is_read_behind_trusted_proxies(self):
+        request = RequestFactory().get(
+            "/",
+            REMOTE_ADDR="10.0.0.1",
+            HTTP_X_FORWARDED_FOR="198.51.100.1, 203.0.113.7",
+        )
+        self.assertEqual(get_client_ip(request), "10.0.0.1")
+        with self.settings(REST_FRAMEWORK={"NUM_PROXIES": 1}):
+            self.assertEqual(get_client_ip(request), "203.0.113.7")
+
+    def test_purge_deletes_only_expired_holds(self):
+        now = timezone.now()
+        SlotHoldModel.objects.bulk_create(
+            SlotHoldModel(
+                doctor=self.doctor,
+                date=self.slot_date,
+                time=time(8 + index),
+                token=f"token{index}",
+                mobile_number="09121111111",
+                expires_at=now + timedelta(minutes=-1 if index < 2 else 1),
+            )
+            for index in range(3)
+        )
+        self.assertEqual(SlotHoldModel.objects.purge_expired_batch(1), 1)
+        self.assertEqual(SlotHoldModel.objects.purge_expired_batch(10), 1)
+        self.assertEqual(SlotHoldModel.objects.purge_expired_batch(10), 0)
+        self.assertEqual(
+            list(SlotHoldModel.objects.values_list("token", flat=True)), ["token2"]
+        )
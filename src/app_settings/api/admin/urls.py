@@ -15,4 +15,10 @@ urlpatterns = [
         AdminSettingUpdateAPIView.as_view(),
         name="update_setting",
     ),
+    # health
+    path(
+        "health/",
+        AdminHealthAPIView.as_view(),
+        name="health",
+    ),
 ]
@@ -1 +1,2 @@
 from .setting import AdminSettingListCreateAPIView, AdminSettingUpdateAPIView
+from .health import AdminHealthAPIView
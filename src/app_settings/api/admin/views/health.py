@@ -0,0 +1,23 @@
+from rest_framework import response, status
+
+from app_settings.services import get_health_report
+
+from utils.views import generics
+from utils.views.versioning import BaseVersioning
+from utils.views.permissions import IsAuthenticatedPermission, IsAdminUserPermission
+
+
+class AdminHealthAPIView(generics.CustomGenericAPIView):
+    permission_classes = [IsAuthenticatedPermission, IsAdminUserPermission]
+    versioning = BaseVersioning
+
+    def get(self, request, *args, **kwargs):
+        report = get_health_report()
+        return response.Response(
+            report,
+            status=(
+                status.HTTP_200_OK
+                if report["healthy"]
+                else status.HTTP_503_SERVICE_UNAVAILABLE
+            ),
+        )
@@ -1,13 +1,21 @@
 from app_settings.api.public.serializers.settings import UsersSettingsSerializer
 from app_settings.models import SettingsModel
+from app_settings.services import SETTINGS_NAMESPACE
 
 from utils.views import generics
 from utils.views.versioning import BaseVersioning
 from utils.views.permissions import AllowAnyPermission
 
 
-class UsersSettingsAPIView(generics.CustomListAPIView):
+class UsersSettingsAPIView(
+    generics.ResponseCacheMixin,
+    generics.ConditionalGetMixin,
+    generics.CustomListAPIView,
+):
     permission_classes = [AllowAnyPermission]
     versioning = BaseVersioning
     serializer_class = UsersSettingsSerializer
     queryset = SettingsModel.objects.all()
+    cache_control = {"public": True, "max_age": 300}
+    response_cache_ttl = 3600
+    response_cache_namespaces = (SETTINGS_NAMESPACE,)
@@ -0,0 +1,546 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.http import QueryDict
+from django.core.management.base import BaseCommand
+from django.test import Client, override_settings
+
+import django
+
+from app_doctor.models import DoctorModel, DoctorDateTimeModel
+from app_doctor.services import generate_slots, rebuild_availability
+from app_reservation.models import ExportJobModel, ReservationModel
+from app_reservation.services import (
+    enqueue_export_job,
+    get_otp_store,
+    render_export_job,
+)
+from app_settings.models import SettingsModel
+from app_user.models import UserModel
+
+from utils.benchmark import isolated_database, percentile
+from utils.cache import response_cache_enabled
+from utils.db.instrumentation import record_queries
+from utils.sms.backends import FakeBackend
+
+from datetime import date, datetime, time, timedelta, timezone
+import itertools
+import json
+import platform
+import random
+import tempfile
+import time as timer
+import tracemalloc
+
+ADMIN_EMAIL = "benchmark-admin@example.com"
+ADMIN_PASSWORD = "benchmark-password"
+DATE_FROM = date(2025, 4, 5)
+# 08:00 - 16:00 in 30 minute slots, Saturday to Wednesday
+PATTERNS = [
+    {
+        "weekdays": [0, 1, 2, 3, 4],
+        "start_time": time(8),
+        "end_time": time(16),
+        "slot_minutes": 30,
+    }
+]
+SLOTS_PER_DAY = 16
+STAFFS = 20
+OTP_CODE = "12345"
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the public and admin API endpoints through the test client on "
+        "a throwaway database seeded with synthetic doctors, slots and "
+        "reservations. Write endpoints either store unchanged values or use rows "
+        "seeded for each request outside the timed section; deleting single "
+        "doctors, slots, staffs and settings is not covered. Reports p50/p95 "
+        "latency, queries per request and peak allocations as JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--doctors", type=int, default=20)
+        parser.add_argument("--slots-per-doctor", type=int, default=400)
+        parser.add_argument(
+            "--reserved-ratio",
+            type=float,
+            default=0.3,
+            help="Share of the slots that get a reservation.",
+        )
+        parser.add_argument(
+            "--requests", type=int, default=50, help="Timed requests per endpoint."
+        )
+        parser.add_argument("--warmup", type=int, default=3)
+        parser.add_argument(
+            "--alloc-requests",
+            type=int,
+            default=5,
+            help="Requests per endpoint traced with tracemalloc (timed separately).",
+        )
+        parser.add_argument(
+            "--endpoints",
+            default=None,
+            help="Comma separated endpoint names to run, all by default.",
+        )
+        parser.add_argument(
+            "--no-response-cache",
+            action="store_true",
+            help="Serve every request from the database instead of the response cache.",
+        )
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--output", default=None, help="Write the JSON report to this file."
+        )
+
+    def handle(self, *args, **options):
+        overrides = {
+            "SMS_BACKEND": "utils.sms.backends.FakeBackend",
+            "QUERY_INSTRUMENTATION": False,
+            "ALLOWED_HOSTS": ["testserver"],
+        }
+        if options["no_response_cache"]:
+            overrides["RESPONSE_CACHE_ALIAS"] = "benchmark_dummy"
+            overrides["CACHES"] = {
+                **settings.CACHES,
+                "benchmark_dummy": {
+                    "BACKEND": "django.core.cache.backends.dummy.DummyCache"
+                },
+            }
+        with tempfile.TemporaryDirectory() as export_root, override_settings(
+            EXPORT_ROOT=export_root, **overrides
+        ), isolated_database() as connection:
+            for cache in caches.all():
+                cache.clear()
+            seeded = self._seed(options)
+            client = Client()
+            tokens = self._login(client)
+            token = tokens["access"]
+            endpoints = self._endpoints(seeded, tokens)
+            if options["endpoints"]:
+                names = set(options["endpoints"].split(","))
+                endpoints = [
+                    endpoint for endpoint in endpoints if endpoint["name"] in names
+                ]
+            results = {
+                endpoint["name"]: self._measure(client, token, endpoint, options)
+                for endpoint in endpoints
+            }
+            report = {
+                "meta": {
+                    "created_at": datetime.now(timezone.utc).isoformat(),
+                    "python": platform.python_version(),
+                    "django": django.get_version(),
+                    "database": connection.vendor,
+                    "response_cache": response_cache_enabled(),
+                    "requests": options["requests"],
+                    "scale": seeded["scale"],
+                },
+                "endpoints": results,
+            }
+        FakeBackend.outbox.clear()
+
+        payload = json.dumps(report, indent=2, sort_keys=True)
+        if options["output"]:
+            with open(options["output"], "w") as file:
+                file.write(payload + "\n")
+            for name, result in results.items():
+                self._report(name, result)
+        else:
+            self.stdout.write(payload)
+
+    def _seed(self, options):
+        rng = random.Random(options["seed"])
+        UserModel.objects.create_user(
+            ADMIN_EMAIL, ADMIN_PASSWORD, is_staff=True, is_superuser=True
+        )
+        UserModel.objects.bulk_create(
+            UserModel(
+                email=f"staff{index}@example.com",
+                username=f"staff_{index}",
+                is_staff=True,
+            )
+            for index in range(STAFFS)
+        )
+        setting = SettingsModel.objects.create(
+            type=SettingsModel.TypeOptions.TERMS_CONTENT, value="Terms"
+        )
+        doctors = DoctorModel.objects.bulk_create(
+            DoctorModel(
+                name=f"Doctor {index}",
+                phone="09120000000",
+                national_code=f"{index:010d}",
+                address="-",
+                field=rng.choice(("General", "Eye", "Heart", "Skin", "Dental")),
+            )
+            for index in range(options["doctors"])
+        )
+        # five working days a week
+        days = -(-options["slots_per_doctor"] // SLOTS_PER_DAY) * 7 // 5 + 1
+        date_to = DATE_FROM + timedelta(days=days)
+        for doctor in doctors:
+            generate_slots(
+                doctor.id,
+                DATE_FROM,
+                date_to,
+                PATTERNS,
+                skip_official_holidays=False,
+            )
+        slots = list(
+            DoctorDateTimeModel.objects.order_by(
+                "doctor_id", "date", "time"
+            ).values_list("doctor_id", "date", "time")
+        )
+        reserved = rng.sample(slots, int(len(slots) * options["reserved_ratio"]))
+        ReservationModel.objects.bulk_create(
+            (
+                ReservationModel(
+                    doctor_id=doctor_id,
+                    date=slot_date,
+                    time=slot_time,
+                    full_name=f"Patient {index}",
+                    mobile_number=f"0912{index:07d}",
+                )
+                for index, (doctor_id, slot_date, slot_time) in enumerate(reserved)
+            ),
+            batch_size=2000,
+        )
+        # bulk inserted reservations send no signals
+        rebuild_availability()
+        export_query = QueryDict(f"doctor={doctors[0].id}")
+        enqueue_export_job(
+            ReservationModel.objects.filter(doctor_id=doctors[0].id),
+            export_query,
+            "csv",
+        )
+        export_job = render_export_job(ExportJobModel.objects.claim_next())
+        reserved_slots = set(reserved)
+        return {
+            "doctor_id": doctors[0].id,
+            "slot_id": DoctorDateTimeModel.objects.filter(doctor=doctors[0])
+            .order_by("date", "time")
+            .values_list("pk", flat=True)
+            .first(),
+            "setting_id": setting.pk,
+            "export_query": export_query.urlencode(),
+            "export_job_id": export_job.pk,
+            # slots consumed one per request by the booking endpoints
+            "free_slots": itertools.cycle(
+                slot for slot in slots if slot not in reserved_slots
+            ),
+            "date_from": DATE_FROM,
+            "date_to": date_to,
+            "scale": {
+                "doctors": len(doctors),
+                "slots": len(slots),
+                "reservations": len(reserved),
+            },
+        }
+
+    def _login(self, client):
+        response = client.post(
+            "/api/v1/public/auth/login/",
+            {"email": ADMIN_EMAIL, "password": ADMIN_PASSWORD},
+            content_type="application/json",
+        )
+        return response.json()["token"]
+
+    @staticmethod
+    def _endpoints(seeded, tokens):
+        doctor_id = seeded["doctor_id"]
+        week_to = seeded["date_from"] + timedelta(days=6)
+        free_slots = seeded["free_slots"]
+
+        def booking(index, prefix):
+            slot_doctor_id, slot_date, slot_time = next(free_slots)
+            return {
+                "doctor": slot_doctor_id,
+                "date": slot_date,
+                "time": slot_time,
+                "full_name": f"Benchmark {index}",
+                "mobile_number": f"{prefix}{index:07d}",
+            }
+
+        def verified_booking(index):
+            data = booking(index, "0936")
+            get_otp_store().issue(data["mobile_number"], OTP_CODE)
+            return {**data, "otp": OTP_CODE}
+
+        def reservation_to_delete(index):
+            data = booking(index, "0939")
+            reservation = ReservationModel.objects.create(
+                doctor_id=data.pop("doctor"), **data
+            )
+            return {"ids": [reservation.pk]}
+
+        def client_ip(index):
+            return f"10.{index // 65536 % 256}.{index // 256 % 256}.{index % 256}"
+
+        def schedule_week(index):
+            # a fresh week after the seeded slots per request
+            date_from = seeded["date_to"] + timedelta(days=1 + 7 * index)
+            return {
+                "doctor": doctor_id,
+                "date_from": date_from,
+                "date_to": date_from + timedelta(days=6),
+                "patterns": PATTERNS,
+                "skip_official_holidays": False,
+            }
+
+        return [
+            {"name": "doctor_list", "path": "/api/v1/public/doctor/list/"},
+            {
+                "name": "datetime_list",
+                "path": f"/api/v1/public/doctor/datetime/list/?doctor={doctor_id}",
+            },
+            {
+                "name": "calendar",
+                "path": (
+                    f"/api/v1/public/doctor/calendar/?date_from={seeded['date_from']}"
+                    f"&date_to={week_to}"
+                ),
+            },
+            {"name": "settings_list", "path": "/api/v1/public/settings/list/"},
+            {
+                "name": "send_otp",
+                "method": "post",
+                "path": "/api/v1/public/reservations/send-otp/",
+                # a fresh number and client ip per request stay under the rate limits
+                "data": lambda index: {"mobile_number": f"0935{index:07d}"},
+                "ip": client_ip,
+            },
+            {
+                "name": "slot_hold",
+                "method": "post",
+                "path": "/api/v1/public/reservations/hold/",
+                "data": lambda index: {
+                    key: value
+                    for key, value in booking(index, "0937").items()
+                    if key != "full_name"
+                },
+                "ip": client_ip,
+            },
+            {
+                "name": "reservation_create",
+                "method": "post",
+                "path": "/api/v1/public/reservations/create/",
+                "data": verified_booking,
+            },
+            {
+                "name": "login",
+                "method": "post",
+                "path": "/api/v1/public/auth/login/",
+                "data": lambda index: {
+                    "email": ADMIN_EMAIL,
+                    "password": ADMIN_PASSWORD,
+                },
+            },
+            {
+                "name": "token_refresh",
+                "method": "post",
+                "path": "/api/v1/public/auth/login/refresh/",
+                "data": lambda index: {"refresh": tokens["refresh"]},
+            },
+            {"name": "user_info", "path": "/api/v1/public/auth/info/", "admin": True},
+            {
+                "name": "change_password",
+                "method": "post",
+                "path": "/api/v1/public/auth/change_password/",
+                # the password is set to itself
+                "data": lambda index: {
+                    "old_password": ADMIN_PASSWORD,
+                    "password": ADMIN_PASSWORD,
+                    "re_password": ADMIN_PASSWORD,
+                },
+                "admin": True,
+            },
+            {
+                "name": "admin_staff_list",
+                "path": "/api/v1/admin/user/staffs/list-create/",
+                "admin": True,
+            },
+            {
+                "name": "admin_doctor_list",
+                "path": "/api/v1/admin/doctor/list-create/",
+                "admin": True,
+            },
+            {
+                "name": "admin_datetime_list",
+                "path": f"/api/v1/admin/doctor/datetime/list-create/?doctor={doctor_id}",
+                "admin": True,
+            },
+            {
+                "name": "admin_datetime_update",
+                "method": "patch",
+                "path": (
+                    "/api/v1/admin/doctor/datetime/update-delete/"
+                    f"?pk={seeded['slot_id']}"
+                ),
+                "data": lambda index: {"is_active": True},
+                "admin": True,
+            },
+            {
+                "name": "admin_datetime_bulk_update",
+                "method": "patch",
+                "path": (
+                    "/api/v1/admin/doctor/datetime/bulk-update-delete/"
+                    f"?doctor={doctor_id}&date={seeded['date_from']}"
+                ),
+                "data": lambda index: {"is_active": True},
+                "admin": True,
+            },
+            {
+                "name": "admin_datetime_generate",
+                "method": "post",
+                "path": "/api/v1/admin/doctor/datetime/generate/",
+                "data": schedule_week,
+                "admin": True,
+            },
+            {
+                "name": "admin_reservation_create",
+                "method": "post",
+                "path": "/api/v1/admin/reservations/create/",
+                "data": lambda index: booking(index, "0938"),
+                "admin": True,
+            },
+            {
+                "name": "admin_reservation_bulk_delete",
+                "method": "delete",
+                "path": "/api/v1/admin/reservations/bulk-delete/",
+                "data": reservation_to_delete,
+                "admin": True,
+            },
+            {
+                "name": "admin_reservation_list",
+                "path": "/api/v1/admin/reservations/list/",
+                "admin": True,
+            },
+            {
+                "name": "admin_reservation_list_keyset",
+                "path": "/api/v1/admin/reservations/list/?cursor=",
+                "admin": True,
+            },
+            {
+                "name": "admin_reservation_export",
+                "path": (
+                    "/api/v1/admin/reservations/list/export/?file_format=csv"
+                    f"&date_after={seeded['date_from']}&date_before={week_to}"
+                ),
+                "admin": True,
+            },
+            {
+                "name": "admin_export_job_create",
+                "method": "post",
+                "path": (
+                    "/api/v1/admin/reservations/list/export/jobs/create/"
+                    f"?{seeded['export_query']}"
+                ),
+                # unchanged data reuses the seeded job
+                "data": lambda index: {"file_format": "csv"},
+                "admin": True,
+            },
+            {
+                "name": "admin_export_job_status",
+                "path": (
+                    "/api/v1/admin/reservations/list/export/jobs/status/"
+                    f"?pk={seeded['export_job_id']}"
+                ),
+                "admin": True,
+            },
+            {
+                "name": "admin_export_job_download",
+                "path": (
+                    "/api/v1/admin/reservations/list/export/jobs/download/"
+                    f"?pk={seeded['export_job_id']}"
+                ),
+                "admin": True,
+            },
+            {
+                "name": "admin_settings_list",
+                "path": "/api/v1/admin/settings/list-create/",
+                "admin": True,
+            },
+            {
+                "name": "admin_settings_update",
+                "method": "patch",
+                "path": f"/api/v1/admin/settings/update/?pk={seeded['setting_id']}",
+                "data": lambda index: {"value": "Terms"},
+                "admin": True,
+            },
+            {
+                "name": "admin_health",
+                "path": "/api/v1/admin/settings/health/",
+                "admin": True,
+            },
+        ]
+
+    @staticmethod
+    def _prepare(endpoint, index):
+        # builds the body before the timer starts, seeding the rows it consumes
+        return endpoint["data"](index) if "data" in endpoint else None
+
+    def _request(self, client, token, endpoint, data, index):
+        method = endpoint.get("method", "get")
+        extra = {}
+        if endpoint.get("admin"):
+            extra["HTTP_AUTHORIZATION"] = f"Bearer {token}"
+        if "ip" in endpoint:
+            extra["REMOTE_ADDR"] = endpoint["ip"](index)
+        if method == "get":
+            response = client.get(endpoint["path"], **extra)
+        else:
+            response = getattr(client, method)(
+                endpoint["path"], data, content_type="application/json", **extra
+            )
+        if getattr(response, "streaming", False):
+            # exports stream their body, the work happens while it is consumed
+            b"".join(response.streaming_content)
+        return response
+
+    def _measure(self, client, token, endpoint, options):
+        index = 0
+        for _ in range(options["warmup"]):
+            data = self._prepare(endpoint, index)
+            self._request(client, token, endpoint, data, index)
+            index += 1
+
+        timings, queries, statuses = [], [], {}
+        for _ in range(options["requests"]):
+            data = self._prepare(endpoint, index)
+            with record_queries() as recorder:
+                started = timer.perf_counter()
+                response = self._request(client, token, endpoint, data, index)
+                timings.append((timer.perf_counter() - started) * 1000)
+            queries.append(recorder.count)
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+            index += 1
+
+        peaks = []
+        tracemalloc.start()
+        try:
+            for _ in range(options["alloc_requests"]):
+                data = self._prepare(endpoint, index)
+                tracemalloc.reset_peak()
+                baseline = tracemalloc.get_traced_memory()[0]
+                self._request(client, token, endpoint, data, index)
+                peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+                index += 1
+        finally:
+            tracemalloc.stop()
+
+        return {
+            "method": endpoint.get("method", "get").upper(),
+            "path": endpoint["path"],
+            "status": {str(code): count for code, count in sorted(statuses.items())},
+            "p50_ms": round(percentile(timings, 50), 3),
+            "p95_ms": round(percentile(timings, 95), 3),
+            "mean_ms": round(sum(timings) / len(timings), 3) if timings else 0.0,
+            "queries": max(queries, default=0),
+            "peak_alloc_kb": round(percentile(peaks, 50) / 1024, 1),
+        }
+
+    def _report(self, name, result):
+        self.stdout.write(
+            f"{name:<30} | p50 {result['p50_ms']:>9.2f} ms | "
+            f"p95 {result['p95_ms']:>9.2f} ms | {result['queries']:>4} queries | "
+            f"{result['peak_alloc_kb']:>9.1f} KiB | {result['status']}"
+        )
@@ -0,0 +1,153 @@
+from django.core.management.base import BaseCommand
+
+from app_doctor.api.public.views import (
+    UsersDoctorListAPIView,
+    UsersDoctorDateTimesListAPIView,
+)
+from app_doctor.models import DoctorModel, DoctorDateTimeModel
+from app_reservation.api.admin.views.reservation import AdminReservationListAPIView
+from app_reservation.models import ReservationModel
+
+from utils.benchmark import isolated_database, measure
+
+from datetime import date, time, timedelta
+import json
+
+VIEWS = {
+    "doctor_list": UsersDoctorListAPIView,
+    "datetime_list": UsersDoctorDateTimesListAPIView,
+    "admin_reservation_list": AdminReservationListAPIView,
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the list serializers (ModelSerializer over model instances vs "
+        "ValuesSerializer over values() rows) of the read heavy list endpoints on "
+        "a throwaway database. Reports milliseconds per 1k rows, with and without "
+        "the fetch."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows", type=int, default=10000, help="Rows per table to serialize."
+        )
+        parser.add_argument("--doctors", type=int, default=10)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument(
+            "--output", default=None, help="Write the JSON report to this file."
+        )
+
+    def handle(self, *args, **options):
+        report = {}
+        with isolated_database():
+            self._seed(options["rows"], options["doctors"])
+            for name, view in VIEWS.items():
+                queryset = view.queryset.all()
+                values_serializer = view.values_serializer_class
+                rows = list(queryset)
+                value_rows = list(values_serializer.values_queryset(queryset))
+                modes = {
+                    "model": (
+                        measure(
+                            self._fetch_serialize,
+                            view.serializer_class,
+                            queryset,
+                            repeat=options["repeat"],
+                        ),
+                        measure(
+                            self._serialize,
+                            view.serializer_class,
+                            rows,
+                            repeat=options["repeat"],
+                        ),
+                    ),
+                    "values": (
+                        measure(
+                            self._fetch_serialize,
+                            values_serializer,
+                            values_serializer.values_queryset(queryset),
+                            repeat=options["repeat"],
+                        ),
+                        measure(
+                            self._serialize,
+                            values_serializer,
+                            value_rows,
+                            repeat=options["repeat"],
+                        ),
+                    ),
+                }
+                report[name] = {}
+                for mode, (fetch_serialize, serialize) in modes.items():
+                    report[name][mode] = {
+                        "rows": len(rows),
+                        "queries": fetch_serialize["queries"],
+                        "fetch_serialize_ms_per_1k": self._per_1k(
+                            fetch_serialize, len(rows)
+                        ),
+                        "serialize_ms_per_1k": self._per_1k(serialize, len(rows)),
+                    }
+                    self._report(name, mode, report[name][mode])
+
+        if options["output"]:
+            with open(options["output"], "w") as file:
+                json.dump(report, file, indent=2)
+
+    def _seed(self, rows, doctors_count):
+        DoctorModel.objects.bulk_create(
+            (
+                DoctorModel(
+                    name=f"Doctor {index}",
+                    phone="09120000000",
+                    national_code=f"{index:010d}",
+                    address="-",
+                    field="General",
+                )
+                for index in range(rows)
+            ),
+            batch_size=1000,
+        )
+        doctors = list(DoctorModel.objects.order_by("pk")[:doctors_count])
+        slots = []
+        reservations = []
+        for index in range(rows):
+            doctor = doctors[index % doctors_count]
+            slot_number = index // doctors_count
+            slot_date = date(2024, 1, 1) + timedelta(days=slot_number // 24)
+            slot_time = time(slot_number % 24)
+            slots.append(
+                DoctorDateTimeModel(doctor=doctor, date=slot_date, time=slot_time)
+            )
+            if index % 2:
+                reservations.append(
+                    ReservationModel(
+                        doctor=doctor,
+                        date=slot_date,
+                        time=slot_time,
+                        full_name=f"Patient {index}",
+                        mobile_number="09120000000",
+                    )
+                )
+        DoctorDateTimeModel.objects.bulk_create(slots, batch_size=1000)
+        ReservationModel.objects.bulk_create(reservations, batch_size=1000)
+
+    @staticmethod
+    def _fetch_serialize(serializer_class, queryset):
+        # a fresh clone per run, the result cache would skip the fetch
+        return serializer_class(queryset.all(), many=True).data
+
+    @staticmethod
+    def _serialize(serializer_class, data):
+        return serializer_class(data, many=True).data
+
+    @staticmethod
+    def _per_1k(result, rows):
+        return round(result["seconds"] * 1000 * 1000 / max(rows, 1), 3)
+
+    def _report(self, name, mode, result):
+        self.stdout.write(
+            f"{name:<24} | {mode:<6} | {result['rows']:>7} rows | "
+            f"{result['queries']:>3} queries | "
+            f"fetch+serialize {result['fetch_serialize_ms_per_1k']:>8.2f} ms/1k | "
+            f"serialize {result['serialize_ms_per_1k']:>8.2f} ms/1k"
+        )
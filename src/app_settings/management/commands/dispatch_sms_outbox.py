@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand
+
+from app_settings.services import SMSOutboxDispatcher
+
+import time
+
+
+class Command(BaseCommand):
+    help = "Run the background dispatcher that drains the SMS outbox."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=None)
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=1.0,
+            help="Seconds to sleep when the outbox has nothing due.",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Drain the currently due messages and exit.",
+        )
+
+    def handle(self, *args, **options):
+        dispatcher = SMSOutboxDispatcher(batch_size=options["batch_size"])
+        try:
+            while True:
+                claimed = dispatcher.dispatch_batch()
+                if claimed:
+                    self.stdout.write(f"Dispatched {claimed} message(s).")
+                    continue
+                if options["once"]:
+                    break
+                time.sleep(options["interval"])
+        except KeyboardInterrupt:
+            pass
+        finally:
+            dispatcher.close()
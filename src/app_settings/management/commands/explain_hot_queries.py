@@ -0,0 +1,63 @@
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from utils.db.hot_queries import get_hot_queries
+
+import re
+
+# index references in SQLite and PostgreSQL plans
+INDEX_PATTERN = re.compile(
+    r"USING (?:COVERING )?INDEX (\w+)"
+    r"|Index (?:Only )?Scan (?:Backward )?using (\w+)"
+    r"|Bitmap Index Scan on (\w+)",
+    re.IGNORECASE,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Print the query plan of every registered hot query and the indexes it "
+        "uses on the current database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "names",
+            nargs="*",
+            help="Only explain the hot queries with these names.",
+        )
+        parser.add_argument(
+            "--analyze",
+            action="store_true",
+            help="Run EXPLAIN ANALYZE (PostgreSQL only, executes the queries).",
+        )
+        parser.add_argument("--sql", action="store_true", help="Print the SQL too.")
+
+    def handle(self, *args, **options):
+        for name, build_queryset in get_hot_queries().items():
+            if options["names"] and name not in options["names"]:
+                continue
+            queryset = build_queryset()
+            explain_options = {}
+            if options["analyze"] and connections[queryset.db].vendor == "postgresql":
+                explain_options["analyze"] = True
+            plan = queryset.explain(**explain_options)
+            used_indexes = sorted(
+                {
+                    name
+                    for match in INDEX_PATTERN.findall(plan)
+                    for name in match
+                    if name
+                }
+            )
+            self.stdout.write(self.style.MIGRATE_HEADING(name))
+            if options["sql"]:
+                self.stdout.write(str(queryset.query))
+            self.stdout.write(plan)
+            if used_indexes:
+                self.stdout.write(
+                    self.style.SUCCESS(f"uses indexes: {', '.join(used_indexes)}")
+                )
+            else:
+                self.stdout.write(self.style.WARNING("uses no index"))
+            self.stdout.write("")
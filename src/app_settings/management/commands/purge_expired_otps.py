@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from app_settings.models import OTPManagerModel
+
+from utils.db.purge import delete_in_batches
+
+
+class Command(BaseCommand):
+    help = "Delete expired OTP codes in bounded batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=0.0,
+            help="Seconds to pause between batches to leave room for other writers.",
+        )
+
+    def handle(self, *args, **options):
+        total = delete_in_batches(
+            OTPManagerModel.objects.purge_expired_batch,
+            options["batch_size"],
+            options["sleep"],
+        )
+        self.stdout.write(f"Purged {total} expired OTP code(s).")
@@ -0,0 +1,20 @@
+# Generated by Django 5.1.2 on 2026-10-18 00:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app_settings", "0003_smsoutbox"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="otpmanager",
+            name="attempts",
+            field=models.PositiveSmallIntegerField(
+                default=0, verbose_name="Wrong Attempts"
+            ),
+        ),
+    ]
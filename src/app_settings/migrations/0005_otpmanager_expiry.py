@@ -0,0 +1,52 @@
+from django.db import migrations, models
+from django.db.models import Max
+
+import django.utils.timezone
+
+
+def delete_duplicate_mobile_numbers(apps, schema_editor):
+    OTPManager = apps.get_model("app_settings", "OTPManager")
+    latest = (
+        OTPManager.objects.values("mobile_number")
+        .annotate(latest_pk=Max("pk"))
+        .values_list("latest_pk", flat=True)
+    )
+    OTPManager.objects.exclude(pk__in=list(latest)).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app_settings", "0004_otpmanager_attempts"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="otpmanager",
+            name="created_at",
+            field=models.DateTimeField(
+                default=django.utils.timezone.now, verbose_name="Created Time"
+            ),
+        ),
+        # codes issued before expiry was tracked are treated as already expired
+        migrations.AddField(
+            model_name="otpmanager",
+            name="expires_at",
+            field=models.DateTimeField(
+                db_index=True,
+                default=django.utils.timezone.now,
+                verbose_name="Expire Time",
+            ),
+            preserve_default=False,
+        ),
+        migrations.RunPython(
+            delete_duplicate_mobile_numbers, migrations.RunPython.noop
+        ),
+        migrations.AlterField(
+            model_name="otpmanager",
+            name="mobile_number",
+            field=models.CharField(
+                max_length=15, unique=True, verbose_name="Mobile Number"
+            ),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.1.2 on 2026-10-18 01:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app_settings", "0005_otpmanager_expiry"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="settings",
+            name="type",
+            field=models.CharField(
+                choices=[
+                    ("activate_gateway", "Activate Gateway"),
+                    ("gateway_token", "Gateway Token"),
+                    ("reserve_price", "Reserve Price"),
+                    ("terms_content", "Terms Content"),
+                    ("use_redis_cache", "Use Redis Cache (deprecated, ignored)"),
+                ],
+                max_length=16,
+                unique=True,
+                verbose_name="Type",
+            ),
+        ),
+    ]
@@ -1,2 +1,3 @@
 from .settings import Settings as SettingsModel
 from .otp_manager import OTPManager as OTPManagerModel
+from .sms_outbox import SMSOutbox as SMSOutboxModel
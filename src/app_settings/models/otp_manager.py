@@ -1,9 +1,129 @@
-from django.db import models
+from django.db import connections, models
+from django.db.models import F
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
+from utils.db.purge import delete_expired_batch
+
+from datetime import timedelta
+
+
+class OTPCodeManager(models.Manager):
+    """
+    Manager for issuing OTP codes and verifying them with conditional writes.
+    """
+
+    def issue(self, mobile_number: str, otp_code: str, ttl: int) -> "OTPManager":
+        """
+        Store a fresh OTP code for a mobile number and reset its wrong attempts,
+        with a single upsert on the unique mobile number where the database can
+        target the conflict (PostgreSQL, SQLite) and `update_or_create` otherwise
+        (MySQL, MariaDB).
+
+        Parameters:
+        ----------
+        mobile_number : str
+            The mobile number the code is sent to.
+        otp_code : str
+            The generated OTP code.
+        ttl : int
+            The seconds the code stays valid.
+
+        Returns:
+        -------
+        OTPManager
+            The stored code.
+        """
+        now = timezone.now()
+        values = {
+            "otp_code": otp_code,
+            "attempts": 0,
+            "created_at": now,
+            "expires_at": now + timedelta(seconds=ttl),
+        }
+        if not connections[self.db].features.supports_update_conflicts_with_target:
+            otp_object, _ = self.update_or_create(
+                mobile_number=mobile_number, defaults=values
+            )
+            return otp_object
+        otp_object = self.model(mobile_number=mobile_number, **values)
+        self.bulk_create(
+            [otp_object],
+            update_conflicts=True,
+            unique_fields=["mobile_number"],
+            update_fields=list(values),
+        )
+        return otp_object
+
+    def consume(self, mobile_number: str, otp_code: str, max_attempts: int) -> str:
+        """
+        Verify and consume an unexpired OTP code. The matching code is deleted
+        with a single conditional DELETE, a wrong guess bumps the attempt counter
+        with a single conditional UPDATE, so concurrent requests can never consume
+        a code twice or exceed `max_attempts`. Expired codes never match.
+
+        Parameters:
+        ----------
+        mobile_number : str
+            The mobile number the code was sent to.
+        otp_code : str
+            The code entered by the user.
+        max_attempts : int
+            The number of wrong guesses after which the code is locked.
+
+        Returns:
+        -------
+        str
+            One of `OTPManager.VerifyStatusOptions`.
+        """
+        pending = self.filter(
+            mobile_number=mobile_number, expires_at__gt=timezone.now()
+        )
+        codes = pending.filter(attempts__lt=max_attempts)
+        deleted, _ = codes.filter(otp_code=otp_code).delete()
+        if deleted:
+            return OTPManager.VerifyStatusOptions.VALID
+        if codes.update(attempts=F("attempts") + 1):
+            return OTPManager.VerifyStatusOptions.INVALID
+        if pending.exists():
+            return OTPManager.VerifyStatusOptions.LOCKED
+        return OTPManager.VerifyStatusOptions.INVALID
+
+    def purge_expired_batch(self, batch_size: int) -> int:
+        """
+        Delete up to `batch_size` expired codes in one short statement.
+
+        Parameters:
+        ----------
+        batch_size : int
+            The maximum number of rows to delete.
+
+        Returns:
+        -------
+        int
+            The number of deleted rows.
+        """
+        return delete_expired_batch(self.get_queryset(), batch_size)
+
 
 class OTPManager(models.Model):
-    mobile_number = models.CharField(max_length=15, verbose_name=_("Mobile Number"))
+    class VerifyStatusOptions(models.TextChoices):
+        VALID = "valid", _("Valid")
+        INVALID = "invalid", _("Invalid")
+        LOCKED = "locked", _("Locked")
+
+    mobile_number = models.CharField(
+        max_length=15, unique=True, verbose_name=_("Mobile Number")
+    )
     otp_code = models.CharField(
         max_length=15, verbose_name=_("OTP Code"), null=True, blank=True
     )
+    attempts = models.PositiveSmallIntegerField(
+        default=0, verbose_name=_("Wrong Attempts")
+    )
+    created_at = models.DateTimeField(
+        default=timezone.now, verbose_name=_("Created Time")
+    )
+    expires_at = models.DateTimeField(db_index=True, verbose_name=_("Expire Time"))
+
+    objects = OTPCodeManager()
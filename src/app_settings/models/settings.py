@@ -16,7 +16,9 @@ class Settings(AbstractDateModel):
         GATEWAY_TOKEN = "gateway_token", _("Gateway Token")
         RESERVE_PRICE = "reserve_price", _("Reserve Price")
         TERMS_CONTENT = "terms_content", _("Terms Content")
-        USE_REDIS_CACHE = "use_redis_cache", _("Use Redis Cache")
+        # the USE_REDIS_CACHE environment variable selects the redis backed stores,
+        # rows of this type are kept but no longer read
+        USE_REDIS_CACHE = "use_redis_cache", _("Use Redis Cache (deprecated, ignored)")
 
     type = models.CharField(
         max_length=16, choices=TypeOptions.choices, unique=True, verbose_name=_("Type")
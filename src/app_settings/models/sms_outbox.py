@@ -0,0 +1,138 @@
+from django.db import models, transaction
+from django.db.models import F
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from utils.db.models import AbstractDateModel
+
+from datetime import timedelta
+
+
+class SMSOutboxManager(models.Manager):
+    """
+    Manager for queueing SMS messages and claiming them for dispatch.
+    """
+
+    def enqueue(
+        self, recipient: str, pattern_code: str, variables: dict
+    ) -> "SMSOutbox":
+        """
+        Queue a pattern SMS for the background dispatcher.
+
+        Parameters:
+        ----------
+        recipient : str
+            The mobile number of the recipient.
+        pattern_code : str
+            The gateway pattern code of the message.
+        variables : dict
+            The pattern variables.
+
+        Returns:
+        -------
+        SMSOutbox
+            The queued message.
+        """
+        return self.create(
+            recipient=recipient, pattern_code=pattern_code, variables=variables
+        )
+
+    def claim_batch(self, batch_size: int, lease: timedelta) -> list:
+        """
+        Claim a batch of due messages. Claimed messages are leased by pushing
+        `next_attempt_at` forward, so a crashed dispatcher's batch is retried once
+        the lease expires and concurrent dispatchers never pick the same rows.
+
+        Parameters:
+        ----------
+        batch_size : int
+            The maximum number of messages to claim.
+        lease : timedelta
+            How long the claimed messages stay reserved for this dispatcher.
+
+        Returns:
+        -------
+        list
+            The claimed messages.
+        """
+        now = timezone.now()
+        with transaction.atomic():
+            messages = list(
+                self.select_for_update(skip_locked=True)
+                .filter(
+                    status=SMSOutbox.StatusOptions.PENDING, next_attempt_at__lte=now
+                )
+                .order_by("next_attempt_at", "pk")[:batch_size]
+            )
+            self.filter(pk__in=[message.pk for message in messages]).update(
+                attempts=F("attempts") + 1, next_attempt_at=now + lease
+            )
+        for message in messages:
+            message.attempts += 1
+        return messages
+
+
+class SMSOutbox(AbstractDateModel):
+    class Meta(AbstractDateModel.Meta):
+        verbose_name = _("SMS Outbox")
+        verbose_name_plural = _("SMS Outbox")
+        indexes = [
+            models.Index(
+                fields=["status", "next_attempt_at"],
+                name="sms_outbox_status_due_idx",
+            ),
+        ]
+
+    class StatusOptions(models.TextChoices):
+        PENDING = "pending", _("Pending")
+        SENT = "sent", _("Sent")
+        FAILED = "failed", _("Failed")
+
+    recipient = models.CharField(max_length=64, verbose_name=_("Recipient"))
+    pattern_code = models.CharField(max_length=64, verbose_name=_("Pattern Code"))
+    variables = models.JSONField(default=dict, verbose_name=_("Variables"))
+    status = models.CharField(
+        max_length=16,
+        choices=StatusOptions.choices,
+        default=StatusOptions.PENDING,
+        verbose_name=_("Status"),
+    )
+    attempts = models.PositiveSmallIntegerField(default=0, verbose_name=_("Attempts"))
+    next_attempt_at = models.DateTimeField(
+        default=timezone.now, verbose_name=_("Next Attempt Time")
+    )
+    sent_at = models.DateTimeField(null=True, blank=True, verbose_name=_("Sent Time"))
+    last_error = models.TextField(blank=True, default="", verbose_name=_("Last Error"))
+
+    objects = SMSOutboxManager()
+
+    def __str__(self):
+        return f"{self.recipient} | {self.pattern_code} | {self.status}"
+
+    def mark_sent(self):
+        self.status = self.StatusOptions.SENT
+        self.sent_at = timezone.now()
+        self.last_error = ""
+        self.save(update_fields=["status", "sent_at", "last_error", "updated_at"])
+
+    def defer(self, delay: timedelta):
+        """
+        Return a claimed message to the queue without counting the attempt.
+        """
+        self.attempts -= 1
+        self.next_attempt_at = timezone.now() + delay
+        self.save(update_fields=["attempts", "next_attempt_at", "updated_at"])
+
+    def mark_failed(self, error: str, max_attempts: int, backoff: timedelta):
+        """
+        Record a failed attempt and schedule a retry with exponential backoff, or
+        give up once `max_attempts` is reached.
+        """
+        self.last_error = error
+        if self.attempts >= max_attempts:
+            self.status = self.StatusOptions.FAILED
+        else:
+            self.next_attempt_at = timezone.now() + backoff * 2 ** (self.attempts - 1)
+        self.save(
+            update_fields=["status", "next_attempt_at", "last_error", "updated_at"]
+        )
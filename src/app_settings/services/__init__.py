@@ -0,0 +1,3 @@
+from .sms_dispatcher import SMSOutboxDispatcher
+from .cache import SETTINGS_NAMESPACE
+from .health import get_health_report
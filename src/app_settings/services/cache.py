@@ -0,0 +1,2 @@
+# response cache namespace of the public settings listings
+SETTINGS_NAMESPACE = "settings"
@@ -0,0 +1,34 @@
+from django.conf import settings
+
+from utils.rate_limit import get_rate_limiter
+from utils.redis_client import check_cache_health, check_redis_health, get_pool_stats
+from utils.sms import get_sms_client
+
+
+def uses_redis() -> bool:
+    return settings.USE_REDIS_CACHE or settings.RATE_LIMIT_USE_REDIS
+
+
+def get_health_report() -> dict:
+    """
+    Collects the state of the cache aliases, Redis and its connection pools, and
+    the rate limiter and SMS gateway counters of this process.
+
+    Returns:
+    -------
+    dict
+        The report, with `healthy` false if any cache alias or Redis is down.
+    """
+    caches = check_cache_health()
+    report = {
+        "caches": caches,
+        "redis": {"enabled": uses_redis(), "pools": get_pool_stats()},
+        "rate_limiter": get_rate_limiter().metrics.snapshot(),
+        "sms_gateway": get_sms_client().metrics.snapshot(),
+    }
+    healthy = all(result["healthy"] for result in caches.values())
+    if report["redis"]["enabled"]:
+        report["redis"]["ping"] = check_redis_health()
+        healthy = healthy and report["redis"]["ping"]["healthy"]
+    report["healthy"] = healthy
+    return report
@@ -0,0 +1,63 @@
+from django.conf import settings
+
+from app_settings.models import SMSOutboxModel
+
+from utils.exceptions.core import SMSGatewayError, SMSCircuitOpenError
+from utils.sms import get_sms_client
+
+from datetime import timedelta
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class SMSOutboxDispatcher:
+    """
+    Drains the SMS outbox in batches through the shared, pooled SMS client.
+    """
+
+    def __init__(
+        self,
+        batch_size=None,
+        max_attempts=None,
+        backoff=None,
+        lease=None,
+        client=None,
+    ):
+        self.batch_size = batch_size or settings.SMS_OUTBOX_BATCH_SIZE
+        self.max_attempts = max_attempts or settings.SMS_OUTBOX_MAX_ATTEMPTS
+        self.backoff = backoff or timedelta(
+            seconds=settings.SMS_OUTBOX_RETRY_BACKOFF_SECONDS
+        )
+        self.lease = lease or timedelta(seconds=settings.SMS_OUTBOX_LEASE_SECONDS)
+        self.client = client or get_sms_client()
+
+    def dispatch_batch(self) -> int:
+        """
+        Claim and send one batch of due messages.
+
+        Returns:
+        -------
+        int
+            The number of messages claimed.
+        """
+        messages = SMSOutboxModel.objects.claim_batch(self.batch_size, self.lease)
+        for index, message in enumerate(messages):
+            try:
+                self.client.send_pattern(
+                    message.recipient, message.pattern_code, message.variables
+                )
+            except SMSCircuitOpenError:
+                # the gateway is down, hand the rest of the batch back untouched
+                for pending_message in messages[index:]:
+                    pending_message.defer(self.backoff)
+                break
+            except SMSGatewayError as e:
+                logger.warning("SMS outbox message %s failed: %s", message.pk, e)
+                message.mark_failed(str(e), self.max_attempts, self.backoff)
+            else:
+                message.mark_sent()
+        return len(messages)
+
+    def close(self):
+        self.client.close()
@@ -0,0 +1,13 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from app_settings.models import SettingsModel
+from app_settings.services import SETTINGS_NAMESPACE
+
+from utils.cache import bump_namespaces_on_commit
+
+
+@receiver(post_save, sender=SettingsModel)
+@receiver(post_delete, sender=SettingsModel)
+def invalidate_settings_cache_handler(sender, **kwargs):
+    bump_namespaces_on_commit(SETTINGS_NAMESPACE)
@@ -9,8 +9,6 @@ from utils.db.models import AbstractSoftDeleteModel
 from utils.db.models.soft_delete import AbstractSoftDeleteManager
 from utils.exceptions.core import InvalidEmailOrPasswordError, ObjectNotFoundError
 
-from redis_management.redis_manager import RedisManager
-
 
 class UserEmailManager(models.Manager):
     """
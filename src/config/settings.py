@@ -45,6 +45,8 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    # Query count, database time and query budgets per request
+    "utils.middleware.QueryInstrumentationMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     # CORS headers
     "corsheaders.middleware.CorsMiddleware",
@@ -129,6 +131,46 @@ def get_default_database(default_database=config("DEFAULT_DATABASE_NAME", defaul
 
 DATABASES = {"default": get_default_database()}
 
+# Cache configuration
+REDIS_URL = config(
+    "REDIS_URL",
+    default="redis://{}:{}/{}".format(
+        config("REDIS_HOST", default="localhost"),
+        config("REDIS_PORT", default=6379, cast=int),
+        config("REDIS_DB", default=0, cast=int),
+    ),
+)
+REDIS_MAX_CONNECTIONS = config("REDIS_MAX_CONNECTIONS", default=50, cast=int)
+REDIS_SOCKET_TIMEOUT = config("REDIS_SOCKET_TIMEOUT", default=2, cast=float)
+USE_REDIS_CACHE = config("USE_REDIS_CACHE", default=False, cast=bool)
+CACHE_ALIASES = ("default", "otp", "ratelimit", "responses")
+
+
+def get_cache(alias):
+    """
+    Return the cache configuration of an alias: a Redis cache sharing one pooled
+    connection per process when USE_REDIS_CACHE is set, local memory otherwise.
+    """
+    if USE_REDIS_CACHE:
+        return {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+            "KEY_PREFIX": alias,
+            "OPTIONS": {
+                "max_connections": REDIS_MAX_CONNECTIONS,
+                "socket_timeout": REDIS_SOCKET_TIMEOUT,
+                "socket_connect_timeout": REDIS_SOCKET_TIMEOUT,
+                "health_check_interval": 30,
+            },
+        }
+    return {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": alias,
+    }
+
+
+CACHES = {alias: get_cache(alias) for alias in CACHE_ALIASES}
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -184,7 +226,19 @@ REST_FRAMEWORK = {
         "rest_framework.filters.SearchFilter",
         "rest_framework.filters.OrderingFilter",
     ],
+    # proxies in front of the app whose X-Forwarded-For entries are trusted,
+    # 0 keys client ips on REMOTE_ADDR only
+    "NUM_PROXIES": config("NUM_TRUSTED_PROXIES", default=0, cast=int),
+    "DEFAULT_THROTTLE_RATES": {
+        "send_otp_ip": config("OTP_SEND_RATE_PER_IP", default="20/hour"),
+        "send_otp_mobile": config("OTP_SEND_RATE_PER_MOBILE", default="5/hour"),
+        "slot_hold_ip": config("SLOT_HOLD_RATE_PER_IP", default="30/hour"),
+        "slot_hold_mobile": config("SLOT_HOLD_RATE_PER_MOBILE", default="10/hour"),
+    },
 }
+RATE_LIMIT_USE_REDIS = config(
+    "RATE_LIMIT_USE_REDIS", default=USE_REDIS_CACHE, cast=bool
+)
 
 # __django multi language settings__ #
 LOCALE_PATHS = [
@@ -194,6 +248,53 @@ LOCALE_PATHS = [
 MEDIANA_API_KEY = config("MEDIANA_API_KEY")
 SMS_SEND_CODE = config("SMS_SEND_CODE")
 SMS_SEND_INFO = config("SMS_SEND_INFO")
+SMS_GATEWAY_URL = config(
+    "SMS_GATEWAY_URL",
+    default="https://api2.ippanel.com/api/v1/sms/pattern/normal/send",
+)
+SMS_SENDER_NUMBER = config("SMS_SENDER_NUMBER", default="+983000505")
+SMS_BACKEND = config("SMS_BACKEND", default="utils.sms.backends.IPPanelBackend")
+SMS_GATEWAY_CONNECT_TIMEOUT = config(
+    "SMS_GATEWAY_CONNECT_TIMEOUT", default=3, cast=float
+)
+SMS_GATEWAY_TIMEOUT = config("SMS_GATEWAY_TIMEOUT", default=5, cast=float)
+SMS_GATEWAY_POOL_SIZE = config("SMS_GATEWAY_POOL_SIZE", default=10, cast=int)
+SMS_CIRCUIT_BREAKER_THRESHOLD = config(
+    "SMS_CIRCUIT_BREAKER_THRESHOLD", default=5, cast=int
+)
+SMS_CIRCUIT_BREAKER_RESET_SECONDS = config(
+    "SMS_CIRCUIT_BREAKER_RESET_SECONDS", default=30, cast=float
+)
+
+# SMS outbox dispatcher options
+SMS_OUTBOX_BATCH_SIZE = config("SMS_OUTBOX_BATCH_SIZE", default=50, cast=int)
+SMS_OUTBOX_MAX_ATTEMPTS = config("SMS_OUTBOX_MAX_ATTEMPTS", default=5, cast=int)
+SMS_OUTBOX_RETRY_BACKOFF_SECONDS = config(
+    "SMS_OUTBOX_RETRY_BACKOFF_SECONDS", default=30, cast=int
+)
+SMS_OUTBOX_LEASE_SECONDS = config("SMS_OUTBOX_LEASE_SECONDS", default=300, cast=int)
+
+# Reservation export options
+# rendered exports hold patient data: keep them outside MEDIA_ROOT, they are only
+# served through the authenticated download endpoint
+EXPORT_ROOT = config(
+    "EXPORT_ROOT", default=os.path.join(BASE_DIR, "private", "exports")
+)
+EXPORT_JOB_LEASE_SECONDS = config("EXPORT_JOB_LEASE_SECONDS", default=900, cast=int)
+EXPORT_FILE_TTL_SECONDS = config("EXPORT_FILE_TTL_SECONDS", default=86400, cast=int)
+
+# Reservation options
+SLOT_HOLD_TTL_SECONDS = config("SLOT_HOLD_TTL_SECONDS", default=300, cast=int)
+CALENDAR_MAX_DAYS = config("CALENDAR_MAX_DAYS", default=62, cast=int)
+SCHEDULE_MAX_DAYS = config("SCHEDULE_MAX_DAYS", default=366, cast=int)
+
+# Query instrumentation options
+# opt-in: every request pays for the recording while enabled
+QUERY_INSTRUMENTATION = config("QUERY_INSTRUMENTATION", default=False, cast=bool)
+QUERY_BUDGET_STRICT = config("QUERY_BUDGET_STRICT", default=False, cast=bool)
+
+# Response cache options
+RESPONSE_CACHE_ALIAS = config("RESPONSE_CACHE_ALIAS", default="responses")
 
 # Request API options
 CORS_ORIGIN_ALLOW_ALL = True
@@ -220,3 +321,4 @@ SIMPLE_JWT = {
 DATE_INPUT_FORMAT = "%Y-%m-%d"
 TIME_INPUT_FORMAT = "%H:%M:%S"
 MAXIMUM_COUNT_TRY_WRONG_OTP_CODE = 5
+OTP_CODE_TTL_SECONDS = config("OTP_CODE_TTL_SECONDS", default=300, cast=int)
@@ -56,12 +56,27 @@ class BaseErrors:
     invalid_email_or_password = _("Invalid Email Or Password.")
     old_password_is_incorrect = _("Old Password Is Incorrect.")
     invalid_otp_code = _("Invalid OTP Code, Please Try Again.")
+    too_many_wrong_otp_attempts = _(
+        "Too Many Wrong Attempts, Please Request A New OTP Code Later."
+    )
+    sms_service_unavailable = _(
+        "SMS Service Is Temporarily Unavailable, Please Try Again Later."
+    )
 
     # Utils db
     invalid_mobile_number_format = _("Invalid Mobile Number Format.")
     invalid_email_format = _("Invalid Email Format")
     unique_field = _("This Field Already Exists.")
+    conflict_with_existing_object = _("This Object Conflicts With An Existing One.")
+    slot_already_reserved = _("This Time Slot Is Already Reserved.")
+    slot_is_held = _("This Time Slot Is Being Reserved By Someone Else.")
 
     # Global errors
+    invalid_file_format = _("Invalid File Format.")
+    invalid_cursor = _("Invalid Cursor.")
+    date_to_before_date_from = _("End Date Can Not Be Before Start Date.")
+    calendar_range_too_long = _("Date Range Can Not Be Longer Than {max_days} Days.")
+    end_time_before_start_time = _("End Time Must Be After Start Time.")
+    invalid_jalali_date = _("Invalid Jalali Date, Use The YYYY/MM/DD Format.")
     parameter_is_required = _("parameter {param_name} is required.")
     object_not_found = _("{object} Not Found.")
@@ -0,0 +1,85 @@
+from contextlib import contextmanager
+from statistics import median
+
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test.utils import CaptureQueriesContext
+
+import math
+import time
+
+
+@contextmanager
+def isolated_database(using=DEFAULT_DB_ALIAS, verbosity=0):
+    """
+    Creates a throwaway test database (in-memory on SQLite) with all migrations
+    applied, and destroys it on exit, so benchmarks never touch real data.
+
+    Parameters:
+    ----------
+    using : str, optional
+        The database alias to isolate.
+    verbosity : int, optional
+        Verbosity passed to the test database creation.
+    """
+    connection = connections[using]
+    old_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(
+        verbosity=verbosity, autoclobber=True, serialize=False
+    )
+    try:
+        yield connection
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity)
+
+
+def measure(func, *args, repeat=1, using=DEFAULT_DB_ALIAS, **kwargs):
+    """
+    Runs a callable, recording the number of queries it issues and its latency.
+
+    Parameters:
+    ----------
+    func : callable
+        The callable to measure.
+    repeat : int, optional
+        How many times to run it; the reported latency is the median run.
+    using : str, optional
+        The database alias whose queries are counted.
+
+    Returns:
+    -------
+    dict
+        A dictionary with `queries`, `seconds` and the last `result`.
+    """
+    timings = []
+    result = None
+    queries = 0
+    for _ in range(repeat):
+        with CaptureQueriesContext(connections[using]) as context:
+            started = time.perf_counter()
+            result = func(*args, **kwargs)
+            timings.append(time.perf_counter() - started)
+        queries = len(context.captured_queries)
+    return {"queries": queries, "seconds": median(timings), "result": result}
+
+
+def percentile(values, pct: float) -> float:
+    """
+    Returns the nearest-rank percentile of a list of numbers.
+
+    Parameters:
+    ----------
+    values : list
+        The measured values.
+    pct : float
+        The percentile, between 0 and 100.
+
+    Returns:
+    -------
+    float
+        The value at the percentile, 0 for an empty list.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
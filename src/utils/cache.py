@@ -0,0 +1,77 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+
+import time
+
+NAMESPACE_KEY_PREFIX = "cache_namespace"
+
+
+def get_response_cache():
+    return caches[settings.RESPONSE_CACHE_ALIAS]
+
+
+def response_cache_enabled() -> bool:
+    """
+    Whether responses may be cached. Entries are invalidated by bumping namespace
+    versions stored in the cache itself, so the backend must be shared by every
+    process: with the per process local memory cache a change would only reach
+    the worker (or management command) that made it, and the other workers would
+    keep serving stale responses until the ttl runs out.
+
+    Returns:
+    -------
+    bool
+        False when `RESPONSE_CACHE_ALIAS` is a local memory cache.
+    """
+    return not isinstance(get_response_cache(), LocMemCache)
+
+
+def get_namespace_versions(names) -> list:
+    """
+    Returns the current version of each cache namespace with one cache round trip.
+    Entries cached under a namespace are keyed on its version, so bumping the
+    version invalidates all of them at once without deleting keys.
+
+    Parameters:
+    ----------
+    names : iterable
+        The namespace names, e.g. `doctors` or `doctor_slots:12`.
+
+    Returns:
+    -------
+    list
+        The versions, in the order of `names`.
+    """
+    keys = [f"{NAMESPACE_KEY_PREFIX}:{name}" for name in names]
+    versions = get_response_cache().get_many(keys)
+    return [versions.get(key, 0) for key in keys]
+
+
+def bump_namespaces(*names):
+    """
+    Invalidates everything cached under the given namespaces.
+
+    Parameters:
+    ----------
+    names : str
+        The namespace names to invalidate.
+    """
+    cache = get_response_cache()
+    for name in set(names):
+        key = f"{NAMESPACE_KEY_PREFIX}:{name}"
+        try:
+            cache.incr(key)
+        except ValueError:
+            # never bumped or evicted: a clock based version can not collide with
+            # one used before the eviction
+            cache.set(key, time.time_ns(), timeout=None)
+
+
+def bump_namespaces_on_commit(*names):
+    """
+    Invalidates the given namespaces once the current transaction commits, so a
+    concurrent request can not cache the pre-commit state under the new version.
+    """
+    transaction.on_commit(lambda: bump_namespaces(*names))
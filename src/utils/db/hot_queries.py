@@ -0,0 +1,34 @@
+from django.utils.module_loading import autodiscover_modules
+
+_registry = {}
+
+
+def register_hot_query(name: str):
+    """
+    Decorator registering a callable that returns the queryset of a hot query,
+    so its plan can be inspected with the `explain_hot_queries` command.
+
+    Parameters:
+    ----------
+    name : str
+        A unique, descriptive name of the query.
+    """
+
+    def decorator(func):
+        _registry[name] = func
+        return func
+
+    return decorator
+
+
+def get_hot_queries() -> dict:
+    """
+    Imports every installed app's `hot_queries` module and returns the registry.
+
+    Returns:
+    -------
+    dict
+        A mapping of query name to the callable building its queryset.
+    """
+    autodiscover_modules("hot_queries")
+    return dict(_registry)
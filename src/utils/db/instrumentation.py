@@ -0,0 +1,110 @@
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+
+from django.db import connections
+
+import re
+import time
+
+# IN lists and VALUES rows differ only in their number of placeholders
+IN_LIST_PATTERN = re.compile(r"\((?:\s*%s\s*,)+\s*%s\s*\)")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+class QueryBudgetExceeded(AssertionError):
+    """
+    Raised when a block or a view issues more queries than its budget.
+    """
+
+
+def fingerprint(sql: str) -> str:
+    """
+    Returns the shape of a query: parameters are already placeholders, IN lists
+    are collapsed, so the queries of an N+1 loop share one fingerprint.
+    """
+    return WHITESPACE_PATTERN.sub(" ", IN_LIST_PATTERN.sub("(...)", sql)).strip()
+
+
+class QueryRecorder:
+    """
+    Database execute wrapper recording the number, total time and fingerprints of
+    the queries run through it.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.fingerprints = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.seconds += time.perf_counter() - started
+            self.count += 1
+            self.fingerprints[fingerprint(sql)] += 1
+
+    @property
+    def duplicates(self) -> dict:
+        """
+        Returns the fingerprints run more than once with their number of runs.
+        """
+        return {sql: count for sql, count in self.fingerprints.items() if count > 1}
+
+    def as_dict(self) -> dict:
+        return {
+            "queries": self.count,
+            "db_ms": round(self.seconds * 1000, 3),
+            "duplicates": self.duplicates,
+        }
+
+
+@contextmanager
+def record_queries(using=None):
+    """
+    Records the queries issued inside the block on the given database aliases.
+
+    Parameters:
+    ----------
+    using : iterable, optional
+        The database aliases to record, all of them by default.
+
+    Yields:
+    ------
+    QueryRecorder
+        The recorder, complete once the block exits.
+    """
+    recorder = QueryRecorder()
+    with ExitStack() as stack:
+        for alias in using or connections:
+            stack.enter_context(connections[alias].execute_wrapper(recorder))
+        yield recorder
+
+
+@contextmanager
+def assert_max_queries(max_queries: int, allow_duplicates: bool = True, using=None):
+    """
+    Test helper failing when the block issues more than `max_queries` queries,
+    or any duplicate query when `allow_duplicates` is False.
+
+    Raises:
+    ------
+    QueryBudgetExceeded
+        With the query count and the duplicated fingerprints.
+    """
+    with record_queries(using) as recorder:
+        yield recorder
+    check_query_budget(recorder, max_queries, allow_duplicates)
+
+
+def check_query_budget(recorder, max_queries, allow_duplicates=True, label="block"):
+    duplicates = recorder.duplicates
+    if recorder.count > max_queries or (duplicates and not allow_duplicates):
+        details = "".join(
+            f"\n  {count}x {sql}" for sql, count in sorted(duplicates.items())
+        )
+        raise QueryBudgetExceeded(
+            f"{label} issued {recorder.count} queries, budget is {max_queries}"
+            f"{'; duplicates:' if details else ''}{details}"
+        )
@@ -1,8 +1,110 @@
 from django.db import models, transaction
+from django.dispatch import Signal
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django.conf import settings
 
+from functools import lru_cache
+
+# sent after a queryset soft delete (a bulk UPDATE, so post_save/post_delete never
+# fire) with `rows`, a lazy queryset of the rows that were soft deleted
+soft_deleted = Signal()
+
+
+@lru_cache(maxsize=None)
+def get_cascade_plan(model) -> tuple:
+    """
+    Resolves the CASCADE graph below a model, once per model class.
+
+    Soft delete dependents are walked recursively; other dependents are hard
+    deleted, like before, and their own cascades are left to Django. Cyclic and
+    self referencing relations are not followed.
+
+    Parameters:
+    ----------
+    model : Model class
+        The model whose rows are deleted.
+
+    Returns:
+    -------
+    tuple
+        `(related_model, lookup, through)` steps, deepest dependents first:
+        `lookup` is the relation path from `related_model` back to `model` and
+        `through` the paths of the soft delete models in between, which must not
+        be deleted already.
+    """
+    plan = []
+
+    def walk(parent, parent_lookup, parent_through, path):
+        for related_object in parent._meta.related_objects:
+            related_model = related_object.related_model
+            if (
+                related_object.on_delete != models.CASCADE
+                or related_object.many_to_many
+                or related_model in path
+            ):
+                continue
+            field_name = related_object.field.name
+            lookup = f"{field_name}__{parent_lookup}" if parent_lookup else field_name
+            through = tuple(f"{field_name}__{prefix}" for prefix in parent_through)
+            if parent_lookup:
+                through += (field_name,)
+            if issubclass(related_model, AbstractSoftDeleteModel):
+                walk(related_model, lookup, through, path | {related_model})
+            plan.append((related_model, lookup, through))
+
+    walk(model, None, (), frozenset({model}))
+    return tuple(plan)
+
+
+def _soft_delete_rows(model, rows, using, deleted_at) -> int:
+    """
+    Soft deletes the non-deleted rows of a queryset with one UPDATE, then sends
+    `soft_deleted` when it has listeners. The deleted rows are handed over as the
+    rows stamped with this `deleted_at` (indexed), so their keys are never
+    loaded here.
+    """
+    updated = rows.filter(is_deleted=False).update(
+        is_deleted=True, deleted_at=deleted_at
+    )
+    if updated and soft_deleted.has_listeners(model):
+        deleted_rows = model._base_manager.using(using).filter(
+            is_deleted=True, deleted_at=deleted_at
+        )
+        soft_deleted.send(sender=model, rows=deleted_rows, using=using)
+    return updated
+
+
+def cascade_soft_delete(model, selection, using, deleted_at=None):
+    """
+    Deletes the CASCADE dependents of a set of rows, one query per dependent
+    table (`UPDATE ... WHERE fk IN (<selection>)`), deepest tables first so every
+    step still sees its non-deleted ancestors. The selected rows themselves are
+    left to the caller.
+
+    Parameters:
+    ----------
+    model : Model class
+        The model of the selected rows.
+    selection : QuerySet or list
+        The primary keys of the rows being deleted (a `values("pk")` queryset is
+        used as a subquery).
+    using : str
+        The database alias.
+    deleted_at : datetime, optional
+        The deletion time stamped on soft deleted dependents.
+    """
+    deleted_at = deleted_at or timezone.now()
+    for related_model, lookup, through in get_cascade_plan(model):
+        dependents = related_model._base_manager.using(using).filter(
+            **{f"{lookup}__in": selection},
+            **{f"{prefix}__is_deleted": False for prefix in through},
+        )
+        if issubclass(related_model, AbstractSoftDeleteModel):
+            _soft_delete_rows(related_model, dependents, using, deleted_at)
+        else:
+            dependents.delete()
+
 
 class AbstractSoftDeleteQuerySet(models.QuerySet):
     """
@@ -12,16 +114,29 @@ class AbstractSoftDeleteQuerySet(models.QuerySet):
     def delete(self):
         """
         Override the delete method to perform a soft delete by setting is_deleted to True and updating deleted_at.
+        CASCADE dependents are deleted set wise in the same transaction.
 
         Returns:
         -------
         int
             The number of rows updated.
         """
-        return self.update(
-            is_deleted=True,
-            deleted_at=timezone.now(),
-        )
+        deleted_at = timezone.now()
+        plan = get_cascade_plan(self.model)
+        if not plan and not soft_deleted.has_listeners(self.model):
+            return self.filter(is_deleted=False).update(
+                is_deleted=True,
+                deleted_at=deleted_at,
+            )
+        with transaction.atomic(using=self.db):
+            if plan:
+                cascade_soft_delete(
+                    self.model,
+                    self.filter(is_deleted=False).values("pk"),
+                    self.db,
+                    deleted_at,
+                )
+            return _soft_delete_rows(self.model, self, self.db, deleted_at)
 
     def active(self):
         """
@@ -66,7 +181,7 @@ class AbstractSoftDeleteModel(models.Model):
         default=False, editable=False, verbose_name=_("Is Deleted")
     )
     deleted_at = models.DateTimeField(
-        null=True, blank=True, verbose_name=_("Deleted Time")
+        null=True, blank=True, db_index=True, verbose_name=_("Deleted Time")
     )
 
     objects = AbstractSoftDeleteManager()
@@ -86,20 +201,11 @@ class AbstractSoftDeleteModel(models.Model):
             f"{settings.DATE_INPUT_FORMAT} {settings.TIME_INPUT_FORMAT}"
         )
 
-    def delete_related_objects(self):
+    def delete_related_objects(self, deleted_at=None):
         """
-        Find and delete related objects that are set to cascade on delete.
+        Delete the objects related through CASCADE, one query per dependent table.
         """
-        for related_object in self._meta.related_objects:
-            # Check for CASCADE related fields
-            if related_object.on_delete == models.CASCADE:
-                related_name = related_object.get_accessor_name()
-                related_manager = getattr(self, related_name)
-                # Delete all related objects (cascading delete)
-                try:
-                    related_manager.all().delete()
-                except AttributeError:
-                    related_manager.delete()
+        cascade_soft_delete(type(self), [self.pk], self._state.db, deleted_at)
 
     @transaction.atomic
     def delete(self, using=None, keep_parents=False):
@@ -114,9 +220,10 @@ class AbstractSoftDeleteModel(models.Model):
         keep_parents : bool, optional
             Whether to keep parent model relationships. Defaults to False.
         """
-        self.delete_related_objects()  # Delete all CASCADE-related objects
-        self.is_deleted = True
         self.deleted_at = timezone.now()
+        # Delete all CASCADE-related objects
+        self.delete_related_objects(self.deleted_at)
+        self.is_deleted = True
         self.save()
 
     @transaction.atomic
@@ -0,0 +1,67 @@
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from typing import Callable
+import time
+
+
+def delete_expired_batch(
+    queryset: QuerySet, batch_size: int, field: str = "expires_at"
+) -> int:
+    """
+    Delete up to `batch_size` rows of the queryset whose `field` has passed,
+    oldest first. The primary keys are collected first and deleted by key, so
+    each batch is a short statement that never holds long locks on the table.
+
+    Parameters:
+    ----------
+    queryset : QuerySet
+        The rows to purge from.
+    batch_size : int
+        The maximum number of rows to delete.
+    field : str
+        The datetime field holding the expiry time.
+
+    Returns:
+    -------
+    int
+        The number of deleted rows.
+    """
+    expired_pks = list(
+        queryset.filter(**{f"{field}__lte": timezone.now()})
+        .order_by(field)
+        .values_list("pk", flat=True)[:batch_size]
+    )
+    if not expired_pks:
+        return 0
+    deleted, _ = queryset.model._base_manager.filter(pk__in=expired_pks).delete()
+    return deleted
+
+
+def delete_in_batches(
+    delete_batch: Callable[[int], int], batch_size: int, sleep: float = 0.0
+) -> int:
+    """
+    Call `delete_batch` until a batch deletes nothing, pausing `sleep` seconds
+    between batches to leave room for other writers.
+
+    Parameters:
+    ----------
+    delete_batch : Callable[[int], int]
+        Deletes up to the given number of rows and returns how many it deleted.
+    batch_size : int
+        The maximum number of rows deleted per batch.
+    sleep : float
+        The seconds to pause between batches.
+
+    Returns:
+    -------
+    int
+        The total number of deleted rows.
+    """
+    total = 0
+    while deleted := delete_batch(batch_size):
+        total += deleted
+        if sleep:
+            time.sleep(sleep)
+    return total
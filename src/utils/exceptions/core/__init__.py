@@ -15,3 +15,15 @@ class ObjectNotFoundError(Exception):
             "object_not_found", object=_(object_name)
         )
         super().__init__(self.message)
+
+
+class SMSGatewayError(Exception):
+    """Raised when the SMS gateway rejects a message or cannot be reached."""
+
+    pass
+
+
+class SMSCircuitOpenError(SMSGatewayError):
+    """Raised when calls are short-circuited because the gateway keeps failing."""
+
+    pass
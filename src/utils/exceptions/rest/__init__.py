@@ -21,6 +21,11 @@ class NotFoundObjectException(APIException):
         super().__init__(detail)
 
 
+class ConflictException(APIException):
+    status_code = 409
+    default_detail = BaseErrors.conflict_with_existing_object
+
+
 class ParameterRequiredException(APIException):
     status_code = 400
 
@@ -40,3 +45,8 @@ class OldPasswordIsIncorrectException(APIException):
         self, detail=BaseErrors.old_password_is_incorrect, field_name="old_password"
     ):
         super().__init__(detail={field_name: detail})
+
+
+class SMSServiceUnavailableException(APIException):
+    status_code = 503
+    default_detail = BaseErrors.sms_service_unavailable
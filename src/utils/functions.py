@@ -1,3 +1,5 @@
+from rest_framework.settings import api_settings
+
 import jdatetime
 import random
 import string
@@ -5,7 +7,10 @@ import string
 
 def get_client_ip(request):
     """
-    Extracts the real client IP address from the request, considering proxies and load balancers.
+    Extracts the client IP address from the request. X-Forwarded-For is only
+    trusted for the `NUM_PROXIES` proxies configured in front of the app, the
+    address the outermost trusted proxy saw is used; any entries left of it are
+    supplied by the client and ignored.
 
     Parameters:
     ----------
@@ -17,25 +22,27 @@ def get_client_ip(request):
     str
         The client IP address.
     """
+    remote_addr = request.META.get("REMOTE_ADDR", "").strip()
+    num_proxies = api_settings.NUM_PROXIES
     x_forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
-    if x_forwarded_for:
-        ip = x_forwarded_for.split(",")[0].strip()  # Take the first IP in the list
-    else:
-        ip = request.META.get("REMOTE_ADDR", "").strip()
-    return ip
+    if not num_proxies or not x_forwarded_for:
+        return remote_addr
+    addresses = [address.strip() for address in x_forwarded_for.split(",")]
+    return addresses[-min(num_proxies, len(addresses))]
 
 
 def get_jalali_day_of_week(jalali_date_str):
     year, month, day = map(int, jalali_date_str.split("/"))
     date = jdatetime.date(year, month, day)
+    # jdatetime weeks start on Saturday (weekday 0)
     days_of_week = [
+        "شنبه",
+        "یکشنبه",
         "دوشنبه",
         "سه‌شنبه",
         "چهارشنبه",
         "پنج‌شنبه",
         "جمعه",
-        "شنبه",
-        "یکشنبه",
     ]
     return days_of_week[date.weekday()]
 
@@ -0,0 +1,240 @@
+from utils.benchmark import percentile
+
+from urllib.parse import urlsplit
+import asyncio
+import json
+import time
+
+# upper bounds (ms) of the latency histogram buckets, the last one is open
+HISTOGRAM_BOUNDS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class AsyncHTTPClient:
+    """
+    Minimal HTTP/1.1 client on asyncio streams with one keep-alive connection,
+    enough to drive the JSON API from many coroutines without a third party
+    client. Use one instance per virtual user.
+    """
+
+    def __init__(self, base_url: str, timeout: float = 30):
+        parsed = urlsplit(base_url)
+        self.host = parsed.hostname
+        self.port = parsed.port or 80
+        self.prefix = parsed.path.rstrip("/")
+        self.timeout = timeout
+        self.reader = self.writer = None
+
+    async def request(self, method, path, data=None, headers=None) -> tuple:
+        """
+        Sends a request, reconnecting once when the kept-alive connection was
+        closed by the server.
+
+        Returns:
+        -------
+        tuple
+            `(status, decoded JSON body or None)`
+        """
+        for attempt in range(2):
+            if self.writer is None:
+                self.reader, self.writer = await asyncio.wait_for(
+                    asyncio.open_connection(self.host, self.port), self.timeout
+                )
+            try:
+                return await asyncio.wait_for(
+                    self._exchange(method, path, data, headers or {}), self.timeout
+                )
+            except (ConnectionError, asyncio.IncompleteReadError):
+                await self.close()
+                if attempt:
+                    raise
+
+    async def _exchange(self, method, path, data, headers):
+        body = b"" if data is None else json.dumps(data).encode()
+        lines = [
+            f"{method} {self.prefix}{path} HTTP/1.1",
+            f"Host: {self.host}:{self.port}",
+            "Accept: application/json",
+            "Connection: keep-alive",
+            f"Content-Length: {len(body)}",
+        ]
+        if data is not None:
+            lines.append("Content-Type: application/json")
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        self.writer.write(("\r\n".join(lines) + "\r\n\r\n").encode() + body)
+        await self.writer.drain()
+
+        status_line = await self.reader.readuntil(b"\r\n")
+        if not status_line.strip():
+            raise ConnectionError("connection closed by the server")
+        status = int(status_line.split()[1])
+        response_headers = {}
+        while (line := await self.reader.readuntil(b"\r\n")) != b"\r\n":
+            name, _, value = line.decode("latin-1").partition(":")
+            response_headers[name.strip().lower()] = value.strip()
+
+        if response_headers.get("transfer-encoding") == "chunked":
+            content = b""
+            while size := int((await self.reader.readuntil(b"\r\n")).strip(), 16):
+                content += await self.reader.readexactly(size)
+                await self.reader.readexactly(2)
+            await self.reader.readexactly(2)
+        elif "content-length" in response_headers:
+            content = await self.reader.readexactly(
+                int(response_headers["content-length"])
+            )
+        else:
+            content = await self.reader.read()
+            response_headers["connection"] = "close"
+
+        if response_headers.get("connection", "").lower() == "close":
+            await self.close()
+        try:
+            return status, json.loads(content) if content else None
+        except ValueError:
+            return status, None
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except ConnectionError:
+                pass
+        self.reader = self.writer = None
+
+
+class SMSStubServer:
+    """
+    Stand-in for the ippanel pattern API: accepts the JSON posted by
+    `IPPanelBackend`, records the OTP variable per recipient and answers 200
+    after `delay` seconds, emulating the gateway latency.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, delay=0.0):
+        self.host = host
+        self.port = port
+        self.delay = delay
+        self.messages = 0
+        self._codes = {}
+        self._waiters = {}
+        self._handlers = set()
+        self.server = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}/api/send"
+
+    async def start(self):
+        self.server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        if self.server is not None:
+            self.server.close()
+            # handlers of kept-alive gateway connections wait for a next request
+            for handler in self._handlers:
+                handler.cancel()
+            await asyncio.gather(*self._handlers, return_exceptions=True)
+            await self.server.wait_closed()
+
+    async def wait_for_code(self, recipient: str, timeout: float = 10) -> str:
+        """
+        Returns (and forgets) the OTP sent to a recipient, waiting for it.
+
+        Raises:
+        ------
+        asyncio.TimeoutError
+            If no code reaches the stub in time.
+        """
+        if recipient not in self._codes:
+            event = self._waiters.setdefault(recipient, asyncio.Event())
+            await asyncio.wait_for(event.wait(), timeout)
+        self._waiters.pop(recipient, None)
+        return self._codes.pop(recipient)
+
+    async def _handle(self, reader, writer):
+        self._handlers.add(asyncio.current_task())
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                length = 0
+                while (line := await reader.readline()) not in (b"\r\n", b""):
+                    name, _, value = line.decode("latin-1").partition(":")
+                    if name.strip().lower() == "content-length":
+                        length = int(value)
+                payload = json.loads(await reader.readexactly(length) or b"{}")
+                if self.delay:
+                    await asyncio.sleep(self.delay)
+                self._record(payload)
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    b"Content-Length: 2\r\n\r\n{}"
+                )
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        except asyncio.CancelledError:
+            # cancelled by stop(): end normally, the stream server logs
+            # handlers that finish cancelled
+            pass
+        finally:
+            self._handlers.discard(asyncio.current_task())
+            writer.close()
+
+    def _record(self, payload):
+        self.messages += 1
+        recipient = payload.get("recipient")
+        code = (payload.get("variable") or {}).get("OTP")
+        if recipient and code:
+            self._codes[recipient] = code
+            if recipient in self._waiters:
+                self._waiters[recipient].set()
+
+
+class StepStats:
+    """
+    Latency samples, status counts and errors of one load test step.
+    """
+
+    def __init__(self):
+        self.latencies_ms = []
+        self.statuses = {}
+        self.errors = {}
+
+    def record(self, started: float, status=None, error=None):
+        self.latencies_ms.append((time.perf_counter() - started) * 1000)
+        if status is not None:
+            self.statuses[status] = self.statuses.get(status, 0) + 1
+        if error is not None:
+            self.errors[error] = self.errors.get(error, 0) + 1
+
+    def histogram(self) -> dict:
+        buckets = {f"<={bound}ms": 0 for bound in HISTOGRAM_BOUNDS_MS}
+        buckets[f">{HISTOGRAM_BOUNDS_MS[-1]}ms"] = 0
+        for latency in self.latencies_ms:
+            for bound in HISTOGRAM_BOUNDS_MS:
+                if latency <= bound:
+                    buckets[f"<={bound}ms"] += 1
+                    break
+            else:
+                buckets[f">{HISTOGRAM_BOUNDS_MS[-1]}ms"] += 1
+        return buckets
+
+    def summary(self, seconds: float) -> dict:
+        count = len(self.latencies_ms)
+        failed = sum(self.errors.values()) + sum(
+            value for status, value in self.statuses.items() if status >= 400
+        )
+        return {
+            "requests": count,
+            "throughput_rps": round(count / seconds, 2) if seconds else 0.0,
+            "error_rate": round(failed / count, 4) if count else 0.0,
+            "statuses": {str(status): n for status, n in sorted(self.statuses.items())},
+            "errors": dict(sorted(self.errors.items())),
+            "p50_ms": round(percentile(self.latencies_ms, 50), 2),
+            "p95_ms": round(percentile(self.latencies_ms, 95), 2),
+            "p99_ms": round(percentile(self.latencies_ms, 99), 2),
+            "histogram": self.histogram(),
+        }
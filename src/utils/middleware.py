@@ -0,0 +1,73 @@
+from django.conf import settings
+
+from utils.db.instrumentation import (
+    QueryBudgetExceeded,
+    check_query_budget,
+    record_queries,
+)
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class QueryInstrumentationMiddleware:
+    """
+    Records the queries of each request when QUERY_INSTRUMENTATION is enabled:
+    query count and database time go out as a `Server-Timing` header and a
+    structured log record, duplicated query fingerprints are logged, and views
+    declaring a `query_budget` attribute are checked against it. Exceeding a
+    budget logs a warning, or raises QueryBudgetExceeded with QUERY_BUDGET_STRICT
+    (meant for test runs).
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not settings.QUERY_INSTRUMENTATION:
+            return self.get_response(request)
+        request.query_budget = None
+        request.view_name = None
+        with record_queries() as recorder:
+            response = self.get_response(request)
+        stats = recorder.as_dict()
+        response["Server-Timing"] = (
+            f'db;dur={stats["db_ms"]};'
+            f'desc="{stats["queries"]} queries, {len(stats["duplicates"])} duplicated"'
+        )
+        logger.info(
+            "%s %s: %s queries in %s ms",
+            request.method,
+            request.path,
+            stats["queries"],
+            stats["db_ms"],
+            extra={
+                "method": request.method,
+                "path": request.path,
+                "view": request.view_name,
+                "status": response.status_code,
+                "query_budget": request.query_budget,
+                **stats,
+            },
+        )
+        self.check_budget(request, recorder)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if not settings.QUERY_INSTRUMENTATION:
+            return None
+        view_class = getattr(view_func, "view_class", view_func)
+        request.view_name = f"{view_class.__module__}.{view_class.__qualname__}"
+        request.query_budget = getattr(view_class, "query_budget", None)
+        return None
+
+    def check_budget(self, request, recorder):
+        if request.query_budget is None:
+            return
+        try:
+            check_query_budget(recorder, request.query_budget, label=request.view_name)
+        except QueryBudgetExceeded as error:
+            if settings.QUERY_BUDGET_STRICT:
+                raise
+            logger.warning(str(error))
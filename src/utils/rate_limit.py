@@ -0,0 +1,198 @@
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+from utils.redis_client import get_redis_client
+
+from collections import defaultdict
+import logging
+import redis
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# token bucket refilled continuously; returns {allowed, milliseconds until a token}
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local bucket = redis.call("HMGET", KEYS[1], "tokens", "ts")
+local tokens = tonumber(bucket[1]) or capacity
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+redis.call("HSET", KEYS[1], "tokens", tostring(tokens), "ts", tostring(now))
+redis.call("PEXPIRE", KEYS[1], math.ceil(capacity / rate))
+if allowed == 1 then
+    return {1, 0}
+end
+return {0, math.ceil((1 - tokens) / rate)}
+"""
+
+
+class InMemoryTokenBucket:
+    """
+    Per-process token buckets, used when Redis is disabled or unreachable.
+    """
+
+    def __init__(self, max_keys: int = 100000):
+        self.max_keys = max_keys
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def hit(self, key: str, capacity: int, rate: float, now_ms: int):
+        with self._lock:
+            tokens, ts = self._buckets.get(key, (capacity, now_ms))
+            tokens = min(capacity, tokens + max(0, now_ms - ts) * rate)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            if key not in self._buckets and len(self._buckets) >= self.max_keys:
+                self._evict(now_ms)
+            self._buckets[key] = (tokens, now_ms)
+        return allowed, 0 if allowed else (1 - tokens) / rate
+
+    def _evict(self, now_ms: int):
+        # buckets idle for longer than a minute are almost always full again
+        for key, (tokens, ts) in list(self._buckets.items()):
+            if now_ms - ts > 60000:
+                del self._buckets[key]
+        if len(self._buckets) >= self.max_keys:
+            self._buckets.clear()
+
+
+class RedisTokenBucket:
+    """
+    Token buckets shared by every process, one script call per hit.
+    """
+
+    def __init__(self, client=None):
+        self.client = client or get_redis_client("ratelimit")
+        self._script = self.client.register_script(TOKEN_BUCKET_SCRIPT)
+
+    def hit(self, key: str, capacity: int, rate: float, now_ms: int):
+        allowed, wait_ms = self._script(
+            keys=[f"rate_limit:{key}"], args=[capacity, rate, now_ms]
+        )
+        return bool(allowed), int(wait_ms)
+
+
+class RateLimitMetrics:
+    """
+    Per-process counters of allowed and rejected hits, grouped by scope.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.allowed = defaultdict(int)
+        self.rejected = defaultdict(int)
+        self.fallbacks = 0
+
+    def record(self, scope: str, allowed: bool):
+        with self._lock:
+            (self.allowed if allowed else self.rejected)[scope] += 1
+
+    def record_fallback(self):
+        with self._lock:
+            self.fallbacks += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "allowed": dict(self.allowed),
+                "rejected": dict(self.rejected),
+                "fallbacks": self.fallbacks,
+            }
+
+
+class RateLimiter:
+    """
+    Token bucket rate limiter backed by Redis when `RATE_LIMIT_USE_REDIS` is set,
+    falling back to in-memory buckets while Redis is unreachable.
+    """
+
+    def __init__(self, redis_backend=None, memory_backend=None, retry_after=30.0):
+        self.redis_backend = redis_backend
+        self.memory_backend = memory_backend or InMemoryTokenBucket()
+        self.retry_after = retry_after
+        self.metrics = RateLimitMetrics()
+        self._redis_down_until = 0.0
+
+    def hit(self, scope: str, ident: str, limit: int, period: float):
+        """
+        Take a token from the bucket of `ident` in `scope`.
+
+        Parameters:
+        ----------
+        scope : str
+            The name of the limit, e.g. `otp_mobile`.
+        ident : str
+            The identity being limited, e.g. a mobile number or client IP.
+        limit : int
+            The bucket capacity, i.e. the allowed burst.
+        period : float
+            The seconds it takes to refill `limit` tokens.
+
+        Returns:
+        -------
+        tuple
+            Whether the hit is allowed and the seconds to wait otherwise.
+        """
+        key = f"{scope}:{ident}"
+        rate = limit / (period * 1000)
+        now_ms = int(time.time() * 1000)
+        allowed, wait_ms = self._hit(key, limit, rate, now_ms)
+        self.metrics.record(scope, allowed)
+        if not allowed:
+            logger.info("Rate limit %s exceeded by %s", scope, ident)
+        return allowed, wait_ms / 1000
+
+    def _hit(self, *args):
+        if (
+            self.redis_backend is not None
+            and time.monotonic() >= self._redis_down_until
+        ):
+            try:
+                return self.redis_backend.hit(*args)
+            except redis.RedisError:
+                logger.warning(
+                    "Redis is unreachable, rate limiting falls back to memory"
+                )
+                self.metrics.record_fallback()
+                self._redis_down_until = time.monotonic() + self.retry_after
+        return self.memory_backend.hit(*args)
+
+
+_limiter = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """
+    Returns the process wide rate limiter, so in-memory buckets and metrics are
+    shared by every caller.
+    """
+    global _limiter
+    if _limiter is None:
+        with _limiter_lock:
+            if _limiter is None:
+                _limiter = RateLimiter(
+                    RedisTokenBucket() if settings.RATE_LIMIT_USE_REDIS else None
+                )
+    return _limiter
+
+
+@receiver(setting_changed)
+def reset_rate_limiter(setting, **kwargs):
+    global _limiter
+    if setting.startswith("RATE_LIMIT_"):
+        with _limiter_lock:
+            _limiter = None
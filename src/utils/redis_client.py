@@ -0,0 +1,137 @@
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+import redis
+import threading
+import time
+import uuid
+from urllib.parse import urlsplit
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def _get_pool(alias: str) -> redis.ConnectionPool:
+    cache_settings = settings.CACHES[alias]
+    if cache_settings["BACKEND"].endswith("RedisCache"):
+        url = cache_settings["LOCATION"]
+        # client side options of the cache backend are not pool arguments
+        options = {
+            key: value
+            for key, value in cache_settings.get("OPTIONS", {}).items()
+            if key not in ("pool_class", "parser_class", "serializer")
+        }
+    else:
+        url, options = settings.REDIS_URL, {
+            "max_connections": settings.REDIS_MAX_CONNECTIONS,
+            "socket_timeout": settings.REDIS_SOCKET_TIMEOUT,
+            "socket_connect_timeout": settings.REDIS_SOCKET_TIMEOUT,
+        }
+    if url not in _pools:
+        with _pools_lock:
+            if url not in _pools:
+                _pools[url] = redis.ConnectionPool.from_url(url, **options)
+    return _pools[url]
+
+
+def get_redis_client(alias: str = DEFAULT_CACHE_ALIAS) -> redis.Redis:
+    """
+    Returns a Redis client for the features that need raw Redis commands (Lua
+    scripts, SET NX PX). Clients share one process wide connection pool per
+    Redis location, taken from the cache alias (or REDIS_URL when the alias is
+    not Redis backed), so callers never open ad hoc connections.
+
+    Parameters:
+    ----------
+    alias : str, optional
+        The cache alias whose Redis is used, e.g. `otp` or `ratelimit`.
+
+    Returns:
+    -------
+    redis.Redis
+        A client bound to a shared connection pool.
+    """
+    return redis.Redis(connection_pool=_get_pool(alias))
+
+
+def get_pool_stats() -> dict:
+    """
+    Returns the connection counters of the Redis pools opened by this process.
+
+    Returns:
+    -------
+    dict
+        Pool stats keyed by Redis location (password stripped).
+    """
+    return {
+        redact_url(url): {
+            "max_connections": pool.max_connections,
+            "created_connections": pool._created_connections,
+            "available_connections": len(pool._available_connections),
+            "in_use_connections": len(pool._in_use_connections),
+        }
+        for url, pool in list(_pools.items())
+    }
+
+
+def check_redis_health(alias: str = DEFAULT_CACHE_ALIAS) -> dict:
+    """
+    Pings the Redis of a cache alias through the shared pool.
+
+    Returns:
+    -------
+    dict
+        `{"healthy", "latency_ms"[, "error"]}`
+    """
+    result = {"healthy": False}
+    started = time.perf_counter()
+    try:
+        result["healthy"] = bool(get_redis_client(alias).ping())
+    except redis.RedisError as error:
+        result["error"] = str(error)
+    result["latency_ms"] = round((time.perf_counter() - started) * 1000, 3)
+    return result
+
+
+def redact_url(url: str) -> str:
+    parsed = urlsplit(url)
+    if parsed.password:
+        parsed = parsed._replace(netloc=parsed.netloc.replace(parsed.password, "***"))
+    return parsed.geturl()
+
+
+def check_cache_health() -> dict:
+    """
+    Round trips a probe key through every cache alias.
+
+    Returns:
+    -------
+    dict
+        Per alias `{"backend", "healthy", "latency_ms"[, "error"]}`.
+    """
+    results = {}
+    for alias in settings.CACHES:
+        cache = caches[alias]
+        key = f"health:{uuid.uuid4().hex}"
+        result = {"backend": type(cache).__name__, "healthy": False}
+        started = time.perf_counter()
+        try:
+            cache.set(key, 1, timeout=10)
+            result["healthy"] = cache.get(key) == 1
+            cache.delete(key)
+        except Exception as error:
+            result["error"] = str(error)
+        result["latency_ms"] = round((time.perf_counter() - started) * 1000, 3)
+        results[alias] = result
+    return results
+
+
+@receiver(setting_changed)
+def reset_redis_pools(setting, **kwargs):
+    if setting.startswith("REDIS_") or setting == "CACHES":
+        with _pools_lock:
+            for pool in _pools.values():
+                pool.disconnect()
+            _pools.clear()
@@ -1,8 +1,22 @@
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from django.db.models.query import ModelIterable
+
 from rest_framework import serializers
 
 from utils.functions import get_client_ip
 from utils.exceptions.rest import NotFoundObjectException
 
+from operator import itemgetter
+
+# DRF fields whose representation differs from the raw column value, most
+# specific first (DateTimeField is a DateField)
+VALUE_REPRESENTATIONS = (
+    (models.DateTimeField, serializers.DateTimeField),
+    (models.DateField, serializers.DateField),
+    (models.TimeField, serializers.TimeField),
+)
+
 
 class CustomSerializer(serializers.Serializer):
     """
@@ -143,3 +157,156 @@ class CustomModelSerializer(serializers.ModelSerializer):
             The client IP address, or None if request is not available.
         """
         return get_client_ip(self.request) if self.request else None
+
+
+class ValuesListSerializer(serializers.ListSerializer):
+    """
+    List serializer of `ValuesSerializer`, narrowing a queryset of model
+    instances to the child's columns before iterating it.
+    """
+
+    def to_representation(self, data):
+        if isinstance(data, models.manager.BaseManager):
+            data = data.all()
+        if isinstance(data, models.QuerySet) and data._iterable_class is ModelIterable:
+            data = self.child.values_queryset(data)
+        to_representation = self.child.to_representation
+        return [to_representation(row) for row in data]
+
+
+class ValuesSerializer(serializers.BaseSerializer):
+    """
+    A read-only serializer for list endpoints working on `values()` rows instead
+    of model instances, without the per field machinery of ModelSerializer.
+
+    `Meta.fields` are the output keys. `Meta.sources` maps a key to a lookup path
+    (e.g. `"doctor__name"`) or to a dict of nested keys and paths, other keys
+    read the column of the same name. The paths select the columns (and joins)
+    of the query. Date and time values are formatted like their DRF fields, and
+    a `get_<key>(row)` method computes a key from the row instead.
+    The extractors are compiled once per class.
+    """
+
+    _compiled = None
+
+    class Meta:
+        model = None
+        fields = ()
+        sources = {}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.extractors = [
+            (key, getattr(self, f"get_{key}") if extractor is None else extractor)
+            for key, extractor in self.get_compiled()[1]
+        ]
+
+    @classmethod
+    def many_init(cls, *args, **kwargs):
+        # subclasses declare their own Meta, so the list class is not read from it
+        list_kwargs = {
+            key: value
+            for key, value in kwargs.items()
+            if key in serializers.LIST_SERIALIZER_KWARGS
+        }
+        return ValuesListSerializer(*args, child=cls(*args, **kwargs), **list_kwargs)
+
+    @classmethod
+    def get_compiled(cls) -> tuple:
+        """
+        Returns the value paths to select and the `(key, extractor)` pairs of the
+        serializer, where the extractor is None for `get_<key>` methods.
+        """
+        if cls.__dict__.get("_compiled") is None:
+            model = cls.Meta.model
+            sources = getattr(cls.Meta, "sources", {})
+            paths = []
+
+            def column(path):
+                paths.append(path)
+                field = cls.resolve_field(model, path)
+                representation = next(
+                    (
+                        drf_field().to_representation
+                        for model_field, drf_field in VALUE_REPRESENTATIONS
+                        if isinstance(field, model_field)
+                    ),
+                    None,
+                )
+                if representation is None:
+                    return itemgetter(path)
+
+                def extract(row):
+                    value = row[path]
+                    return None if value is None else representation(value)
+
+                return extract
+
+            def nested(extractors):
+                return lambda row: {key: extract(row) for key, extract in extractors}
+
+            extractors = []
+            for key in cls.Meta.fields:
+                source = sources.get(key, key)
+                if isinstance(source, dict):
+                    extractor = nested(
+                        [(name, column(path)) for name, path in source.items()]
+                    )
+                elif hasattr(cls, f"get_{key}"):
+                    paths.append(source)
+                    extractor = None
+                else:
+                    extractor = column(source)
+                extractors.append((key, extractor))
+            cls._compiled = (tuple(dict.fromkeys(paths)), extractors)
+        return cls._compiled
+
+    @staticmethod
+    def resolve_field(model, path):
+        """
+        Returns the model field a lookup path ends on, or None for annotations.
+        """
+        field = None
+        for name in path.split("__"):
+            if model is None:
+                return None
+            try:
+                field = model._meta.get_field(name)
+            except FieldDoesNotExist:
+                return None
+            model = field.related_model
+        return field
+
+    @classmethod
+    def values_queryset(cls, queryset):
+        """
+        Narrows a queryset to the serializer's value paths, plus its ordering
+        columns and primary key so keyset cursors can be built from the rows.
+
+        Parameters:
+        ----------
+        queryset : QuerySet
+            The (filtered) queryset of model instances.
+
+        Returns:
+        -------
+        QuerySet
+            A `values()` queryset yielding dict rows.
+        """
+        meta = queryset.model._meta
+        ordering = queryset.query.order_by
+        if not ordering and queryset.query.default_ordering:
+            ordering = meta.ordering
+        ordering_paths = [
+            field.lstrip("-")
+            for field in ordering
+            if isinstance(field, str) and field != "?"
+        ]
+        paths = [
+            meta.pk.name if path == "pk" else path
+            for path in (*cls.get_compiled()[0], *ordering_paths, "pk")
+        ]
+        return queryset.values(*dict.fromkeys(paths))
+
+    def to_representation(self, row):
+        return {key: extract(row) for key, extract in self.extractors}
@@ -0,0 +1 @@
+from .client import SMSGatewayClient, get_sms_client
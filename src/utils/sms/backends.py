@@ -0,0 +1,80 @@
+from django.conf import settings
+
+from utils.exceptions.core import SMSGatewayError
+
+from requests.adapters import HTTPAdapter
+import requests
+
+
+class BaseSMSBackend:
+    """
+    Base class for SMS backends. Backends deliver a single pattern message and
+    raise `SMSGatewayError` on failure.
+    """
+
+    def send_pattern(self, recipient: str, pattern_code: str, variables: dict):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class IPPanelBackend(BaseSMSBackend):
+    """
+    Sends pattern messages through the ippanel HTTP API over a persistent,
+    keep-alive connection pool.
+    """
+
+    def __init__(self):
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=settings.SMS_GATEWAY_POOL_SIZE,
+            max_retries=0,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update(
+            {"Content-Type": "application/json", "apikey": settings.MEDIANA_API_KEY}
+        )
+        self.timeout = (
+            settings.SMS_GATEWAY_CONNECT_TIMEOUT,
+            settings.SMS_GATEWAY_TIMEOUT,
+        )
+
+    def send_pattern(self, recipient: str, pattern_code: str, variables: dict):
+        try:
+            response = self.session.post(
+                settings.SMS_GATEWAY_URL,
+                json={
+                    "code": pattern_code,
+                    "sender": settings.SMS_SENDER_NUMBER,
+                    "recipient": recipient,
+                    "variable": variables,
+                },
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+        except requests.RequestException as e:
+            raise SMSGatewayError(str(e)) from e
+
+    def close(self):
+        self.session.close()
+
+
+class FakeBackend(BaseSMSBackend):
+    """
+    In-memory backend for tests and local runs. Sent messages are collected in
+    the class level `outbox` list instead of being delivered.
+    """
+
+    outbox = []
+
+    def send_pattern(self, recipient: str, pattern_code: str, variables: dict):
+        self.outbox.append(
+            {
+                "recipient": recipient,
+                "pattern_code": pattern_code,
+                "variables": variables,
+            }
+        )
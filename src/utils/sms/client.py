@@ -0,0 +1,176 @@
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+from utils.exceptions.core import SMSGatewayError, SMSCircuitOpenError
+
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """
+    Opens after `threshold` consecutive failures and rejects calls until
+    `reset_timeout` seconds have passed, then lets one trial call through.
+    """
+
+    def __init__(self, threshold: int, reset_timeout: float):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None
+
+    def before_call(self):
+        with self._lock:
+            if self.opened_at is None:
+                return
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                raise SMSCircuitOpenError("SMS gateway circuit is open.")
+            # half-open: allow a single trial call and re-open on its failure
+            self.opened_at = None
+            self.failures = self.threshold - 1
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.failures >= self.threshold:
+                self.opened_at = time.monotonic()
+
+
+class CallMetrics:
+    """
+    Per-process counters and latency statistics of gateway calls.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.calls = 0
+        self.failures = 0
+        self.rejected = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def record(self, seconds: float, success: bool):
+        with self._lock:
+            self.calls += 1
+            self.failures += 0 if success else 1
+            self.total_seconds += seconds
+            self.max_seconds = max(self.max_seconds, seconds)
+
+    def record_rejected(self):
+        with self._lock:
+            self.rejected += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "failures": self.failures,
+                "rejected": self.rejected,
+                "avg_seconds": self.total_seconds / self.calls if self.calls else 0.0,
+                "max_seconds": self.max_seconds,
+            }
+
+
+class SMSGatewayClient:
+    """
+    Single entry point for sending SMS messages. Wraps the configured backend with
+    a circuit breaker and records per-call latency metrics.
+    """
+
+    def __init__(self, backend, breaker=None):
+        self.backend = backend
+        self.breaker = breaker or CircuitBreaker(
+            settings.SMS_CIRCUIT_BREAKER_THRESHOLD,
+            settings.SMS_CIRCUIT_BREAKER_RESET_SECONDS,
+        )
+        self.metrics = CallMetrics()
+
+    def send_pattern(self, recipient: str, pattern_code: str, variables: dict):
+        """
+        Send a pattern message.
+
+        Parameters:
+        ----------
+        recipient : str
+            The mobile number of the recipient.
+        pattern_code : str
+            The gateway pattern code of the message.
+        variables : dict
+            The pattern variables.
+
+        Raises:
+        ------
+        SMSCircuitOpenError
+            If the circuit is open and the call was not attempted.
+        SMSGatewayError
+            If the gateway failed to accept the message.
+        """
+        try:
+            self.breaker.before_call()
+        except SMSCircuitOpenError:
+            self.metrics.record_rejected()
+            raise
+        started = time.perf_counter()
+        try:
+            self.backend.send_pattern(recipient, pattern_code, variables)
+        except SMSGatewayError:
+            elapsed = time.perf_counter() - started
+            self.metrics.record(elapsed, success=False)
+            self.breaker.record_failure()
+            logger.warning("SMS gateway call failed after %.3fs", elapsed)
+            raise
+        elapsed = time.perf_counter() - started
+        self.metrics.record(elapsed, success=True)
+        self.breaker.record_success()
+        logger.debug("SMS gateway call took %.3fs", elapsed)
+
+    def send_otp(self, recipient: str, otp_code: str):
+        self.send_pattern(recipient, settings.SMS_SEND_CODE, {"OTP": otp_code})
+
+    def close(self):
+        self.backend.close()
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_sms_client() -> SMSGatewayClient:
+    """
+    Returns the process wide SMS client, built from `settings.SMS_BACKEND` on
+    first use so its connection pool is shared by every caller.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = SMSGatewayClient(import_string(settings.SMS_BACKEND)())
+    return _client
+
+
+@receiver(setting_changed)
+def reset_sms_client(setting, **kwargs):
+    global _client
+    if setting.startswith("SMS_") or setting == "MEDIANA_API_KEY":
+        with _client_lock:
+            if _client is not None:
+                _client.close()
+            _client = None
@@ -1,9 +1,25 @@
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Max
 from django.shortcuts import get_object_or_404
 from django.http import Http404
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
 
-from rest_framework import generics, status, response
+from rest_framework import generics, status, response, serializers
 
-from utils.exceptions.rest import NotFoundObjectException, ParameterRequiredException
+from utils.cache import (
+    get_namespace_versions,
+    get_response_cache,
+    response_cache_enabled,
+)
+from utils.exceptions.rest import (
+    ConflictException,
+    NotFoundObjectException,
+    ParameterRequiredException,
+)
+
+import hashlib
 
 
 class BaseAPIView:
@@ -59,23 +75,227 @@ class BaseAPIView:
             raise NotFoundObjectException(object_name=self.object_name)
 
 
+class ConflictOnIntegrityErrorMixin:
+    """
+    Saves inside a savepoint and turns database integrity errors (e.g. unique
+    constraint violations) into 409 responses, so views can rely on database
+    constraints instead of validate-then-insert round trips.
+    """
+
+    conflict_detail = None
+
+    def perform_create(self, serializer):
+        try:
+            with transaction.atomic():
+                super().perform_create(serializer)
+        except IntegrityError:
+            raise ConflictException(self.conflict_detail)
+
+    def perform_update(self, serializer):
+        try:
+            with transaction.atomic():
+                super().perform_update(serializer)
+        except IntegrityError:
+            raise ConflictException(self.conflict_detail)
+
+
+class ConditionalGetMixin:
+    """
+    Answers GET requests with ETag/Last-Modified validators computed from the
+    filtered queryset (max `updated_at` plus count), returns 304 without
+    serializing when the client copy is still fresh, and sets `Cache-Control`.
+    Meant for list views: the validators and the listing share one filtered
+    queryset per request.
+    """
+
+    cache_control = {"public": True, "max_age": 60}
+    last_modified_field = "updated_at"
+    filtered_queryset = None
+
+    def filter_queryset(self, queryset):
+        # filtersets may query while validating (e.g. the ModelChoiceFilter
+        # lookup of `?doctor=`), so the queryset is only filtered once
+        if self.filtered_queryset is None:
+            self.filtered_queryset = super().filter_queryset(queryset)
+        return self.filtered_queryset.all()
+
+    def get_conditional_querysets(self, queryset):
+        """
+        Returns the querysets whose changes invalidate the response. Views whose
+        representation depends on other tables (e.g. reservations) add them here.
+
+        Parameters:
+        ----------
+        queryset : QuerySet
+            The filtered queryset of the view.
+
+        Returns:
+        -------
+        list
+            The querysets aggregated into the validators.
+        """
+        return [queryset]
+
+    def get_conditional_validators(self):
+        """
+        Computes the validators of the current request with one aggregate query
+        per conditional queryset.
+
+        Returns:
+        -------
+        tuple
+            The ETag string and the Last-Modified timestamp (or None).
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        request = self.request
+        parts = [
+            request.get_full_path(),
+            request.META.get("HTTP_ACCEPT", ""),
+            getattr(request, "LANGUAGE_CODE", ""),
+        ]
+        last_modified = None
+        for conditional_queryset in self.get_conditional_querysets(queryset):
+            state = (
+                conditional_queryset.order_by()
+                .values(self.last_modified_field)
+                .aggregate(
+                    last_modified=Max(self.last_modified_field), count=Count("*")
+                )
+            )
+            parts.append(f"{state['last_modified']}:{state['count']}")
+            if state["last_modified"] is not None:
+                last_modified = max(
+                    filter(None, [last_modified, state["last_modified"]])
+                )
+        etag = hashlib.md5("|".join(parts).encode(), usedforsecurity=False).hexdigest()
+        # HTTP dates have a one second resolution
+        return etag, int(last_modified.timestamp()) if last_modified else None
+
+    def get(self, request, *args, **kwargs):
+        etag, last_modified = self.get_conditional_validators()
+        response = get_conditional_response(
+            request, etag=quote_etag(etag), last_modified=last_modified
+        )
+        if response is None:
+            response = super().get(request, *args, **kwargs)
+        response["ETag"] = quote_etag(etag)
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified)
+        patch_cache_control(response, **self.cache_control)
+        return response
+
+
+class ResponseCacheMixin:
+    """
+    Caches rendered GET responses for `response_cache_ttl` seconds, keyed on the
+    path, query params, API version and the versions of the view's cache
+    namespaces. Model signals bump the namespaces to invalidate cached entries.
+    Nothing is cached unless the response cache is shared between processes,
+    see `response_cache_enabled`. Place it before `ConditionalGetMixin` so cache hits skip the validator queries.
+    """
+
+    response_cache_ttl = None
+    response_cache_namespaces = ()
+    cached_headers = ("Content-Type", "ETag", "Last-Modified", "Cache-Control", "Vary")
+
+    def get_response_cache_namespaces(self):
+        return list(self.response_cache_namespaces)
+
+    def get_response_cache_key(self):
+        request = self.request
+        namespaces = self.get_response_cache_namespaces()
+        parts = [
+            request.get_full_path(),
+            request.META.get("HTTP_ACCEPT", ""),
+            getattr(request, "LANGUAGE_CODE", ""),
+            str(request.version),
+            *namespaces,
+            *map(str, get_namespace_versions(namespaces)),
+        ]
+        digest = hashlib.md5("|".join(parts).encode(), usedforsecurity=False)
+        return f"response:{type(self).__name__}:{digest.hexdigest()}"
+
+    def get(self, request, *args, **kwargs):
+        self.response_cache_key = None
+        if self.response_cache_ttl is None or not response_cache_enabled():
+            return super().get(request, *args, **kwargs)
+        self.response_cache_key = self.get_response_cache_key()
+        cached = get_response_cache().get(self.response_cache_key)
+        if cached is None:
+            return super().get(request, *args, **kwargs)
+        self.response_cache_key = None
+        content, headers = cached
+        response = get_conditional_response(request, etag=headers.get("ETag"))
+        if response is None:
+            response = HttpResponse(content)
+        for header, value in headers.items():
+            # a 304 carries the validators and caching headers but no body
+            if response.status_code != 304 or header != "Content-Type":
+                response[header] = value
+        return response
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if getattr(self, "response_cache_key", None) and response.status_code == 200:
+            response.render()
+            headers = {
+                header: response[header]
+                for header in self.cached_headers
+                if header in response
+            }
+            get_response_cache().set(
+                self.response_cache_key,
+                (response.content, headers),
+                self.response_cache_ttl,
+            )
+        return response
+
+
+class ValuesListMixin:
+    """
+    Lists with `values_serializer_class` (a ValuesSerializer): the filtered
+    queryset is narrowed to the serializer's columns before pagination, so pages
+    are fetched as dict rows, with the joins the serializer's paths need, and no
+    model instances are built. Other methods keep using `serializer_class`.
+    """
+
+    values_serializer_class = None
+
+    def list(self, request, *args, **kwargs):
+        serializer_class = self.values_serializer_class
+        queryset = serializer_class.values_queryset(
+            self.filter_queryset(self.get_queryset())
+        )
+        context = self.get_serializer_context()
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = serializer_class(page, many=True, context=context)
+            return self.get_paginated_response(serializer.data)
+        serializer = serializer_class(queryset, many=True, context=context)
+        return response.Response(serializer.data)
+
+
 class CustomListAPIView(generics.ListAPIView):
     """
     Custom view for listing objects.
     """
 
-    pass
+    # maximum queries per request, checked by QueryInstrumentationMiddleware
+    query_budget = None
 
 
-class CustomListCreateAPIView(generics.ListCreateAPIView):
+class CustomListCreateAPIView(
+    ConflictOnIntegrityErrorMixin, generics.ListCreateAPIView
+):
     """
     Custom view for listing and creating objects.
     """
 
-    pass
+    # maximum queries per request, checked by QueryInstrumentationMiddleware
+    query_budget = None
 
 
-class CustomCreateAPIView(generics.CreateAPIView):
+class CustomCreateAPIView(ConflictOnIntegrityErrorMixin, generics.CreateAPIView):
     """
     Custom view for creating an object.
     """
@@ -91,7 +311,9 @@ class CustomRetrieveAPIView(BaseAPIView, generics.RetrieveAPIView):
     pass
 
 
-class CustomRetrieveUpdateAPIView(BaseAPIView, generics.RetrieveUpdateAPIView):
+class CustomRetrieveUpdateAPIView(
+    ConflictOnIntegrityErrorMixin, BaseAPIView, generics.RetrieveUpdateAPIView
+):
     """
     Custom view for retrieving and updating a single object.
     """
@@ -108,7 +330,7 @@ class CustomRetrieveDestroyAPIView(BaseAPIView, generics.RetrieveDestroyAPIView)
 
 
 class CustomRetrieveUpdateDestroyAPIView(
-    BaseAPIView, generics.RetrieveUpdateDestroyAPIView
+    ConflictOnIntegrityErrorMixin, BaseAPIView, generics.RetrieveUpdateDestroyAPIView
 ):
     """
     Custom view for retrieving, updating, and deleting a single object.
@@ -117,7 +339,9 @@ class CustomRetrieveUpdateDestroyAPIView(
     http_method_names = ["get", "patch", "delete", "head", "options"]
 
 
-class CustomUpdateAPIView(BaseAPIView, generics.UpdateAPIView):
+class CustomUpdateAPIView(
+    ConflictOnIntegrityErrorMixin, BaseAPIView, generics.UpdateAPIView
+):
     """
     Custom view for updating a single object.
     """
@@ -145,7 +369,9 @@ class CustomDestroyAPIView(BaseAPIView, generics.DestroyAPIView):
         instance.delete()
 
 
-class CustomUpdateDestroyAPIView(BaseAPIView, generics.RetrieveUpdateDestroyAPIView):
+class CustomUpdateDestroyAPIView(
+    ConflictOnIntegrityErrorMixin, BaseAPIView, generics.RetrieveUpdateDestroyAPIView
+):
     """
     Custom view for updating and deleting a single object.
     """
@@ -167,6 +393,101 @@ class CustomUpdateDestroyAPIView(BaseAPIView, generics.RetrieveUpdateDestroyAPIV
         instance.delete()
 
 
+class CustomBulkUpdateDestroyAPIView(generics.GenericAPIView):
+    """
+    Custom view for updating and deleting a set of objects, selected by an `ids`
+    list in the body or by the filterset query parameters, each with a single
+    set based query. Responses report the number of affected rows.
+    """
+
+    http_method_names = ["patch", "delete", "head", "options"]
+
+    def get_bulk_queryset(self):
+        """
+        Returns the objects selected by the request.
+
+        Raises:
+        ------
+        ParameterRequiredException
+            If neither `ids` nor a filter is given, so a request can never
+            select the whole table by accident.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        ids = (
+            self.request.data.get("ids") if hasattr(self.request.data, "get") else None
+        )
+        if ids is not None:
+            ids_field = serializers.ListField(
+                child=serializers.IntegerField(), allow_empty=False
+            )
+            try:
+                ids = ids_field.run_validation(ids)
+            except serializers.ValidationError as error:
+                raise serializers.ValidationError({"ids": error.detail})
+            return queryset.filter(pk__in=ids)
+        filterset_class = getattr(self, "filterset_class", None)
+        if filterset_class is None:
+            raise ParameterRequiredException(["ids"])
+        filterset = filterset_class(
+            self.request.query_params, queryset=queryset, request=self.request
+        )
+        # the filter backend already rejected invalid filters
+        if not filterset.is_valid() or not any(
+            value not in (None, "", [])
+            for value in filterset.form.cleaned_data.values()
+        ):
+            raise ParameterRequiredException(
+                ["ids", *self.get_filter_param_names(filterset)]
+            )
+        return queryset
+
+    @staticmethod
+    def get_filter_param_names(filterset):
+        """
+        Returns the query parameters a filterset reads, e.g. `date_after` and
+        `date_before` for a range filter named `date`.
+        """
+        names = []
+        for name, field in filterset.form.fields.items():
+            suffixes = getattr(field.widget, "suffixes", None) or [None]
+            names += [f"{name}_{suffix}" if suffix else name for suffix in suffixes]
+        return names
+
+    def perform_bulk_update(self, queryset, validated_data):
+        return queryset.update(**validated_data)
+
+    def perform_bulk_destroy(self, queryset):
+        return queryset.delete()
+
+    def patch(self, request, *args, **kwargs):
+        """
+        Handle PATCH request to update the selected objects.
+
+        Returns:
+        -------
+        Response
+            `{"updated": <number of rows>}`
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        updated = self.perform_bulk_update(
+            self.get_bulk_queryset(), serializer.validated_data
+        )
+        return response.Response({"updated": updated}, status=status.HTTP_200_OK)
+
+    def delete(self, request, *args, **kwargs):
+        """
+        Handle DELETE request to (soft) delete the selected objects.
+
+        Returns:
+        -------
+        Response
+            `{"deleted": <number of rows>}`
+        """
+        deleted = self.perform_bulk_destroy(self.get_bulk_queryset())
+        return response.Response({"deleted": deleted}, status=status.HTTP_200_OK)
+
+
 class CustomGenericAPIView(generics.GenericAPIView):
     """
     Base class for custom generic views.
@@ -1,5 +1,22 @@
+from django.core.exceptions import (
+    FieldDoesNotExist,
+    ImproperlyConfigured,
+    ValidationError,
+)
+from django.core.paginator import Paginator
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db.models import Q
+
 from rest_framework import pagination
+from rest_framework.exceptions import NotFound
 from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from utils.base_errors import BaseErrors
+
+import base64
+import json
 
 
 class BasePagination(pagination.PageNumberPagination):
@@ -34,6 +51,15 @@ class BasePagination(pagination.PageNumberPagination):
         self.response_items = {"count_all": self._count}
         return super().paginate_queryset(queryset, request, view)
 
+    def django_paginator_class(self, object_list, per_page):
+        """
+        Builds the page paginator with the count taken in `paginate_queryset`, so
+        the paginator does not run a second COUNT query.
+        """
+        paginator = Paginator(object_list, per_page)
+        paginator.count = self._count
+        return paginator
+
     def get_paginated_response(self, data):
         """
         Return a paginated response with additional metadata.
@@ -51,3 +77,255 @@ class BasePagination(pagination.PageNumberPagination):
         response = {"total_pages": self.page.paginator.num_pages, "results": data}
         response.update(self.response_items)
         return Response(response)
+
+
+class KeysetPagination(BasePagination):
+    """
+    Pagination class that seeks over the queryset ordering with an opaque cursor
+    instead of an OFFSET, so deep pages cost the same as the first one.
+
+    Keyset mode is enabled per request by sending the `cursor` query parameter
+    (empty for the first page); without it the page-number behaviour of
+    `BasePagination` is kept. The ordering fields must not be nullable, the
+    primary key is appended as a tie-breaker when missing.
+
+    The `count` query parameter selects how `count_all` is reported in keyset
+    mode: `exact` (COUNT query), `estimate` (planner estimate on PostgreSQL,
+    exact elsewhere) or `none` (omitted, the default).
+    """
+
+    cursor_query_param = "cursor"
+    count_query_param = "count"
+    count_mode = "none"
+    count_modes = ("exact", "estimate", "none")
+    invalid_cursor_message = BaseErrors.invalid_cursor
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        Paginate the queryset by page number, or by keyset when a cursor is given.
+
+        Parameters:
+        ----------
+        queryset : QuerySet
+            The queryset to paginate.
+        request : Request
+            The HTTP request object.
+        view : View, optional
+            The view that is calling this method (default is None).
+
+        Returns:
+        -------
+        list
+            The objects of the requested page.
+        """
+        self.keyset_mode = self.cursor_query_param in request.query_params
+        if not self.keyset_mode:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        self.display_page_controls = False
+        self.ordering = self.get_ordering(queryset)
+        self.pk_name = queryset.model._meta.pk.name
+        self.response_items = self.get_count_items(queryset, request)
+
+        cursor = self.decode_cursor(request)
+        if cursor is not None:
+            cursor = self.coerce_cursor(queryset.model, cursor)
+            queryset = queryset.filter(self.get_seek_filter(cursor))
+        page_size = self.get_page_size(request)
+        results = list(
+            queryset.order_by(
+                *[f"-{field}" if desc else field for field, desc in self.ordering]
+            )[: page_size + 1]
+        )
+        self.next_cursor = None
+        if len(results) > page_size:
+            results = results[:page_size]
+            self.next_cursor = self.encode_cursor(results[-1])
+        return results
+
+    def get_paginated_response(self, data):
+        """
+        Return a paginated response, with a `next` link instead of `total_pages`
+        in keyset mode.
+
+        Parameters:
+        ----------
+        data : list
+            The data to include in the response.
+
+        Returns:
+        -------
+        Response
+            A Response object containing the paginated data and additional metadata.
+        """
+        if not self.keyset_mode:
+            return super().get_paginated_response(data)
+        response = {"next": self.get_next_link(), "results": data}
+        response.update(self.response_items)
+        return Response(response)
+
+    def get_next_link(self):
+        if not self.keyset_mode:
+            return super().get_next_link()
+        if self.next_cursor is None:
+            return None
+        return replace_query_param(
+            self.request.build_absolute_uri(),
+            self.cursor_query_param,
+            self.next_cursor,
+        )
+
+    def get_ordering(self, queryset):
+        """
+        Returns the queryset ordering as (field, descending) pairs, with the
+        primary key appended as a unique tie-breaker.
+        """
+        order_by = list(queryset.query.order_by)
+        if not order_by and queryset.query.default_ordering:
+            order_by = list(queryset.model._meta.ordering)
+        ordering = []
+        for field in order_by:
+            if not isinstance(field, str):
+                raise ImproperlyConfigured(
+                    "KeysetPagination only supports orderings by field names."
+                )
+            ordering.append((field.lstrip("-"), field.startswith("-")))
+        if not {"pk", queryset.model._meta.pk.name} & {f for f, _ in ordering}:
+            ordering.append(("pk", False))
+        return ordering
+
+    def get_seek_filter(self, cursor):
+        """
+        Builds the row-value comparison `(f1, f2, ...) > (v1, v2, ...)` expanded
+        into OR-ed terms, with a leading range on the first field for index use.
+        """
+        if len(cursor) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        seek_filter = Q()
+        for index, (field, desc) in enumerate(self.ordering):
+            term = Q(**{f"{field}__{'lt' if desc else 'gt'}": cursor[index]})
+            for previous_index, (previous_field, _) in enumerate(self.ordering[:index]):
+                term &= Q(**{previous_field: cursor[previous_index]})
+            seek_filter |= term
+        first_field, first_desc = self.ordering[0]
+        first_bound = Q(
+            **{f"{first_field}__{'lte' if first_desc else 'gte'}": cursor[0]}
+        )
+        return first_bound & seek_filter
+
+    def encode_cursor(self, instance):
+        values = []
+        for field, _ in self.ordering:
+            if isinstance(instance, dict):
+                # `values()` rows are keyed by lookup path and the pk by its name
+                values.append(instance[self.pk_name if field == "pk" else field])
+                continue
+            value = instance
+            for attr in field.split("__"):
+                value = getattr(value, attr)
+            values.append(value)
+        payload = json.dumps(values, cls=DjangoJSONEncoder, separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            values = json.loads(base64.urlsafe_b64decode(encoded.encode()).decode())
+        except (TypeError, ValueError, UnicodeDecodeError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(values, list):
+            raise NotFound(self.invalid_cursor_message)
+        return values
+
+    def coerce_cursor(self, model, cursor):
+        """
+        Converts the decoded cursor values with their ordering fields, so a
+        tampered cursor is rejected as invalid instead of failing in the query.
+
+        Parameters:
+        ----------
+        model : Model
+            The model of the paginated queryset.
+        cursor : list
+            The decoded cursor values.
+
+        Returns:
+        -------
+        list
+            The values converted to the python types of their fields.
+
+        Raises:
+        ------
+        NotFound
+            If a value does not fit its field.
+        """
+        if len(cursor) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        values = []
+        for (field, _), value in zip(self.ordering, cursor):
+            model_field = resolve_ordering_field(model, field)
+            try:
+                if value is None or isinstance(value, (list, dict)):
+                    raise ValueError(value)
+                if model_field is not None:
+                    value = model_field.to_python(value)
+            except (ValidationError, TypeError, ValueError):
+                raise NotFound(self.invalid_cursor_message)
+            values.append(value)
+        return values
+
+    def get_count_items(self, queryset, request):
+        count_mode = request.query_params.get(self.count_query_param, self.count_mode)
+        if count_mode not in self.count_modes or count_mode == "none":
+            return {}
+        if count_mode == "estimate":
+            return {"count_all": estimate_count(queryset), "count_is_estimate": True}
+        return {"count_all": queryset.count()}
+
+
+def resolve_ordering_field(model, path):
+    """
+    Returns the model field an ordering path (`pk`, `date`, `doctor__name`) ends
+    on, or None when it is not a concrete field (e.g. an annotation).
+    """
+    field = None
+    for name in path.split("__"):
+        if model is None:
+            return None
+        try:
+            field = model._meta.pk if name == "pk" else model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return None
+        model = field.related_model
+    # a relation orders by the target's primary key
+    return getattr(field, "target_field", None) if field.is_relation else field
+
+
+def estimate_count(queryset):
+    """
+    Returns the planner's row estimate for the queryset on PostgreSQL, avoiding a
+    full COUNT over large tables, and an exact count on other databases.
+
+    Parameters:
+    ----------
+    queryset : QuerySet
+        The queryset to count.
+
+    Returns:
+    -------
+    int
+        The (estimated) number of rows.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return queryset.count()
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
@@ -0,0 +1,49 @@
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle, SimpleRateThrottle
+
+from utils.functions import get_client_ip
+from utils.rate_limit import get_rate_limiter
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    Throttle backed by the shared token bucket rate limiter. The rate is read from
+    `DEFAULT_THROTTLE_RATES["<view.throttle_scope>_<ident_name>"]`, so one view
+    can be limited on several identities with different rates.
+    """
+
+    ident_name = None
+
+    def get_ident_value(self, request):
+        raise NotImplementedError("subclasses must return the identity to limit")
+
+    def allow_request(self, request, view):
+        self.wait_seconds = None
+        ident = self.get_ident_value(request)
+        if not ident:
+            return True
+        scope = f"{view.throttle_scope}_{self.ident_name}"
+        limit, period = SimpleRateThrottle.parse_rate(
+            self, api_settings.DEFAULT_THROTTLE_RATES[scope]
+        )
+        allowed, self.wait_seconds = get_rate_limiter().hit(scope, ident, limit, period)
+        return allowed
+
+    def wait(self):
+        return self.wait_seconds
+
+
+class ClientIPRateThrottle(TokenBucketThrottle):
+    ident_name = "ip"
+
+    def get_ident_value(self, request):
+        return get_client_ip(request)
+
+
+class MobileNumberRateThrottle(TokenBucketThrottle):
+    ident_name = "mobile"
+
+    def get_ident_value(self, request):
+        data = request.data
+        mobile_number = data.get("mobile_number") if hasattr(data, "get") else None
+        return str(mobile_number).strip() if mobile_number else None